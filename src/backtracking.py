@@ -1,39 +1,41 @@
+from array import array
+import heapq
 import random
-import networkx as nx
-import matplotlib.pyplot as plt
 import time
 import tracemalloc
+from collections import OrderedDict
+from typing import NamedTuple
+from .csr import CSRGraph
+from .generator import random_graph_edges, resolve_rng
+from .guloso import dsatur_coloring
+from . import metrics
 
-colors = ["red", "green", "blue", "yellow", "purple", "orange", "pink", "brown", "gray", "cyan"]
+# Maior grafo que `exact_coloring` entrega ao motor de `subset_dp`: cada array
+# indexado por subconjunto tem 2^n posições (pico de ~300 MB com n = 22)
+SUBSET_DP_MAX_VERTICES = 22
+# Orçamento de nós da busca antes do motor: 2^(n - SUBSET_DP_BUDGET_SHIFT)
+SUBSET_DP_BUDGET_SHIFT = 5
 
-class UnionFind:
-    def __init__(self, size: int):
-        self.parent = list(range(size))
-        self.rank = [0] * size
+# Maior tabela de Zobrist (vértices x cores) alocada pelas buscas; acima
+# disso elas rodam sem nogoods
+NOGOOD_MAX_KEYS = 1 << 22
 
-    def find(self, u: int) -> int:
-        if self.parent[u] != u:
-            self.parent[u] = self.find(self.parent[u])
-        return self.parent[u]
+colors = ["red", "green", "blue", "yellow", "purple", "orange", "pink", "brown", "gray", "cyan"]
 
-    def union(self, u: int, v: int) -> bool:
-        u_root = self.find(u)
-        v_root = self.find(v)
-        if u_root == v_root:
-            return False
-        if self.rank[u_root] < self.rank[v_root]:
-            self.parent[u_root] = v_root
-        else:
-            self.parent[v_root] = u_root
-            if self.rank[u_root] == self.rank[v_root]:
-                self.rank[u_root] += 1
-        return True
+_MST_NAMES = ("UnionFind", "kruskal", "build_mst_adjacency_list")
+
+def __getattr__(name: str):
+    # MST (NumPy) carregada apenas no primeiro uso
+    if name in _MST_NAMES:
+        from . import mst
+        return getattr(mst, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 class Graph:
     def __init__(self):
         self._vertices = []
         self._edges = []
-        self._adjacency_list = {}
+        self._adjacency_list = None
 
     def get_vertices(self) -> list:
         return self._vertices
@@ -42,49 +44,17 @@ class Graph:
         return self._edges
 
     def get_adjacency_list(self) -> dict:
-        return self._adjacency_list
-
-    def generate_graph(self, num_vertices: int, density: float):
-        self._vertices = list(range(num_vertices))
-        self._edges = []
-        self._adjacency_list = {i: [] for i in range(num_vertices)}
-
-        vertices = list(range(num_vertices))
-        random.shuffle(vertices)
-        for i in range(1, num_vertices):
-            u = vertices[i]
-            v = vertices[random.randint(0, i - 1)]
-            w = random.randint(1, 15)
-            self._edges.append((u, v, w))
-            self._adjacency_list[u].append((v, w))
-            self._adjacency_list[v].append((u, w))
-
-        possible_edges = [(i, j) for i in range(num_vertices) for j in range(i + 1, num_vertices)]
-        used_edges = {(min(u, v), max(u, v)) for u, v, _ in self._edges}
-
-        for u, v in possible_edges:
-            if (u, v) not in used_edges and random.random() < density:
-                w = random.randint(1, 15)
-                self._edges.append((u, v, w))
+        if self._adjacency_list is None:
+            self._adjacency_list = {v: [] for v in self._vertices}
+            for u, v, w in self._edges:
                 self._adjacency_list[u].append((v, w))
                 self._adjacency_list[v].append((u, w))
+        return self._adjacency_list
 
-def kruskal(graph: Graph) -> list:
-    num_vertices = len(graph.get_vertices())
-    edges = sorted(graph.get_edges(), key=lambda x: x[2])
-    uf = UnionFind(num_vertices)
-    mst = []
-    for u, v, w in edges:
-        if uf.union(u, v):
-            mst.append((u, v, w))
-    return mst
-
-def build_mst_adjacency_list(mst: list, num_vertices: int) -> dict:
-    adj_list = {i: [] for i in range(num_vertices)}
-    for u, v, _ in mst:
-        adj_list[u].append(v)
-        adj_list[v].append(u)
-    return adj_list
+    def generate_graph(self, num_vertices: int, density: float, seed=None):
+        self._vertices = list(range(num_vertices))
+        self._edges = list(random_graph_edges(num_vertices, density, seed))
+        self._adjacency_list = None
 
 def is_safe(vertex, color, assignment, adjacency_list):
     for neighbor in adjacency_list[vertex]:
@@ -92,42 +62,538 @@ def is_safe(vertex, color, assignment, adjacency_list):
             return False
     return True
 
-def backtracking_coloring(adjacency_list: dict, max_colors: int) -> list:
+class NogoodTable:
+    """
+    Tabela limitada de estados parciais que já falharam (nogoods).
+
+    As chaves são tuplas pequenas com um hash de Zobrist do estado; quando a
+    tabela passa da capacidade, os estados usados há mais tempo saem primeiro
+    (LRU). A capacidade vem de `max_entries` ou do teto de memória `max_bytes`.
+    """
+
+    # Custo aproximado de uma entrada (tupla de chave + slot do dicionário)
+    ENTRY_BYTES = 256
+
+    def __init__(self, max_entries: int = None, max_bytes: int = 16 << 20):
+        self.capacity = max_bytes // self.ENTRY_BYTES if max_entries is None else max_entries
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key) -> bool:
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True
+        return False
+
+    def add(self, key):
+        if self.capacity <= 0:
+            return
+        self._entries[key] = None
+        if len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+def zobrist_table(size: int) -> array:
+    """Números aleatórios de 64 bits (semente fixa) para os hashes de Zobrist das buscas."""
+    return array("Q", random.Random(0x5EED).randbytes(8 * size))
+
+
+def _forbidden_key(zobrist: array, mask: int, vertex: int, num_vertices: int) -> int:
+    """Parcela das cores proibidas (`mask`) de um vértice sem cor no hash do estado."""
+    key = 0
+    while mask:
+        bit = mask & -mask
+        key ^= zobrist[(bit.bit_length() - 1) * num_vertices + vertex]
+        mask ^= bit
+    return key
+
+
+def _state_hash(zobrist: array, assignment: list, forbidden: list, colored_offset: int) -> int:
+    """
+    Hash de Zobrist do subproblema: `zobrist[c * n + v]` marca a cor `c`
+    proibida ao vértice `v` sem cor e `zobrist[colored_offset + v]`, `v` colorido.
+    """
+    num_vertices = len(assignment)
+    state_hash = 0
+    for v in range(num_vertices):
+        if assignment[v] == -1:
+            state_hash ^= _forbidden_key(zobrist, forbidden[v], v, num_vertices)
+        else:
+            state_hash ^= zobrist[colored_offset + v]
+    return state_hash
+
+
+def backtracking_coloring(adjacency_list: dict, max_colors: int, nogood_max_bytes: int = 16 << 20) -> list:
+    """
+    Backtracking em ordem fixa de vértices, com quebra de simetria e nogoods.
+
+    Cores são intercambiáveis, então o vértice `v` só pode abrir uma cor nova
+    além das já usadas (0 .. usadas): cada coloração é explorada uma única vez,
+    e não em todas as permutações de cores. A primeira coloração encontrada é
+    a mesma da busca sem quebra de simetria.
+
+    O resultado de `backtrack(v)` depende apenas de `v`, do número de cores
+    usadas e das cores proibidas a cada vértice ainda não colorido. Esse
+    estado é resumido por um hash de Zobrist (um número aleatório por par
+    vértice/cor proibida, combinados por XOR e atualizados em O(grau) a cada
+    atribuição); estados que falharam vão para uma `NogoodTable` limitada a
+    `nogood_max_bytes` e são podados de imediato quando reaparecem.
+    """
     num_vertices = len(adjacency_list)
     assignment = [-1] * num_vertices
+    # counts[w * max_colors + c]: vizinhos anteriores de w já coloridos com c
+    counts = [0] * (num_vertices * max_colors)
+    zobrist = zobrist_table(num_vertices * max_colors)
+    vertex_hash = [0] * num_vertices
+    later = [[w for w in adjacency_list[v] if w > v] for v in range(num_vertices)]
+    nogoods = NogoodTable(max_bytes=nogood_max_bytes)
+    state_hash = 0
+    stats = metrics.current()
 
-    def backtrack(v):
+    def backtrack(v, used):
+        nonlocal state_hash
+        if stats is not None:
+            stats.expand(v)
         if v == num_vertices:
             return True
-        for color in range(max_colors):
-            if is_safe(v, color, assignment, adjacency_list):
-                assignment[v] = color
-                if backtrack(v + 1):
-                    return True
-                assignment[v] = -1
+        key = (v, used, state_hash)
+        if key in nogoods:
+            if stats is not None:
+                stats.backtracks += 1
+            return False
+        own_hash = vertex_hash[v]
+        state_hash ^= own_hash  # `v` deixa o restante do problema
+        base = v * max_colors
+        for color in range(min(max_colors, used + 1)):
+            if stats is not None:
+                stats.is_safe_calls += 1
+            if counts[base + color]:
+                continue
+            assignment[v] = color
+            if stats is not None:
+                stats.colors_tried += 1
+            for w in later[v]:
+                index = w * max_colors + color
+                if not counts[index]:
+                    vertex_hash[w] ^= zobrist[index]
+                    state_hash ^= zobrist[index]
+                counts[index] += 1
+            if backtrack(v + 1, max(used, color + 1)):
+                return True
+            for w in later[v]:
+                index = w * max_colors + color
+                counts[index] -= 1
+                if not counts[index]:
+                    vertex_hash[w] ^= zobrist[index]
+                    state_hash ^= zobrist[index]
+            assignment[v] = -1
+        state_hash ^= own_hash
+        nogoods.add(key)
+        if stats is not None:
+            stats.backtracks += 1
         return False
 
-    for m in range(1, len(colors) + 1):
-        if backtrack(0):
-            return [colors[c] for c in assignment]
+    if backtrack(0, 0):
+        return [colors[c] for c in assignment]
     return None  # Falha ao encontrar coloração
 
+def bitset_backtracking_coloring(adjacency_list, max_colors: int, precolored=None,
+                                 nogood_max_bytes: int = 16 << 20) -> list:
+    """
+    Backtracking com verificação adiante (forward checking) sobre máscaras de bits.
+
+    Cada vértice guarda a máscara das cores já usadas por vizinhos coloridos,
+    atualizada incrementalmente ao atribuir e desfeita ao retroceder. O ramo é
+    podado assim que algum vizinho não colorido fica sem cores disponíveis, e o
+    próximo vértice é sempre o de menor domínio restante (desempate pelo grau).
+    Como em `backtracking_coloring`, cada vértice só pode abrir uma cor nova
+    além das já usadas, o que elimina as permutações de cores equivalentes.
+    A busca usa uma pilha explícita, então o tamanho do grafo não é limitado
+    pela pilha do Python.
+
+    O subproblema de um quadro depende só do conjunto de vértices coloridos,
+    das cores proibidas aos demais e do número de cores usadas. Um hash de
+    Zobrist desse estado, mantido a cada atribuição, vai para uma
+    `NogoodTable` de até `nogood_max_bytes` (0 desliga) quando o quadro se
+    esgota; o mesmo estado, alcançado por outro caminho, é podado sem ser
+    expandido.
+
+    `precolored` fixa previamente cores de alguns vértices ({vértice: cor}), por
+    exemplo as de uma clique. Retorna a lista de cores inteiras
+    (0 .. max_colors - 1) ou None se não houver coloração com `max_colors` cores.
+    """
+    num_vertices = len(adjacency_list)
+    assignment = [-1] * num_vertices
+    forbidden = [0] * num_vertices
+    degrees = [len(adjacency_list[v]) for v in range(num_vertices)]
+    full_mask = (1 << max_colors) - 1
+    uncolored = set(range(num_vertices))
+    stats = metrics.current()
+
+    if num_vertices and max_colors <= 0:
+        return None
+    for vertex, color in (precolored or {}).items():
+        bit = 1 << color
+        if color >= max_colors or forbidden[vertex] & bit:
+            return None
+        assignment[vertex] = color
+        uncolored.remove(vertex)
+        for neighbor in adjacency_list[vertex]:
+            forbidden[neighbor] |= bit
+    if any(forbidden[v] == full_mask for v in uncolored):
+        return None
+    if not uncolored:
+        return assignment
+
+    # Tabela de Zobrist (ver `_state_hash`); sem ela a busca roda sem nogoods
+    colored_offset = max_colors * num_vertices
+    zobrist = None
+    state_hash = 0
+    if nogood_max_bytes > 0 and colored_offset <= NOGOOD_MAX_KEYS:
+        zobrist = zobrist_table(colored_offset + num_vertices)
+        state_hash = _state_hash(zobrist, assignment, forbidden, colored_offset)
+    nogoods = NogoodTable(max_bytes=nogood_max_bytes)
+
+    def push(used):
+        nonlocal state_hash
+        if zobrist is not None and (used, state_hash) in nogoods:
+            if stats is not None:
+                stats.backtracks += 1
+            return
+        if stats is not None:
+            stats.expand(num_vertices - len(uncolored))
+        # Menor domínio restante = maior número de cores proibidas
+        vertex = max(uncolored, key=lambda v: (forbidden[v].bit_count(), degrees[v]))
+        uncolored.remove(vertex)
+        # Quebra de simetria: no máximo uma cor nova (a de índice `used`)
+        available = full_mask & ~forbidden[vertex] & ((2 << used) - 1)
+        key_hash = state_hash
+        if zobrist is not None:
+            state_hash ^= (_forbidden_key(zobrist, forbidden[vertex], vertex, num_vertices)
+                           ^ zobrist[colored_offset + vertex])
+        stack.append([vertex, available, 0, None, used, key_hash, state_hash])
+
+    # Pilha explícita, sem limite de recursão. Cada quadro: [vértice, cores ainda
+    # não tentadas, bit da cor atual, vizinhos alterados, cores usadas, hash do
+    # estado antes e depois de escolher o vértice]. Ao desfazer uma cor o hash
+    # volta ao valor guardado, sem percorrer os vizinhos.
+    stack = []
+    push(max((precolored or {}).values(), default=-1) + 1)
+    while stack:
+        frame = stack[-1]
+        vertex, available, bit, changed, used, key_hash, state_hash = frame
+        if bit:
+            for neighbor in changed:
+                forbidden[neighbor] ^= bit
+            assignment[vertex] = -1
+            frame[2] = 0
+        if not available:
+            stack.pop()
+            uncolored.add(vertex)
+            state_hash = key_hash
+            if zobrist is not None:
+                nogoods.add((used, key_hash))
+            if stats is not None:
+                stats.backtracks += 1
+            continue
+        bit = available & -available
+        frame[1] = available ^ bit
+        frame[2] = bit
+        color = assignment[vertex] = bit.bit_length() - 1
+        if stats is not None:
+            stats.colors_tried += 1
+        changed = frame[3] = []
+        feasible = True
+        offset = color * num_vertices
+        for neighbor in adjacency_list[vertex]:
+            if assignment[neighbor] == -1 and not forbidden[neighbor] & bit:
+                forbidden[neighbor] |= bit
+                changed.append(neighbor)
+                if zobrist is not None:
+                    state_hash ^= zobrist[offset + neighbor]
+                if forbidden[neighbor] == full_mask:
+                    feasible = False
+                    break
+        if not feasible:
+            continue
+        if not uncolored:
+            return assignment
+        push(max(used, color + 1))
+    return None
+
+def greedy_clique(adjacency_list) -> list:
+    """
+    Clique máxima heurística: a partir de cada vértice, acrescenta gulosamente
+    vizinhos comuns em ordem decrescente de grau. Retorna a maior clique achada.
+    """
+    num_vertices = len(adjacency_list)
+    adjacency_masks = [0] * num_vertices
+    for v in range(num_vertices):
+        mask = 0
+        for neighbor in adjacency_list[v]:
+            mask |= 1 << neighbor
+        adjacency_masks[v] = mask
+    order = sorted(range(num_vertices), key=lambda v: len(adjacency_list[v]), reverse=True)
+
+    best = []
+    for start in order:
+        if len(adjacency_list[start]) < len(best):
+            break  # Nenhuma clique com este vértice supera a melhor
+        clique = [start]
+        candidates = adjacency_masks[start]
+        for v in sorted(adjacency_list[start], key=lambda u: len(adjacency_list[u]), reverse=True):
+            if candidates >> v & 1:
+                clique.append(v)
+                candidates &= adjacency_masks[v]
+        if len(clique) > len(best):
+            best = clique
+    return best
+
+def exact_coloring(adjacency_list) -> tuple:
+    """
+    Calcula o número cromático por branch-and-bound.
+
+    O limite superior vem do DSatur e o inferior de uma clique heurística,
+    cujos vértices recebem cores fixas. A busca tenta k = limite superior - 1,
+    k - 2, ... e para assim que os limites se encontram.
+
+    Em grafos com até `SUBSET_DP_MAX_VERTICES` vértices a busca recebe um
+    orçamento de nós da ordem do custo do motor de inclusão–exclusão de
+    `subset_dp` (2^(n - SUBSET_DP_BUDGET_SHIFT)); se não terminar, o motor,
+    cujo tempo depende só de n, resolve o grafo. Assim o pior caso fica em
+    cerca de duas vezes o tempo do motor, sem perder a busca rápida nos
+    casos comuns.
+
+    Retorna a tupla (número cromático, lista de cores inteiras).
+    """
+    num_vertices = len(adjacency_list)
+    if num_vertices <= SUBSET_DP_MAX_VERTICES:
+        result = anytime_coloring(adjacency_list, node_budget=1 << max(num_vertices - SUBSET_DP_BUDGET_SHIFT, 10))
+        if result.optimal:
+            return result.num_colors, result.coloring
+        # Importação local: o motor carrega o NumPy, que o núcleo evita ao ser importado
+        from .subset_dp import subset_dp_coloring
+        return subset_dp_coloring(adjacency_list, result.lower_bound)
+
+    best, upper = dsatur_coloring(adjacency_list)
+    clique = greedy_clique(adjacency_list)
+    lower = len(clique)
+    precolored = {v: color for color, v in enumerate(clique)}
+
+    while upper > lower:
+        coloring = bitset_backtracking_coloring(adjacency_list, upper - 1, precolored)
+        if coloring is None:
+            break  # Provado: não há coloração com upper - 1 cores
+        best, upper = coloring, max(coloring) + 1
+    return upper, best
+
+class SearchResult(NamedTuple):
+    """Resultado de uma busca exata com orçamento."""
+    num_colors: int
+    coloring: list
+    optimal: bool
+    nodes: int
+    lower_bound: int
+
+def anytime_coloring(adjacency_list, node_budget: int = None, time_limit: float = None,
+                     seed=None, should_stop=None, on_solution=None, external_bound=None,
+                     nogood_max_bytes: int = 16 << 20) -> SearchResult:
+    """
+    Branch-and-bound iterativo (pilha explícita) com orçamento de nós e de tempo.
+
+    Começa com a coloração do DSatur e procura colorações com menos cores,
+    guardando sempre a melhor coloração completa encontrada. Quando o orçamento
+    de nós ou o prazo (`time_limit`, em segundos) se esgota, devolve essa melhor
+    coloração com `optimal=False`; se a busca termina ou alcança o limite
+    inferior da clique, `optimal=True`. Não há recursão, então o tamanho do
+    grafo não é limitado pela pilha do Python.
+
+    Como em `bitset_backtracking_coloring`, cada vértice abre no máximo uma cor
+    nova e os estados esgotados (hash de Zobrist dos vértices coloridos e das
+    cores proibidas aos demais, junto do limite de cores em vigor) vão para uma
+    `NogoodTable` de até `nogood_max_bytes` (0 desliga); um estado que
+    reaparece é podado sem ser expandido.
+
+    Ganchos opcionais, usados pelo portfólio paralelo: `seed` troca o desempate
+    por grau por uma ordem aleatória; `should_stop()` cancela a busca;
+    `on_solution(k, cores)` é chamado a cada melhoria; `external_bound()`
+    informa o melhor número de cores achado por outros processos, que passa a
+    limitar a busca. `should_stop` e `external_bound` são consultados antes da
+    busca, a cada melhoria e a cada 1024 nós. `lower_bound` no resultado é o
+    limite inferior provado.
+    """
+    deadline = time.perf_counter() + time_limit if time_limit is not None else None
+    num_vertices = len(adjacency_list)
+    best, best_k = dsatur_coloring(adjacency_list)
+    if on_solution is not None:
+        on_solution(best_k, best)
+    clique = greedy_clique(adjacency_list)
+    lower = len(clique)
+    if best_k <= lower:
+        return SearchResult(best_k, best, True, 0, lower)
+    # Ganchos consultados já antes da busca: a solução do DSatur pode bastar
+    # ao chamador e o limite externo pode cair abaixo da clique
+    limit_k = best_k if external_bound is None else min(best_k, external_bound())
+    if limit_k <= lower or (should_stop is not None and should_stop()):
+        return SearchResult(best_k, best, False, 0, lower)
+
+    assignment = [-1] * num_vertices
+    forbidden = [0] * num_vertices
+    if seed is None:
+        tiebreak = [-len(adjacency_list[v]) for v in range(num_vertices)]
+    else:
+        tiebreak = resolve_rng(seed).sample(range(num_vertices), num_vertices)
+    uncolored = set(range(num_vertices))
+    for color, vertex in enumerate(clique):
+        assignment[vertex] = color
+        uncolored.remove(vertex)
+        for neighbor in adjacency_list[vertex]:
+            forbidden[neighbor] |= 1 << color
+
+    # Heap com remoção preguiçosa: (-cores proibidas, desempate, vértice)
+    heap = [(-forbidden[v].bit_count(), tiebreak[v], v) for v in uncolored]
+    heapq.heapify(heap)
+
+    def select_vertex():
+        nonlocal heap
+        if len(heap) > 8 * num_vertices + 1024:
+            heap = [(-forbidden[v].bit_count(), tiebreak[v], v) for v in uncolored]
+            heapq.heapify(heap)
+        while True:
+            neg_saturation, _, vertex = heapq.heappop(heap)
+            if vertex in uncolored and -neg_saturation == forbidden[vertex].bit_count():
+                uncolored.remove(vertex)
+                return vertex
+
+    # Tabela de Zobrist (ver `_state_hash`); as cores vão até best_k - 1
+    colored_offset = best_k * num_vertices
+    zobrist = None
+    state_hash = 0
+    if nogood_max_bytes > 0 and colored_offset <= NOGOOD_MAX_KEYS:
+        zobrist = zobrist_table(colored_offset + num_vertices)
+        state_hash = _state_hash(zobrist, assignment, forbidden, colored_offset)
+    nogoods = NogoodTable(max_bytes=nogood_max_bytes)
+
+    stats = metrics.current()
+    nodes = 0
+    lower_bound = lower
+
+    def push(used):
+        nonlocal state_hash
+        if zobrist is not None and (limit_k, used, state_hash) in nogoods:
+            if stats is not None:
+                stats.backtracks += 1
+            return
+        vertex = select_vertex()
+        key_hash = state_hash
+        if zobrist is not None:
+            state_hash ^= (_forbidden_key(zobrist, forbidden[vertex], vertex, num_vertices)
+                           ^ zobrist[colored_offset + vertex])
+        stack.append([vertex, 0, 0, None, used, key_hash, state_hash])
+
+    # Cada quadro: [vértice, cores já tentadas, bit da cor atual, vizinhos
+    # alterados, cores usadas, hash do estado antes e depois de escolher o vértice]
+    stack = []
+    push(lower)
+    while True:
+        if not stack:
+            lower_bound = limit_k  # Espaço de busca esgotado sob o limite atual
+            break
+        frame = stack[-1]
+        vertex, tried, bit, changed, used, key_hash, state_hash = frame
+        if bit:
+            for neighbor in changed:
+                forbidden[neighbor] ^= bit
+                if neighbor in uncolored:
+                    heapq.heappush(heap, (-forbidden[neighbor].bit_count(), tiebreak[neighbor], neighbor))
+            assignment[vertex] = -1
+            frame[2] = 0
+
+        # Só interessam colorações com no máximo limit_k - 1 cores, abrindo
+        # no máximo uma cor nova (a de índice `used`)
+        limit_mask = (1 << (limit_k - 1)) - 1
+        available = limit_mask & ~forbidden[vertex] & ~tried & ((2 << used) - 1)
+        if not available:
+            stack.pop()
+            if stats is not None:
+                stats.backtracks += 1
+            uncolored.add(vertex)
+            heapq.heappush(heap, (-forbidden[vertex].bit_count(), tiebreak[vertex], vertex))
+            state_hash = key_hash
+            if zobrist is not None:
+                nogoods.add((limit_k, used, key_hash))
+            continue
+
+        nodes += 1
+        if node_budget is not None and nodes > node_budget:
+            break
+        if stats is not None:
+            stats.expand(len(stack))
+            stats.colors_tried += 1
+        if not nodes & 1023:
+            if deadline is not None and time.perf_counter() > deadline:
+                break
+            if should_stop is not None and should_stop():
+                break
+            bound = external_bound() if external_bound is not None else limit_k
+            if bound < limit_k:
+                limit_k = bound
+                if limit_k <= lower:
+                    break
+                continue  # Reavalia o quadro atual sob o novo limite
+
+        bit = available & -available
+        frame[1] = tried | bit
+        frame[2] = bit
+        color = assignment[vertex] = bit.bit_length() - 1
+        changed = frame[3] = []
+        feasible = True
+        offset = color * num_vertices
+        for neighbor in adjacency_list[vertex]:
+            if assignment[neighbor] == -1 and not forbidden[neighbor] & bit:
+                forbidden[neighbor] |= bit
+                changed.append(neighbor)
+                if zobrist is not None:
+                    state_hash ^= zobrist[offset + neighbor]
+                heapq.heappush(heap, (-forbidden[neighbor].bit_count(), tiebreak[neighbor], neighbor))
+                if forbidden[neighbor] & limit_mask == limit_mask:
+                    feasible = False
+                    break
+        if not feasible:
+            continue
+        if not uncolored:
+            best = list(assignment)
+            best_k = limit_k = max(best) + 1
+            if on_solution is not None:
+                on_solution(best_k, best)
+            if best_k <= lower or (should_stop is not None and should_stop()):
+                break
+            continue
+        push(max(used, color + 1))
+
+    return SearchResult(best_k, best, best_k <= lower_bound, nodes, lower_bound)
+
 def plot_mst(mst: list, vertex_colors: list, num_vertices: int):
-    G = nx.Graph()
-    G.add_nodes_from(range(num_vertices))
-    for u, v, w in mst:
-        G.add_edge(u, v, weight=w)
-
-    plt.figure(figsize=(10, 8))
-    pos = nx.spring_layout(G)
-    nx.draw_networkx_nodes(G, pos, node_color=[vertex_colors[v] for v in G.nodes()], node_size=200)
-    nx.draw_networkx_edges(G, pos)
-    nx.draw_networkx_labels(G, pos)
-    edge_labels = nx.get_edge_attributes(G, 'weight')
-    nx.draw_networkx_edge_labels(G, pos, edge_labels=edge_labels)
+    # Visualização carregada apenas quando há gráfico; o layout é semeado e
+    # troca para o modo espectral/rasterizado em grafos grandes
+    import numpy as np
+    from .results import _pyplot, calcular_layout, desenhar_grafo
+
+    edges = np.array([(u, v) for u, v, _ in mst], dtype=np.int64).reshape(-1, 2)
+    u, v = edges[:, 0], edges[:, 1]
+    plt = _pyplot()
+    fig, ax = plt.subplots(figsize=(10, 8))
+    desenhar_grafo(ax, calcular_layout(num_vertices, u, v), u, v,
+                   [vertex_colors[vertex] for vertex in range(num_vertices)],
+                   rotulos_arestas=[w for _, _, w in mst])
     plt.show()
 
-def executar_experimentos_bt():
+def executar_experimentos_bt(seed: int = 0):
     tamanhos_grafos = [10, 15, 20, 25, 50]
     resultados = []
 
@@ -136,24 +602,24 @@ def executar_experimentos_bt():
     print("|----------|------------|--------------|")
 
     for num_vertices in tamanhos_grafos:
-        inicio_tempo = time.perf_counter()
-        tracemalloc.start()
+        # Mesma semente dos experimentos gulosos: todos colorem os mesmos grafos
+        with metrics.phase("generation"):
+            graph = Graph()
+            graph.generate_graph(num_vertices, 0.4, seed=seed + num_vertices)
 
-        graph = Graph()
-        graph.generate_graph(num_vertices, 0.4)
-        
-        # Usar o grafo original (não a MST)
-        adj_list = graph.get_adjacency_list()
-        # Remover pesos das arestas
-        adj_list_unweighted = {
-            v: [neighbor for neighbor, _ in neighbors] 
-            for v, neighbors in adj_list.items()
-        }
-        vertex_colors = backtracking_coloring(adj_list_unweighted, len(colors))
+        # Usar o grafo original (não a MST), em formato compacto
+        with metrics.phase("conversion"):
+            csr = CSRGraph.from_graph(graph)
+
+        # Mede apenas a coloração (geração e conversão ficam fora da janela)
+        tracemalloc.start()
+        inicio_tempo = time.perf_counter()
+        with metrics.phase("solve"):
+            vertex_colors = backtracking_coloring(csr, len(colors))
+        tempo = (time.perf_counter() - inicio_tempo) * 1000
 
         memoria = tracemalloc.get_traced_memory()[1]
         tracemalloc.stop()
-        tempo = (time.perf_counter() - inicio_tempo) * 1000
 
         resultados.append((num_vertices, tempo, memoria))
         print(f"| {num_vertices:8d} | {tempo:9.2f} | {memoria/1024:11.2f} |")
@@ -0,0 +1,433 @@
+import argparse
+import csv
+import json
+import math
+import os
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from .backtracking import SearchResult, backtracking_coloring
+from .dimacs import read_dimacs, read_edge_list
+from .generator import generate_csr_graph
+from .guloso import colors, greedy_coloring, greedy_coloring_by_degree, smallest_last_coloring
+from . import metrics
+from .mst import kruskal
+from .rlf import rlf_coloring
+
+# Algoritmos comparados por padrão (os três primeiros são as séries de `salvar_resultados`)
+ALGORITMOS = {
+    "backtracking": lambda grafo: backtracking_coloring(grafo, len(colors)),
+    "guloso": lambda grafo: greedy_coloring(grafo, colors),
+    "guloso_grau": lambda grafo: greedy_coloring_by_degree(grafo, colors),
+    "menor_ultimo": smallest_last_coloring,
+    # Paleta inteira ilimitada: compara o número de cores em grafos grandes
+    "grau_ilimitado": lambda grafo: greedy_coloring_by_degree(grafo, range(len(grafo))),
+    "rlf": rlf_coloring,
+}
+
+# Preset `--grande`: RLF contra o guloso por grau em grafos densos de 1k a 20k vértices
+TAMANHOS_GRANDES = [1000, 2000, 5000, 10000, 20000]
+ALGORITMOS_GRANDES = ["grau_ilimitado", "rlf"]
+
+CAMPOS = [
+    "algoritmo", "vertices", "arestas", "densidade", "seed", "repeticoes",
+    "tempo_mediano_ms", "tempo_p90_ms", "tempo_p99_ms", "tempo_min_ms",
+    "memoria_pico_bytes", "cores",
+]
+
+# Contadores de `metrics.SolverMetrics` exportados com `--instrumentar`
+CAMPOS_METRICAS = {
+    "nodes": "nos_expandidos",
+    "backtracks": "retrocessos",
+    "is_safe_calls": "chamadas_is_safe",
+    "colors_tried": "cores_testadas",
+    "max_depth": "profundidade_maxima",
+}
+
+
+def gerar_conjunto_grafos(tamanhos: list, densidade: float = 0.4, seed: int = 0) -> list:
+    """
+    Gera uma única vez o conjunto de grafos do benchmark.
+
+    Cada grafo usa a semente `seed + vértices`, a mesma dos drivers
+    `executar_*`, para que todos os algoritmos colorem grafos idênticos.
+
+    Args:
+        tamanhos: Números de vértices.
+        densidade: Probabilidade de arestas extras.
+        seed: Semente base.
+    Returns:
+        Lista de dicionários com `vertices`, `densidade`, `seed`, `grafo`
+        (CSRGraph) e `tempo_geracao_ms` (geração direto em CSR).
+    """
+    casos = []
+    for n in tamanhos:
+        inicio = time.perf_counter()
+        grafo = generate_csr_graph(n, densidade, seed + n)
+        casos.append({"vertices": n, "densidade": densidade, "seed": seed + n, "grafo": grafo,
+                      "tempo_geracao_ms": (time.perf_counter() - inicio) * 1000})
+    return casos
+
+
+def contar_cores(resultado) -> int:
+    """
+    Conta as cores usadas, aceitando os formatos de retorno dos coloridores.
+
+    Args:
+        resultado: Lista de cores (nomes ou inteiros), tupla (cores, num_cores)
+            ou SearchResult.
+    Returns:
+        Número de cores distintas (0 se não houve coloração).
+    """
+    if resultado is None:
+        return 0
+    if isinstance(resultado, SearchResult):
+        return resultado.num_colors
+    if isinstance(resultado, tuple):
+        return resultado[1]
+    return len({c for c in resultado if c is not None and c != -1})
+
+
+def percentil(valores: list, p: float) -> float:
+    """Percentil `p` (0-100) pelo método do posto mais próximo."""
+    ordenados = sorted(valores)
+    indice = max(0, math.ceil(p / 100 * len(ordenados)) - 1)
+    return ordenados[indice]
+
+
+def medir(colorir, grafo, repeticoes: int = 5, aquecimento: int = 1, instrumentar: bool = False) -> dict:
+    """
+    Mede um coloridor sobre um grafo já gerado.
+
+    Após as execuções de aquecimento, cada repetição é cronometrada sem o
+    tracemalloc ativo; o pico de memória vem de uma execução separada, com o
+    tracemalloc ligado apenas em volta do coloridor. Com `instrumentar`, uma
+    última execução roda com `metrics` ligado e seus contadores entram no
+    resultado; as execuções cronometradas continuam sem instrumentação.
+
+    Args:
+        colorir: Função que recebe o grafo e devolve a coloração.
+        grafo: Grafo (CSRGraph) a ser colorido.
+        repeticoes: Número de execuções cronometradas.
+        aquecimento: Número de execuções descartadas.
+        instrumentar: Se acrescenta os contadores de busca (`CAMPOS_METRICAS`).
+    Returns:
+        Dicionário com as estatísticas de tempo (ms), memória (bytes) e cores.
+    """
+    for _ in range(aquecimento):
+        colorir(grafo)
+
+    tempos = []
+    resultado = None
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = colorir(grafo)
+        tempos.append((time.perf_counter() - inicio) * 1000)
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    colorir(grafo)
+    memoria = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    linha = {
+        "repeticoes": repeticoes,
+        "tempo_mediano_ms": statistics.median(tempos),
+        "tempo_p90_ms": percentil(tempos, 90),
+        "tempo_p99_ms": percentil(tempos, 99),
+        "tempo_min_ms": min(tempos),
+        "memoria_pico_bytes": memoria,
+        "cores": contar_cores(resultado),
+    }
+    if instrumentar:
+        with metrics.instrumented() as coletor:
+            with coletor.phase("solve"):
+                colorir(grafo)
+        contadores = coletor.snapshot()
+        linha.update({campo: contadores[chave] for chave, campo in CAMPOS_METRICAS.items()})
+        linha["tempo_instrumentado_ms"] = contadores["solve_ms"]
+    return linha
+
+
+def executar_benchmark(algoritmos: dict = None, tamanhos: list = None, densidade: float = 0.4,
+                       seed: int = 0, repeticoes: int = 5, aquecimento: int = 1,
+                       instrumentar: bool = False) -> list:
+    """
+    Executa todos os algoritmos sobre o mesmo conjunto de grafos.
+
+    Args:
+        algoritmos: Dicionário {nome: coloridor} (padrão: `ALGORITMOS`).
+        tamanhos: Números de vértices (padrão: os dos drivers `executar_*`).
+        densidade: Probabilidade de arestas extras.
+        seed: Semente base dos grafos.
+        repeticoes: Execuções cronometradas por algoritmo e grafo.
+        aquecimento: Execuções descartadas antes da medição.
+        instrumentar: Se acrescenta contadores de busca e o tempo de geração.
+    Returns:
+        Lista de linhas (dicionários com os campos de `CAMPOS`).
+    """
+    algoritmos = algoritmos or ALGORITMOS
+    tamanhos = tamanhos or [10, 15, 20, 25, 50]
+    grafos = gerar_conjunto_grafos(tamanhos, densidade, seed)
+
+    linhas = []
+    for nome, colorir in algoritmos.items():
+        for caso in grafos:
+            linha = {
+                "algoritmo": nome,
+                "vertices": caso["vertices"],
+                "arestas": caso["grafo"].num_edges,
+                "densidade": caso["densidade"],
+                "seed": caso["seed"],
+            }
+            linha.update(medir(colorir, caso["grafo"], repeticoes, aquecimento, instrumentar))
+            if instrumentar:
+                linha["tempo_geracao_ms"] = caso["tempo_geracao_ms"]
+            linhas.append(linha)
+            print(f"| {nome:14s} | {linha['vertices']:8d} | {linha['tempo_mediano_ms']:10.3f} | "
+                  f"{linha['tempo_p99_ms']:10.3f} | {linha['memoria_pico_bytes']/1024:10.2f} | {linha['cores']:5d} |")
+    return linhas
+
+
+def benchmark_kruskal(num_arestas: int = 1_000_000, num_vertices: int = 100_000, seed: int = 0,
+                      repeticoes: int = 3) -> dict:
+    """
+    Mede a MST (`kruskal`) em um grafo esparso com cerca de `num_arestas` arestas.
+
+    Args:
+        num_arestas: Número aproximado de arestas.
+        num_vertices: Número de vértices.
+        seed: Semente do grafo.
+        repeticoes: Execuções cronometradas.
+    Returns:
+        Linha com tempo mediano, tempo mínimo e vazão em arestas por segundo.
+    """
+    densidade = num_arestas / (num_vertices * (num_vertices - 1) / 2)
+    grafo = generate_csr_graph(num_vertices, densidade, seed)
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        mst = kruskal(grafo)
+        tempos.append((time.perf_counter() - inicio) * 1000)
+    return {
+        "algoritmo": "kruskal",
+        "vertices": num_vertices,
+        "arestas": grafo.num_edges,
+        "arestas_mst": len(mst),
+        "tempo_mediano_ms": statistics.median(tempos),
+        "tempo_min_ms": min(tempos),
+        "arestas_por_s": grafo.num_edges / (statistics.median(tempos) / 1000),
+    }
+
+
+def benchmark_importacao(caminho: str, repeticoes: int = 3) -> dict:
+    """
+    Mede a vazão do leitor DIMACS/lista de arestas sobre um arquivo.
+
+    Arquivos `.col` e `.col.gz` usam `read_dimacs`; os demais, `read_edge_list`.
+    A vazão é calculada sobre os bytes descomprimidos.
+
+    Args:
+        caminho: Arquivo de entrada.
+        repeticoes: Execuções cronometradas.
+    Returns:
+        Linha com tempo mediano, MB/s e arestas por segundo.
+    """
+    ler = read_dimacs if caminho.endswith((".col", ".col.gz")) else read_edge_list
+    tempos = []
+    estatisticas = {}
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        grafo = ler(caminho, stats=estatisticas)
+        tempos.append((time.perf_counter() - inicio) * 1000)
+    mediana_s = statistics.median(tempos) / 1000
+    return {
+        "algoritmo": "importacao",
+        "arquivo": caminho,
+        "vertices": grafo.num_vertices,
+        "arestas": estatisticas["edges"],
+        "bytes": estatisticas["bytes"],
+        "tempo_mediano_ms": statistics.median(tempos),
+        "mb_por_s": estatisticas["bytes"] / 1e6 / mediana_s,
+        "arestas_por_s": estatisticas["edges"] / mediana_s,
+    }
+
+
+# Módulos que o núcleo de coloração não pode carregar ao ser importado
+MODULOS_PESADOS = ("matplotlib", "networkx", "seaborn", "pandas", "scipy")
+
+_SCRIPT_PARTIDA_FRIA = """
+import json, resource, sys, time
+inicio = time.perf_counter()
+for nome in sys.argv[1:]:
+    __import__(nome)
+tempo_ms = (time.perf_counter() - inicio) * 1000
+print(json.dumps({
+    "tempo_importacao_ms": tempo_ms,
+    "rss_pico_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    "modulos": sorted({m.split(".")[0] for m in sys.modules}),
+}))
+"""
+
+
+def benchmark_partida_fria(modulos: tuple = ("src.guloso", "src.backtracking"), repeticoes: int = 5) -> dict:
+    """
+    Mede o custo de importar o núcleo de coloração em um processo novo.
+
+    Cada repetição abre um interpretador limpo (como um processo de trabalho
+    recém-criado), importa `modulos` e informa o tempo de importação, o pico
+    de memória residente e os pacotes carregados.
+
+    Args:
+        modulos: Módulos importados, na ordem.
+        repeticoes: Número de processos medidos.
+    Returns:
+        Linha com tempo mediano (ms), pico de RSS (KB) e módulos pesados carregados.
+    """
+    raiz = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    medicoes = []
+    for _ in range(repeticoes):
+        saida = subprocess.run([sys.executable, "-c", _SCRIPT_PARTIDA_FRIA, *modulos],
+                               cwd=raiz, capture_output=True, text=True, check=True).stdout
+        medicoes.append(json.loads(saida))
+    return {
+        "algoritmo": "partida_fria",
+        "modulos": list(modulos),
+        "tempo_mediano_ms": statistics.median(m["tempo_importacao_ms"] for m in medicoes),
+        "rss_pico_kb": max(m["rss_pico_kb"] for m in medicoes),
+        "modulos_pesados": sorted(set(MODULOS_PESADOS) & set(medicoes[0]["modulos"])),
+    }
+
+
+def verificar_partida_fria(linha: dict, tempo_max_ms: float = 250.0, rss_max_kb: int = 64 * 1024):
+    """
+    Falha se a importação do núcleo carregou bibliotecas de visualização ou
+    ultrapassou os limites de tempo e memória.
+
+    Args:
+        linha: Resultado de `benchmark_partida_fria`.
+        tempo_max_ms: Tempo mediano máximo de importação.
+        rss_max_kb: Pico máximo de memória residente.
+    Raises:
+        RuntimeError: Se algum limite foi violado.
+    """
+    problemas = []
+    if linha["modulos_pesados"]:
+        problemas.append(f"módulos pesados importados: {', '.join(linha['modulos_pesados'])}")
+    if linha["tempo_mediano_ms"] > tempo_max_ms:
+        problemas.append(f"importação levou {linha['tempo_mediano_ms']:.1f} ms (limite {tempo_max_ms:.0f} ms)")
+    if linha["rss_pico_kb"] > rss_max_kb:
+        problemas.append(f"pico de RSS de {linha['rss_pico_kb']} KB (limite {rss_max_kb} KB)")
+    if problemas:
+        raise RuntimeError("Partida a frio acima do limite: " + "; ".join(problemas))
+
+
+def salvar_json(linhas: list, caminho: str):
+    """Grava as linhas do benchmark em JSON."""
+    with open(caminho, "w", encoding="utf-8") as f:
+        json.dump(linhas, f, indent=2)
+
+
+def salvar_csv(linhas: list, caminho: str):
+    """Grava as linhas do benchmark em CSV."""
+    campos = CAMPOS + sorted({k for linha in linhas for k in linha} - set(CAMPOS))
+    with open(caminho, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=campos)
+        writer.writeheader()
+        writer.writerows(linhas)
+
+
+def carregar_resultados(caminho: str) -> dict:
+    """
+    Lê um arquivo JSON ou CSV do benchmark no formato de `salvar_resultados`.
+
+    Args:
+        caminho: Arquivo gravado por `salvar_json` ou `salvar_csv`.
+    Returns:
+        Dicionário {algoritmo: [(vértices, tempo mediano em ms, pico de memória em bytes)]}.
+    """
+    with open(caminho, encoding="utf-8") as f:
+        if caminho.endswith(".csv"):
+            linhas = list(csv.DictReader(f))
+        else:
+            linhas = json.load(f)
+
+    resultados = {}
+    for linha in linhas:
+        resultados.setdefault(linha["algoritmo"], []).append(
+            (int(linha["vertices"]), float(linha["tempo_mediano_ms"]), float(linha["memoria_pico_bytes"]))
+        )
+    for serie in resultados.values():
+        serie.sort()
+    return resultados
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dos algoritmos de coloração")
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=None,
+                        help="Números de vértices (padrão: 10 15 20 25 50)")
+    parser.add_argument("--densidade", type=float, default=0.4)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--algoritmos", nargs="+", default=None, choices=list(ALGORITMOS),
+                        help="Algoritmos medidos (padrão: todos)")
+    parser.add_argument("--grande", action="store_true",
+                        help="Preset para grafos grandes: equivale a --tamanhos "
+                             f"{' '.join(map(str, TAMANHOS_GRANDES))} --algoritmos {' '.join(ALGORITMOS_GRANDES)}")
+    parser.add_argument("--repeticoes", type=int, default=5)
+    parser.add_argument("--aquecimento", type=int, default=1)
+    parser.add_argument("--saida", default=os.path.join("results", "benchmark.json"),
+                        help="Arquivo .json ou .csv de saída")
+    parser.add_argument("--kruskal", action="store_true", help="Mede apenas a MST com 10^6 arestas")
+    parser.add_argument("--importar", metavar="ARQUIVO",
+                        help="Mede a vazão de leitura de um arquivo DIMACS .col ou lista de arestas")
+    parser.add_argument("--partida-fria", action="store_true",
+                        help="Mede o custo de importar o núcleo em um processo novo e falha se exceder o limite")
+    parser.add_argument("--instrumentar", action="store_true",
+                        help="Acrescenta contadores de busca (nós, retrocessos, ...) às linhas")
+    args = parser.parse_args()
+    if args.tamanhos is None:
+        args.tamanhos = TAMANHOS_GRANDES if args.grande else [10, 15, 20, 25, 50]
+    if args.algoritmos is None:
+        args.algoritmos = ALGORITMOS_GRANDES if args.grande else list(ALGORITMOS)
+
+    if args.partida_fria:
+        linha = benchmark_partida_fria(repeticoes=args.repeticoes)
+        print(f"Partida a frio: {linha['tempo_mediano_ms']:.1f} ms, pico de RSS {linha['rss_pico_kb']/1024:.1f} MB, "
+              f"módulos pesados: {', '.join(linha['modulos_pesados']) or 'nenhum'}")
+        try:
+            verificar_partida_fria(linha)
+        except RuntimeError as erro:
+            sys.exit(str(erro))
+        return
+
+    if args.importar:
+        linha = benchmark_importacao(args.importar, repeticoes=args.repeticoes)
+        print(f"Importação: {linha['arestas']} arestas, {linha['bytes']/1e6:.1f} MB em "
+              f"{linha['tempo_mediano_ms']:.1f} ms ({linha['mb_por_s']:.1f} MB/s)")
+        return
+
+    if args.kruskal:
+        linha = benchmark_kruskal(seed=args.seed, repeticoes=args.repeticoes)
+        print(f"Kruskal: {linha['arestas']} arestas em {linha['tempo_mediano_ms']:.1f} ms "
+              f"({linha['arestas_por_s']/1e6:.2f} M arestas/s)")
+        return
+
+    print("| Algoritmo      | Vértices | Mediana ms |     p99 ms | Memória KB | Cores |")
+    print("|----------------|----------|------------|------------|------------|-------|")
+    linhas = executar_benchmark(algoritmos={nome: ALGORITMOS[nome] for nome in args.algoritmos},
+                                tamanhos=args.tamanhos, densidade=args.densidade, seed=args.seed,
+                                repeticoes=args.repeticoes, aquecimento=args.aquecimento,
+                                instrumentar=args.instrumentar)
+
+    os.makedirs(os.path.dirname(args.saida) or ".", exist_ok=True)
+    if args.saida.endswith(".csv"):
+        salvar_csv(linhas, args.saida)
+    else:
+        salvar_json(linhas, args.saida)
+    print(f"\n📄 Resultados gravados em {args.saida}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+from array import array
+
+# Códigos de tipo dos arrays compactos (int64 para deslocamentos, int32 para o resto)
+OFFSET_TYPECODE = "q"
+INDEX_TYPECODE = "i"
+
+
+# --- Grafo compacto (CSR) ---
+class CSRGraph:
+    """
+    Grafo não dirigido em formato CSR (Compressed Sparse Row).
+
+    Os vizinhos do vértice `v` ocupam `neighbors[offsets[v]:offsets[v + 1]]`
+    e os pesos correspondentes ocupam a mesma faixa em `weights`. Cada aresta
+    aparece duas vezes (uma em cada extremidade), como na lista de adjacência.
+
+    A classe se comporta como a lista de adjacência sem pesos usada pelos
+    algoritmos de coloração: `len(grafo)` é o número de vértices e `grafo[v]`
+    devolve uma visão (sem cópia) dos vizinhos de `v`.
+    """
+
+    def __init__(self, offsets, neighbors, weights):
+        """
+        Inicializa o grafo a partir dos três arrays CSR já montados.
+
+        Args:
+            offsets: Deslocamentos de cada vértice (tamanho `num_vertices + 1`).
+            neighbors: Vizinhos concatenados de todos os vértices.
+            weights: Pesos das arestas, alinhados com `neighbors`.
+        """
+        self.offsets = offsets
+        self.neighbors = neighbors
+        self.weights = weights
+        self._neighbors_view = memoryview(neighbors)
+        self._weights_view = memoryview(weights)
+
+    @classmethod
+    def from_edges(cls, num_vertices: int, edges) -> "CSRGraph":
+        """
+        Constrói o grafo a partir de um iterável de arestas (u, v, w).
+
+        As arestas são lidas uma única vez e guardadas em arrays compactos;
+        a montagem final é uma ordenação por contagem em O(n + m).
+
+        Args:
+            num_vertices: Número de vértices.
+            edges: Iterável de tuplas (u, v, w).
+        Returns:
+            Instância de CSRGraph.
+        """
+        builder = CSRBuilder(num_vertices)
+        for u, v, w in edges:
+            builder.add_edge(u, v, w)
+        return builder.build()
+
+    @classmethod
+    def from_graph(cls, graph) -> "CSRGraph":
+        """
+        Constrói o grafo compacto a partir de uma instância de `Graph`.
+
+        Args:
+            graph: Grafo com `get_vertices()` e `get_edges()`.
+        Returns:
+            Instância de CSRGraph.
+        """
+        return cls.from_edges(len(graph.get_vertices()), graph.get_edges())
+
+    @classmethod
+    def from_adjacency(cls, adjacency_list) -> "CSRGraph":
+        """
+        Constrói o grafo compacto a partir de uma lista de adjacência sem pesos.
+
+        Args:
+            adjacency_list: Dicionário {vértice: vizinhos} com vértices 0 .. n - 1.
+        Returns:
+            Instância de CSRGraph (pesos iguais a 1).
+        """
+        if isinstance(adjacency_list, cls):
+            return adjacency_list
+        builder = CSRBuilder(len(adjacency_list))
+        for u in range(len(adjacency_list)):
+            for v in adjacency_list[u]:
+                if u < v:
+                    builder.add_edge(u, v)
+        return builder.build()
+
+    @classmethod
+    def from_edge_arrays(cls, num_vertices: int, u, v, w=None, dedupe: bool = False) -> "CSRGraph":
+        """
+        Constrói o grafo a partir de arrays NumPy de extremidades, em lote.
+
+        Não cria tuplas por aresta: a montagem é feita com `bincount` e uma
+        ordenação estável pelos vértices de origem.
+
+        Args:
+            num_vertices: Número de vértices.
+            u: Array com a primeira extremidade de cada aresta.
+            v: Array com a segunda extremidade de cada aresta.
+            w: Array de pesos (padrão: todos 1).
+            dedupe: Remove laços e arestas repetidas (em qualquer sentido).
+        Returns:
+            Instância de CSRGraph.
+        """
+        import numpy as np
+
+        u = np.asarray(u, dtype=np.int64)
+        v = np.asarray(v, dtype=np.int64)
+        w = np.ones(len(u), dtype=np.int64) if w is None else np.asarray(w, dtype=np.int64)
+        if dedupe:
+            low, high = np.minimum(u, v), np.maximum(u, v)
+            keep = low != high
+            _, first = np.unique(low[keep] * num_vertices + high[keep], return_index=True)
+            u, v, w = low[keep][first], high[keep][first], w[keep][first]
+
+        src = np.concatenate([u, v])
+        dst = np.concatenate([v, u])
+        order = np.argsort(src, kind="stable")
+        offsets = np.zeros(num_vertices + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=num_vertices), out=offsets[1:])
+        return cls(
+            array(OFFSET_TYPECODE, offsets.tobytes()),
+            array(INDEX_TYPECODE, dst[order].astype(np.int32).tobytes()),
+            array(INDEX_TYPECODE, np.concatenate([w, w])[order].astype(np.int32).tobytes()),
+        )
+
+    @classmethod
+    def from_buffer(cls, buffer, num_vertices: int, num_entries: int) -> "CSRGraph":
+        """
+        Cria o grafo sobre um buffer já preenchido por `write_into`, sem cópia.
+
+        Útil para memória compartilhada entre processos e arquivos mapeados (mmap).
+
+        Args:
+            buffer: Objeto com protocolo de buffer (bytes, mmap, SharedMemory.buf...).
+            num_vertices: Número de vértices.
+            num_entries: Tamanho do array de vizinhos (2 * número de arestas).
+        Returns:
+            Instância de CSRGraph cujos arrays são visões de `buffer`.
+        """
+        view = memoryview(buffer).cast("B")
+        offsets_end = 8 * (num_vertices + 1)
+        neighbors_end = offsets_end + 4 * num_entries
+        return cls(
+            view[:offsets_end].cast(OFFSET_TYPECODE),
+            view[offsets_end:neighbors_end].cast(INDEX_TYPECODE),
+            view[neighbors_end:neighbors_end + 4 * num_entries].cast(INDEX_TYPECODE),
+        )
+
+    def write_into(self, buffer):
+        """
+        Copia os três arrays, em sequência, para `buffer` (ver `from_buffer`).
+
+        Args:
+            buffer: Buffer gravável com pelo menos `nbytes` bytes.
+        """
+        view = memoryview(buffer).cast("B")
+        position = 0
+        for part in (self.offsets, self.neighbors, self.weights):
+            raw = memoryview(part).cast("B")
+            view[position:position + raw.nbytes] = raw
+            position += raw.nbytes
+
+    @property
+    def num_vertices(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.neighbors) // 2
+
+    @property
+    def nbytes(self) -> int:
+        """Memória ocupada pelos três arrays, em bytes."""
+        return sum(memoryview(a).nbytes for a in (self.offsets, self.neighbors, self.weights))
+
+    def __len__(self) -> int:
+        return self.num_vertices
+
+    def __iter__(self):
+        return iter(range(self.num_vertices))
+
+    def __getitem__(self, vertex: int) -> memoryview:
+        return self._neighbors_view[self.offsets[vertex]:self.offsets[vertex + 1]]
+
+    def degree(self, vertex: int) -> int:
+        """Retorna o grau do vértice `vertex`."""
+        return self.offsets[vertex + 1] - self.offsets[vertex]
+
+    def get_weights(self, vertex: int) -> memoryview:
+        """Retorna uma visão (sem cópia) dos pesos das arestas de `vertex`."""
+        return self._weights_view[self.offsets[vertex]:self.offsets[vertex + 1]]
+
+    def get_vertices(self) -> range:
+        """Retorna os vértices do grafo (0 .. n - 1)."""
+        return range(self.num_vertices)
+
+    def get_edges(self):
+        """
+        Percorre as arestas do grafo, cada uma uma única vez.
+
+        Returns:
+            Gerador de tuplas (u, v, w) com u < v.
+        """
+        offsets, neighbors, weights = self.offsets, self.neighbors, self.weights
+        for u in range(self.num_vertices):
+            for i in range(offsets[u], offsets[u + 1]):
+                v = neighbors[i]
+                if u < v:
+                    yield (u, v, weights[i])
+
+
+class CSRBuilder:
+    """
+    Acumula arestas em arrays compactos e monta um `CSRGraph` ao final.
+
+    Serve de destino ("sink") para geradores e leitores que produzem
+    arestas em fluxo, sem criar listas de tuplas intermediárias.
+    """
+
+    def __init__(self, num_vertices: int):
+        """
+        Args:
+            num_vertices: Número de vértices do grafo a ser montado.
+        """
+        self.num_vertices = num_vertices
+        self._src = array(INDEX_TYPECODE)
+        self._dst = array(INDEX_TYPECODE)
+        self._weights = array(INDEX_TYPECODE)
+
+    def add_edge(self, u: int, v: int, w: int = 1):
+        """Registra a aresta não dirigida (u, v) com peso `w`."""
+        self._src.append(u)
+        self._dst.append(v)
+        self._weights.append(w)
+
+    def extend(self, src, dst, weights):
+        """Registra várias arestas de uma vez a partir de arrays alinhados."""
+        self._src.extend(src)
+        self._dst.extend(dst)
+        self._weights.extend(weights)
+
+    def build(self) -> CSRGraph:
+        """
+        Monta o grafo CSR com uma ordenação por contagem em O(n + m).
+
+        Returns:
+            Instância de CSRGraph.
+        """
+        n = self.num_vertices
+        src, dst, weights = self._src, self._dst, self._weights
+
+        offsets = array(OFFSET_TYPECODE, bytes(8 * (n + 1)))
+        for u in src:
+            offsets[u + 1] += 1
+        for v in dst:
+            offsets[v + 1] += 1
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+
+        total = offsets[n]
+        neighbors = array(INDEX_TYPECODE, bytes(4 * total))
+        edge_weights = array(INDEX_TYPECODE, bytes(4 * total))
+        cursor = array(OFFSET_TYPECODE, offsets[:n])
+        for u, v, w in zip(src, dst, weights):
+            pos = cursor[u]
+            neighbors[pos] = v
+            edge_weights[pos] = w
+            cursor[u] = pos + 1
+            pos = cursor[v]
+            neighbors[pos] = u
+            edge_weights[pos] = w
+            cursor[v] = pos + 1
+
+        # Libera os arrays temporários antes de devolver o grafo
+        self._src = array(INDEX_TYPECODE)
+        self._dst = array(INDEX_TYPECODE)
+        self._weights = array(INDEX_TYPECODE)
+        return CSRGraph(offsets, neighbors, edge_weights)
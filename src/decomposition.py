@@ -0,0 +1,292 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from .backtracking import anytime_coloring, bitset_backtracking_coloring, exact_coloring, greedy_clique
+
+# Núcleos menores que isto são resolvidos no próprio processo
+PARALLEL_MIN_VERTICES = 64
+# Núcleos a partir deste tamanho usam `anytime_coloring` (DSatur + busca iterativa)
+LARGE_BLOCK_VERTICES = 500
+
+
+def biconnected_components(adjacency_list) -> list:
+    """
+    Blocos (componentes biconexos) pelo algoritmo de Tarjan com pilha explícita.
+
+    Dois blocos compartilham no máximo um vértice (de articulação) e os blocos
+    de cada componente conexo formam uma árvore. Pontes viram blocos de dois
+    vértices e vértices isolados, blocos unitários.
+
+    Args:
+        adjacency_list: Lista de adjacência (dicionário, lista ou CSRGraph).
+    Returns:
+        Lista de blocos, cada um como lista de vértices.
+    """
+    num_vertices = len(adjacency_list)
+    order = [-1] * num_vertices
+    low = [0] * num_vertices
+    blocks = []
+    counter = 0
+    for root in range(num_vertices):
+        if order[root] != -1:
+            continue
+        order[root] = low[root] = counter
+        counter += 1
+        if not len(adjacency_list[root]):
+            blocks.append([root])
+            continue
+        edges = []
+        stack = [(root, -1, iter(adjacency_list[root]))]
+        while stack:
+            vertex, parent, neighbors = stack[-1]
+            advanced = False
+            for neighbor in neighbors:
+                if order[neighbor] == -1:
+                    order[neighbor] = low[neighbor] = counter
+                    counter += 1
+                    edges.append((vertex, neighbor))
+                    stack.append((neighbor, vertex, iter(adjacency_list[neighbor])))
+                    advanced = True
+                    break
+                if neighbor != parent and order[neighbor] < order[vertex]:
+                    edges.append((vertex, neighbor))
+                    low[vertex] = min(low[vertex], order[neighbor])
+            if advanced:
+                continue
+            stack.pop()
+            if parent == -1:
+                continue
+            low[parent] = min(low[parent], low[vertex])
+            if low[vertex] >= order[parent]:
+                # `parent` separa o bloco que acabou de ser fechado
+                block = set()
+                while True:
+                    u, v = edges.pop()
+                    block.add(u)
+                    block.add(v)
+                    if (u, v) == (parent, vertex):
+                        break
+                blocks.append(list(block))
+    return blocks
+
+
+def reduce_graph(adjacency_list, k: int) -> tuple:
+    """
+    Remove vértices que podem ser coloridos depois, sem mudar a resposta.
+
+    Repete até estabilizar: vértices com grau < k (sempre sobra uma das k
+    cores para eles) e vértices dominados, isto é, `u` não adjacente a `v`
+    com N(u) ⊆ N(v) (`u` pode receber a cor de `v`). Depois da primeira
+    passada, só os vizinhos de cada vértice removido são reexaminados.
+
+    Args:
+        adjacency_list: Lista de adjacência (dicionário, lista ou CSRGraph).
+        k: Número de cores disponível na reinserção.
+    Returns:
+        Tupla (adjacência reduzida como lista de conjuntos, vértices do
+        núcleo, pilha de remoções para `extend_coloring`).
+    """
+    num_vertices = len(adjacency_list)
+    adjacency = [set(adjacency_list[v]) for v in range(num_vertices)]
+    alive = set(range(num_vertices))
+    removed = []
+    # Só quem perde um vizinho pode passar a ter grau < k ou a ser dominado,
+    # então cada remoção reenfileira apenas os vizinhos do vértice removido
+    low = [v for v in range(num_vertices) if len(adjacency[v]) < k]
+    dirty = list(range(num_vertices - 1, -1, -1))
+    queued = bytearray(b"\x01") * num_vertices
+
+    def remove(vertex, dominant):
+        alive.discard(vertex)
+        removed.append((vertex, dominant))
+        for neighbor in adjacency[vertex]:
+            adjacency[neighbor].discard(vertex)
+            if len(adjacency[neighbor]) < k:
+                low.append(neighbor)
+            if not queued[neighbor]:
+                queued[neighbor] = 1
+                dirty.append(neighbor)
+        adjacency[vertex] = set()
+
+    def dominator(u):
+        neighbors = adjacency[u]
+        pivot = min(neighbors, key=lambda w: len(adjacency[w]))
+        for v in adjacency[pivot]:
+            if v != u and v not in neighbors and len(adjacency[v]) >= len(neighbors) \
+                    and neighbors <= adjacency[v]:
+                return v
+        return None
+
+    while low or dirty:
+        if low:
+            vertex = low.pop()
+            if vertex in alive and len(adjacency[vertex]) < k:
+                remove(vertex, None)
+            continue
+        u = dirty.pop()
+        queued[u] = 0
+        if u in alive and adjacency[u]:
+            v = dominator(u)
+            if v is not None:
+                remove(u, v)
+    return adjacency, sorted(alive), removed
+
+
+def extend_coloring(coloring: list, adjacency_list, removed: list) -> list:
+    """
+    Recoloca os vértices removidos por `reduce_graph`, na ordem inversa.
+
+    Vértices dominados recebem a cor do dominante; os de grau baixo, a menor
+    cor livre entre os vizinhos já coloridos.
+
+    Args:
+        coloring: Cores do núcleo (-1 nos vértices removidos); alterada no lugar.
+        adjacency_list: Lista de adjacência original.
+        removed: Pilha devolvida por `reduce_graph`.
+    Returns:
+        A própria lista `coloring`, completa.
+    """
+    for vertex, dominant in reversed(removed):
+        if dominant is not None:
+            coloring[vertex] = coloring[dominant]
+            continue
+        used = {coloring[w] for w in adjacency_list[vertex]}
+        color = 0
+        while color in used:
+            color += 1
+        coloring[vertex] = color
+    return coloring
+
+
+def _induced(adjacency: list, vertices: list) -> list:
+    """Subgrafo induzido, com vértices renumerados 0 .. len(vertices) - 1."""
+    index = {v: i for i, v in enumerate(vertices)}
+    return [[index[w] for w in adjacency[v] if w in index] for v in vertices]
+
+
+def _merge_blocks(coloring: list, blocks: list, local_colorings: list) -> list:
+    """
+    Junta as colorações dos blocos, permutando as cores de cada bloco para
+    concordar no vértice de articulação compartilhado com os já processados.
+    """
+    blocks_of = {}
+    for index, block in enumerate(blocks):
+        for vertex in block:
+            blocks_of.setdefault(vertex, []).append(index)
+    done = [False] * len(blocks)
+    for first in range(len(blocks)):
+        if done[first]:
+            continue
+        done[first] = True
+        queue = [first]
+        for index in queue:
+            block, local = blocks[index], local_colorings[index]
+            permutation = {}
+            for vertex, color in zip(block, local):
+                if coloring[vertex] != -1:
+                    permutation = {color: coloring[vertex], coloring[vertex]: color}
+                    break
+            for vertex, color in zip(block, local):
+                coloring[vertex] = permutation.get(color, color)
+            for vertex in block:
+                for other in blocks_of[vertex]:
+                    if not done[other]:
+                        done[other] = True
+                        queue.append(other)
+    return coloring
+
+
+def _solve_k(local_adjacency: list, k: int) -> list:
+    if len(local_adjacency) < LARGE_BLOCK_VERTICES:
+        return bitset_backtracking_coloring(local_adjacency, k)
+    # Basta uma coloração com até k cores: a busca para na primeira, só
+    # procura colorações abaixo de k + 1 e desiste se a clique passar de k
+    found = []
+
+    def on_solution(num_colors: int, coloring: list):
+        if num_colors <= k:
+            found.append(coloring)
+
+    anytime_coloring(local_adjacency, should_stop=lambda: bool(found), on_solution=on_solution,
+                     external_bound=lambda: k + 1)
+    return found[0] if found else None
+
+
+def _solve_exact(local_adjacency: list) -> list:
+    if len(local_adjacency) < LARGE_BLOCK_VERTICES:
+        return exact_coloring(local_adjacency)[1]
+    return anytime_coloring(local_adjacency).coloring
+
+
+def _solve_blocks(solver, adjacency: list, blocks: list, extra_args: tuple, workers: int) -> list:
+    """Resolve cada bloco com `solver`, usando processos para os blocos grandes."""
+    subproblems = [_induced(adjacency, block) for block in blocks]
+    results = [None] * len(blocks)
+    large = [i for i, sub in enumerate(subproblems) if len(sub) >= PARALLEL_MIN_VERTICES]
+    workers = min(workers or os.cpu_count() or 1, len(large))
+    futures = {}
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        if executor is not None:
+            futures = {i: executor.submit(solver, subproblems[i], *extra_args) for i in large}
+        for i, sub in enumerate(subproblems):
+            if i not in futures:
+                results[i] = solver(sub, *extra_args)
+        for i, future in futures.items():
+            results[i] = future.result()
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+    return results
+
+
+def k_colorable(adjacency_list, k: int, workers: int = None) -> list:
+    """
+    Decide se o grafo admite k-coloração, resolvendo apenas os núcleos.
+
+    O grafo é reduzido por `reduce_graph`, o que sobra é dividido em blocos
+    biconexos e cada bloco passa pela busca exata com máscaras de bits, em
+    paralelo quando há blocos grandes. As colorações são combinadas e os
+    vértices removidos, recolocados.
+
+    Args:
+        adjacency_list: Lista de adjacência (dicionário, lista ou CSRGraph).
+        k: Número de cores.
+        workers: Processos para os blocos grandes (padrão: número de CPUs).
+    Returns:
+        Lista de cores inteiras (0 .. k - 1), ou None se não houver k-coloração.
+    """
+    num_vertices = len(adjacency_list)
+    adjacency, core, removed = reduce_graph(adjacency_list, k)
+    blocks = [[core[i] for i in block] for block in biconnected_components(_induced(adjacency, core))]
+    local_colorings = _solve_blocks(_solve_k, adjacency, blocks, (k,), workers)
+    if any(local is None for local in local_colorings):
+        return None
+    coloring = _merge_blocks([-1] * num_vertices, blocks, local_colorings)
+    return extend_coloring(coloring, adjacency_list, removed)
+
+
+def decomposed_exact_coloring(adjacency_list, workers: int = None) -> tuple:
+    """
+    Número cromático com redução e decomposição antes da busca exata.
+
+    A redução usa k = tamanho de uma clique heurística (limite inferior do
+    número cromático), de modo que os vértices removidos sempre cabem na
+    coloração final. Cada bloco do núcleo é resolvido por `exact_coloring`;
+    o número cromático é o maior entre os blocos e a clique.
+
+    Args:
+        adjacency_list: Lista de adjacência (dicionário, lista ou CSRGraph).
+        workers: Processos para os blocos grandes (padrão: número de CPUs).
+    Returns:
+        Tupla (número cromático, lista de cores inteiras).
+    """
+    num_vertices = len(adjacency_list)
+    if not num_vertices:
+        return 0, []
+    lower = len(greedy_clique(adjacency_list))
+    adjacency, core, removed = reduce_graph(adjacency_list, lower)
+    blocks = [[core[i] for i in block] for block in biconnected_components(_induced(adjacency, core))]
+    local_colorings = _solve_blocks(_solve_exact, adjacency, blocks, (), workers)
+    coloring = _merge_blocks([-1] * num_vertices, blocks, local_colorings)
+    extend_coloring(coloring, adjacency_list, removed)
+    return max(coloring) + 1, coloring
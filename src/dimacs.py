@@ -0,0 +1,190 @@
+import gzip
+import numpy as np
+from .csr import CSRGraph
+
+# Tamanho dos blocos lidos do arquivo (bytes descomprimidos)
+CHUNK_SIZE = 1 << 22
+
+# Caracteres possíveis em um bloco que contém só linhas "e u v"
+_DIMACS_EDGE_BYTES = b"0123456789e \t\r\n"
+_EDGE_LIST_BYTES = b"0123456789 \t\r\n,"
+
+
+def open_binary(path: str):
+    """Abre o arquivo para leitura binária, descomprimindo se terminar em `.gz`."""
+    return gzip.open(path, "rb") if path.endswith(".gz") else open(path, "rb")
+
+
+def iter_chunks(f, chunk_size: int = CHUNK_SIZE):
+    """
+    Lê o arquivo em blocos que sempre terminam em fim de linha.
+
+    Args:
+        f: Arquivo aberto em modo binário.
+        chunk_size: Tamanho aproximado de cada bloco, em bytes.
+    Returns:
+        Gerador de blocos (bytes).
+    """
+    carry = b""
+    while True:
+        block = f.read(chunk_size)
+        if not block:
+            if carry:
+                yield carry
+            return
+        if carry:
+            block = carry + block
+        cut = block.rfind(b"\n") + 1
+        carry = block[cut:]
+        if cut:
+            yield block[:cut]
+
+
+def _parse_numbers(text: bytes) -> np.ndarray:
+    """Converte, em C, todos os inteiros separados por espaço em um array."""
+    if not text.strip():
+        return np.empty(0, dtype=np.int64)
+    return np.fromstring(text, dtype=np.int64, sep=" ")
+
+
+def _read_blocks(path: str, chunk_size: int, plain_bytes: bytes, clean, filter_lines,
+                 stats: dict) -> np.ndarray:
+    """
+    Lê o arquivo em blocos e devolve todos os números das linhas de dados.
+
+    Blocos formados só por linhas de dados (caso comum) passam apenas por
+    `clean`, uma substituição de bytes em C, e vão direto para o conversor em
+    lote; blocos com comentários ou cabeçalho passam antes por `filter_lines`,
+    que devolve apenas o texto numérico.
+    """
+    parts = []
+    total_bytes = 0
+    with open_binary(path) as f:
+        for chunk in iter_chunks(f, chunk_size):
+            total_bytes += len(chunk)
+            if chunk.translate(None, plain_bytes):
+                chunk = filter_lines(chunk)
+            parts.append(_parse_numbers(clean(chunk)))
+    if stats is not None:
+        stats["bytes"] = total_bytes
+    return np.concatenate(parts) if parts else np.empty(0, dtype=np.int64)
+
+
+def _check_vertex_range(path: str, u: np.ndarray, v: np.ndarray, num_vertices: int, first_id: int):
+    """Levanta ValueError citando o arquivo e o primeiro índice de vértice fora de [0, num_vertices)."""
+    bad = (u < 0) | (u >= num_vertices) | (v < 0) | (v >= num_vertices)
+    if bad.any():
+        edge = int(np.argmax(bad))
+        vertex = int(u[edge]) if not 0 <= u[edge] < num_vertices else int(v[edge])
+        raise ValueError(f"{path}: vértice {vertex + first_id} fora do intervalo "
+                         f"{first_id}..{num_vertices - 1 + first_id}")
+
+
+def read_dimacs(path: str, chunk_size: int = CHUNK_SIZE, stats: dict = None) -> CSRGraph:
+    """
+    Lê uma instância DIMACS `.col` (ou `.col.gz`) em fluxo, direto para CSR.
+
+    Linhas `c` são comentários, a linha `p edge N M` dá o número de vértices
+    e cada linha `e u v` é uma aresta com vértices numerados a partir de 1.
+    Arestas repetidas (inclusive nos dois sentidos) e laços são descartados;
+    um vértice fora de 1 .. N gera ValueError com o arquivo e o índice.
+
+    Args:
+        path: Caminho do arquivo.
+        chunk_size: Tamanho dos blocos lidos, em bytes.
+        stats: Dicionário opcional que recebe `bytes` lidos e `edges` finais.
+    Returns:
+        Instância de CSRGraph com vértices 0 .. N - 1.
+    """
+    header = {}
+
+    def filter_lines(chunk: bytes) -> bytes:
+        data = []
+        for line in chunk.splitlines():
+            kind = line[:1]
+            if kind == b"e":
+                data.append(line[1:])
+            elif kind == b"p":
+                fields = line.split()
+                header["num_vertices"] = int(fields[2])
+        return b"\n".join(data)
+
+    numbers = _read_blocks(path, chunk_size, _DIMACS_EDGE_BYTES,
+                           lambda chunk: chunk.translate(None, b"e"), filter_lines, stats)
+    u, v = numbers[0::2] - 1, numbers[1::2] - 1
+    num_vertices = header.get("num_vertices", int(max(u.max(initial=-1), v.max(initial=-1))) + 1)
+    _check_vertex_range(path, u, v, num_vertices, 1)
+    graph = CSRGraph.from_edge_arrays(num_vertices, u, v, dedupe=True)
+    if stats is not None:
+        stats["edges"] = graph.num_edges
+    return graph
+
+
+def read_edge_list(path: str, num_vertices: int = None, one_based: bool = False,
+                   chunk_size: int = CHUNK_SIZE, stats: dict = None) -> CSRGraph:
+    """
+    Lê uma lista de arestas em texto (`u v` ou `u v w` por linha), com ou sem gzip.
+
+    Linhas iniciadas por `#` ou `%` são comentários; vírgulas também são
+    aceitas como separador. O número de colunas é detectado na primeira linha
+    de dados.
+
+    Args:
+        path: Caminho do arquivo.
+        num_vertices: Número de vértices (padrão: maior índice + 1).
+        one_based: Se os vértices são numerados a partir de 1.
+        chunk_size: Tamanho dos blocos lidos, em bytes.
+        stats: Dicionário opcional que recebe `bytes` lidos e `edges` finais.
+    Returns:
+        Instância de CSRGraph.
+    """
+    columns = None
+    with open_binary(path) as f:
+        for line in f:
+            line = line.strip()
+            if line and line[:1] not in (b"#", b"%"):
+                columns = len(line.replace(b",", b" ").split())
+                break
+    if columns not in (2, 3):
+        raise ValueError(f"Formato de lista de arestas não reconhecido: {path}")
+
+    def filter_lines(chunk: bytes) -> bytes:
+        return b"\n".join(line for line in chunk.splitlines()
+                          if line.strip() and line.lstrip()[:1] not in (b"#", b"%"))
+
+    numbers = _read_blocks(path, chunk_size, _EDGE_LIST_BYTES, lambda chunk: chunk.replace(b",", b" "),
+                           filter_lines, stats).reshape(-1, columns)
+    u, v = numbers[:, 0], numbers[:, 1]
+    if one_based:
+        u, v = u - 1, v - 1
+    weights = numbers[:, 2] if columns == 3 else None
+    if num_vertices is None:
+        num_vertices = int(max(u.max(initial=-1), v.max(initial=-1))) + 1
+    _check_vertex_range(path, u, v, num_vertices, 1 if one_based else 0)
+    graph = CSRGraph.from_edge_arrays(num_vertices, u, v, weights, dedupe=True)
+    if stats is not None:
+        stats["edges"] = graph.num_edges
+    return graph
+
+
+def write_dimacs(graph: CSRGraph, path: str, chunk_edges: int = 1 << 18):
+    """
+    Grava o grafo no formato DIMACS `.col` (comprimido se terminar em `.gz`).
+
+    Args:
+        graph: Grafo a ser gravado.
+        path: Caminho do arquivo.
+        chunk_edges: Arestas formatadas por bloco.
+    """
+    offsets = np.frombuffer(graph.offsets, dtype=np.int64)
+    neighbors = np.frombuffer(graph.neighbors, dtype=np.int32)
+    src = np.repeat(np.arange(graph.num_vertices, dtype=np.int64), np.diff(offsets))
+    once = src < neighbors
+    u, v = src[once] + 1, neighbors[once].astype(np.int64) + 1
+
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "wb") as f:
+        f.write(f"p edge {graph.num_vertices} {len(u)}\n".encode())
+        for start in range(0, len(u), chunk_edges):
+            block = zip(u[start:start + chunk_edges].tolist(), v[start:start + chunk_edges].tolist())
+            f.write("".join(f"e {a} {b}\n" for a, b in block).encode())
@@ -0,0 +1,253 @@
+import threading
+from .guloso import dsatur_coloring
+
+
+class DynamicColoring:
+    """
+    Coloração mantida incrementalmente sob inserção e remoção de arestas.
+
+    Para cada vértice guarda-se quantos vizinhos usam cada cor
+    (`neighbor_color_counts[v][c]`), de forma que verificar se uma cor está
+    livre custa O(1) e recolorir um vértice custa O(grau). Um conflito criado
+    por `add_edge` é reparado localmente: uma das extremidades recebe a menor
+    cor livre ou, se isso abriria uma cor nova, tenta-se uma troca de cadeia
+    de Kempe antes de aceitar a cor nova. As cadeias têm no máximo
+    `max_chain` vértices (64 por padrão), então o reparo custa
+    O(k² · max_chain · grau) no pior caso, com k cores, independente de n.
+    """
+
+    def __init__(self, adjacency_list=None, colorer=dsatur_coloring, coloring=None):
+        """
+        Inicializa a estrutura a partir de um grafo e de um coloridor existente.
+
+        Args:
+            adjacency_list: Lista de adjacência inicial (dicionário ou CSRGraph).
+            colorer: Coloridor usado para a coloração inicial; deve devolver
+                uma lista de cores inteiras ou uma tupla (cores, num_cores).
+            coloring: Coloração inicial já calculada (ignora `colorer`).
+        """
+        adjacency_list = adjacency_list if adjacency_list is not None else {}
+        num_vertices = len(adjacency_list)
+        self._lock = threading.RLock()
+        self._compactor = None
+        self.adjacency = [set(adjacency_list[v]) for v in range(num_vertices)]
+        if coloring is None:
+            coloring = colorer(adjacency_list) if num_vertices else []
+            if isinstance(coloring, tuple):
+                coloring = coloring[0]
+        self.colors = list(coloring)
+        self.neighbor_color_counts = [{} for _ in range(num_vertices)]
+        self.class_sizes = {}
+        for v in range(num_vertices):
+            self.class_sizes[self.colors[v]] = self.class_sizes.get(self.colors[v], 0) + 1
+            counts = self.neighbor_color_counts[v]
+            for u in self.adjacency[v]:
+                counts[self.colors[u]] = counts.get(self.colors[u], 0) + 1
+
+    @property
+    def num_colors(self) -> int:
+        """Número de cores em uso."""
+        return len(self.class_sizes)
+
+    def _smallest_free_color(self, vertex: int) -> int:
+        counts = self.neighbor_color_counts[vertex]
+        color = 0
+        while counts.get(color):
+            color += 1
+        return color
+
+    def _set_color(self, vertex: int, color: int):
+        """Troca a cor de `vertex` e atualiza as contagens dos vizinhos em O(grau)."""
+        old = self.colors[vertex]
+        if old == color:
+            return
+        self.class_sizes[old] -= 1
+        if not self.class_sizes[old]:
+            del self.class_sizes[old]
+        self.class_sizes[color] = self.class_sizes.get(color, 0) + 1
+        self.colors[vertex] = color
+        for u in self.adjacency[vertex]:
+            counts = self.neighbor_color_counts[u]
+            counts[old] -= 1
+            if not counts[old]:
+                del counts[old]
+            counts[color] = counts.get(color, 0) + 1
+
+    def _kempe_chain(self, start: int, a: int, b: int, exclude: int, max_chain: int) -> set:
+        """
+        Componente do subgrafo de cores {a, b} que contém `start`, sem `exclude`.
+
+        A busca para assim que a cadeia passa de `max_chain` vértices e devolve
+        None: o custo fica limitado a O(max_chain · grau), e não ao tamanho da
+        componente.
+        """
+        chain = {start}
+        stack = [start]
+        while stack:
+            v = stack.pop()
+            other = b if self.colors[v] == a else a
+            if not self.neighbor_color_counts[v].get(other):
+                continue
+            for u in self.adjacency[v]:
+                if u not in chain and u != exclude and self.colors[u] == other:
+                    chain.add(u)
+                    if len(chain) > max_chain:
+                        return None
+                    stack.append(u)
+        return chain
+
+    def _try_kempe(self, vertex: int, limit: int, max_chain: int) -> bool:
+        """
+        Tenta liberar uma cor < `limit` para `vertex` com uma troca de Kempe.
+
+        Para cada cor `a` usada por um único vizinho `u`, troca as cores `a` e
+        `b` na cadeia de `u`; se a cadeia não alcança outro vizinho de cor `b`,
+        `a` fica livre para `vertex`. Pares cuja cadeia passa de `max_chain`
+        vértices são descartados sem percorrer o resto da componente.
+        """
+        counts = self.neighbor_color_counts[vertex]
+        for a in range(limit):
+            if counts.get(a) != 1:
+                continue
+            u = next(w for w in self.adjacency[vertex] if self.colors[w] == a)
+            for b in range(limit):
+                if b == a:
+                    continue
+                chain = self._kempe_chain(u, a, b, vertex, max_chain)
+                if chain is None or any(
+                        w in chain for w in self.adjacency[vertex] if self.colors[w] == b):
+                    continue
+                for w in chain:
+                    self._set_color(w, b if self.colors[w] == a else a)
+                self._set_color(vertex, a)
+                return True
+        return False
+
+    def _repair(self, vertex: int, max_chain: int = 64):
+        """Recolore `vertex` sem abrir cor nova sempre que possível."""
+        color = self._smallest_free_color(vertex)
+        if color not in self.class_sizes and self._try_kempe(vertex, color, max_chain):
+            return
+        self._set_color(vertex, color)
+
+    def add_vertex(self) -> int:
+        """
+        Acrescenta um vértice isolado, com a cor 0.
+
+        Returns:
+            Índice do novo vértice.
+        """
+        with self._lock:
+            self.adjacency.append(set())
+            self.neighbor_color_counts.append({})
+            self.colors.append(0)
+            self.class_sizes[0] = self.class_sizes.get(0, 0) + 1
+            return len(self.colors) - 1
+
+    def add_edge(self, u: int, v: int):
+        """
+        Insere a aresta (u, v) e repara o conflito, se houver, sem percorrer
+        mais que `max_chain` vértices por cadeia de Kempe.
+
+        Args:
+            u: Primeira extremidade.
+            v: Segunda extremidade.
+        """
+        with self._lock:
+            if u == v or v in self.adjacency[u]:
+                return
+            self.adjacency[u].add(v)
+            self.adjacency[v].add(u)
+            counts_u, counts_v = self.neighbor_color_counts[u], self.neighbor_color_counts[v]
+            counts_u[self.colors[v]] = counts_u.get(self.colors[v], 0) + 1
+            counts_v[self.colors[u]] = counts_v.get(self.colors[u], 0) + 1
+            if self.colors[u] == self.colors[v]:
+                # Recolore a extremidade de menor grau (reparo mais barato)
+                self._repair(u if len(self.adjacency[u]) <= len(self.adjacency[v]) else v)
+
+    def remove_edge(self, u: int, v: int):
+        """
+        Remove a aresta (u, v); as extremidades descem para uma cor menor se puderem.
+
+        Args:
+            u: Primeira extremidade.
+            v: Segunda extremidade.
+        """
+        with self._lock:
+            if v not in self.adjacency[u]:
+                return
+            self.adjacency[u].discard(v)
+            self.adjacency[v].discard(u)
+            for a, b in ((u, v), (v, u)):
+                counts = self.neighbor_color_counts[a]
+                counts[self.colors[b]] -= 1
+                if not counts[self.colors[b]]:
+                    del counts[self.colors[b]]
+            for w in (u, v):
+                color = self._smallest_free_color(w)
+                if color < self.colors[w]:
+                    self._set_color(w, color)
+
+    def compact(self, max_steps: int = None) -> int:
+        """
+        Tenta eliminar a maior cor movendo seus vértices para cores menores.
+
+        Cada vértice da maior classe recebe a menor cor livre ou passa por uma
+        troca de Kempe. Repete enquanto alguma classe for esvaziada.
+
+        Args:
+            max_steps: Número máximo de vértices processados (None = sem limite).
+        Returns:
+            Número de cores eliminadas.
+        """
+        removed = 0
+        steps = 0
+        while True:
+            with self._lock:
+                if self.num_colors <= 1:
+                    return removed
+                top = max(self.class_sizes)
+                members = [v for v, c in enumerate(self.colors) if c == top]
+                for vertex in members:
+                    if max_steps is not None and steps >= max_steps:
+                        return removed
+                    steps += 1
+                    color = self._smallest_free_color(vertex)
+                    if color < top:
+                        self._set_color(vertex, color)
+                    else:
+                        self._try_kempe(vertex, top, max_chain=len(self.colors))
+                if top in self.class_sizes:
+                    return removed
+                removed += 1
+
+    def start_background_compaction(self, interval: float = 1.0, max_steps: int = 1000):
+        """
+        Executa `compact` periodicamente em uma thread daemon.
+
+        Args:
+            interval: Intervalo entre passadas, em segundos.
+            max_steps: Vértices processados por passada.
+        """
+        if self._compactor is not None:
+            return
+        stop = threading.Event()
+
+        def loop():
+            while not stop.wait(interval):
+                self.compact(max_steps)
+
+        self._compactor = (threading.Thread(target=loop, daemon=True), stop)
+        self._compactor[0].start()
+
+    def stop_background_compaction(self):
+        """Interrompe a compactação em segundo plano, se estiver ativa."""
+        if self._compactor is not None:
+            thread, stop = self._compactor
+            stop.set()
+            thread.join()
+            self._compactor = None
+
+    def is_valid(self) -> bool:
+        """Verifica se nenhuma aresta liga vértices da mesma cor."""
+        return all(self.colors[u] != self.colors[v] for u in range(len(self.colors)) for v in self.adjacency[u])
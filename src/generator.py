@@ -0,0 +1,172 @@
+import math
+import random
+from array import array
+from .csr import CSRBuilder, INDEX_TYPECODE
+
+# Peso máximo das arestas geradas (pesos uniformes em 1..MAX_WEIGHT)
+MAX_WEIGHT = 15
+
+
+def resolve_rng(seed=None):
+    """
+    Converte a semente recebida em um gerador de números aleatórios.
+
+    Args:
+        seed: None (usa o gerador global do módulo `random`), um inteiro
+            ou uma instância de `random.Random`.
+    Returns:
+        Objeto com a interface de `random.Random`.
+    """
+    if seed is None:
+        return random
+    if isinstance(seed, random.Random):
+        return seed
+    return random.Random(seed)
+
+
+def random_graph_edges(num_vertices: int, density: float, seed=None):
+    """
+    Gera em fluxo as arestas de um grafo aleatório conexo G(n, p).
+
+    Primeiro é sorteada uma árvore geradora aleatória (n - 1 arestas), que
+    garante a conexidade. Em seguida cada par restante entra com
+    probabilidade `density`, sorteando diretamente o salto geométrico até o
+    próximo par escolhido (Batagelj & Brandes). O tempo é O(n + m) e a lista
+    de todos os n(n-1)/2 pares nunca é materializada.
+
+    Args:
+        num_vertices: Número de vértices.
+        density: Probabilidade de adicionar arestas extras além da árvore.
+        seed: Semente ou instância de `random.Random` (ver `resolve_rng`).
+    Returns:
+        Gerador de tuplas (u, v, w).
+    """
+    rng = resolve_rng(seed)
+    n = num_vertices
+
+    # Árvore geradora aleatória; as arestas são guardadas como u * n + v (u < v)
+    vertices = list(range(n))
+    rng.shuffle(vertices)
+    tree_edges = set()
+    for i in range(1, n):
+        u = vertices[i]
+        v = vertices[rng.randint(0, i - 1)]
+        w = rng.randint(1, MAX_WEIGHT)
+        tree_edges.add(min(u, v) * n + max(u, v))
+        yield (u, v, w)
+
+    if density <= 0:
+        return
+    if density >= 1:
+        for v in range(1, n):
+            for u in range(v):
+                if u * n + v not in tree_edges:
+                    yield (u, v, rng.randint(1, MAX_WEIGHT))
+        return
+
+    # Amostragem por saltos geométricos sobre os pares (u, v) com u < v
+    log_q = math.log(1.0 - density)
+    v, u = 1, -1
+    while v < n:
+        u += 1 + int(math.log(1.0 - rng.random()) / log_q)
+        while u >= v and v < n:
+            u -= v
+            v += 1
+        if v < n and u * n + v not in tree_edges:
+            yield (u, v, rng.randint(1, MAX_WEIGHT))
+
+
+def generate_into(sink, num_vertices: int, density: float, seed=None):
+    """
+    Gera um grafo aleatório escrevendo as arestas diretamente em `sink`.
+
+    Args:
+        sink: Destino com método `add_edge(u, v, w)` (ex.: CSRBuilder, EdgeFileWriter).
+        num_vertices: Número de vértices.
+        density: Probabilidade de adicionar arestas extras além da árvore.
+        seed: Semente ou instância de `random.Random`.
+    Returns:
+        O próprio `sink`.
+    """
+    for u, v, w in random_graph_edges(num_vertices, density, seed):
+        sink.add_edge(u, v, w)
+    return sink
+
+
+def generate_csr_graph(num_vertices: int, density: float, seed=None):
+    """
+    Gera um grafo aleatório conexo diretamente no formato CSR.
+
+    Args:
+        num_vertices: Número de vértices.
+        density: Probabilidade de adicionar arestas extras além da árvore.
+        seed: Semente ou instância de `random.Random`.
+    Returns:
+        Instância de CSRGraph.
+    """
+    return generate_into(CSRBuilder(num_vertices), num_vertices, density, seed).build()
+
+
+class EdgeFileWriter:
+    """
+    Destino em disco: grava arestas como triplas int32 (u, v, w) em binário.
+
+    As arestas são acumuladas em um buffer de tamanho fixo e descarregadas
+    em blocos, de forma que a memória usada não depende do tamanho do grafo.
+    """
+
+    def __init__(self, path: str, buffer_edges: int = 1 << 16):
+        """
+        Args:
+            path: Caminho do arquivo de saída.
+            buffer_edges: Número de arestas mantidas em memória antes de gravar.
+        """
+        self.path = path
+        self.num_edges = 0
+        self._buffer = array(INDEX_TYPECODE)
+        self._limit = 3 * buffer_edges
+        self._file = open(path, "wb")
+
+    def add_edge(self, u: int, v: int, w: int = 1):
+        """Acrescenta a aresta (u, v, w) ao arquivo."""
+        self._buffer.extend((u, v, w))
+        self.num_edges += 1
+        if len(self._buffer) >= self._limit:
+            self.flush()
+
+    def flush(self):
+        """Grava no disco as arestas pendentes no buffer."""
+        self._buffer.tofile(self._file)
+        self._buffer = array(INDEX_TYPECODE)
+
+    def close(self):
+        """Grava as arestas pendentes e fecha o arquivo."""
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_edge_file(path: str, chunk_edges: int = 1 << 16):
+    """
+    Lê em blocos um arquivo gravado por `EdgeFileWriter`.
+
+    Args:
+        path: Caminho do arquivo de arestas.
+        chunk_edges: Número de arestas lidas por bloco.
+    Returns:
+        Gerador de tuplas (u, v, w).
+    """
+    with open(path, "rb") as f:
+        while True:
+            chunk = array(INDEX_TYPECODE)
+            chunk.frombytes(f.read(12 * chunk_edges))
+            if not chunk:
+                return
+            for i in range(0, len(chunk), 3):
+                yield (chunk[i], chunk[i + 1], chunk[i + 2])
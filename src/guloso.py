@@ -1,60 +1,24 @@
-import random
-import networkx as nx
-import matplotlib.pyplot as plt
+import colorsys
+import heapq
 import time
 import tracemalloc
+from typing import NamedTuple
+from .csr import CSRGraph
+from .generator import random_graph_edges
+from . import metrics
 
 # Lista de cores disponíveis para os vértices
 colors = ["red", "green", "blue", "yellow", "purple", "orange", "pink", "brown", "gray", "cyan"]
 
-# --- Estrutura Union-Find ---
-class UnionFind:
-    """
-    Estrutura de dados Union-Find para detecção de ciclos em grafos.
-    Implementa compressão de caminho e união por rank para otimização.
-    """
-    
-    def __init__(self, size: int):
-        """
-        Inicializa a estrutura Union-Find com `size` elementos.
-        Args:
-            size: Número de elementos (vértices) no grafo.
-        """
-        self.parent = list(range(size))
-        self.rank = [0] * size
-    
-    def find(self, u: int) -> int:
-        """
-        Encontra a raiz do conjunto ao qual `u` pertence, com compressão de caminho.
-        Args:
-            u: Elemento a ser encontrado.
-        Returns:
-            Raiz do conjunto de `u`.
-        """
-        if self.parent[u] != u:
-            self.parent[u] = self.find(self.parent[u])  # Compressão de caminho
-        return self.parent[u]
-    
-    def union(self, u: int, v: int) -> bool:
-        """
-        Une os conjuntos de `u` e `v`, se eles não estiverem no mesmo conjunto.
-        Args:
-            u: Primeiro elemento.
-            v: Segundo elemento.
-        Returns:
-            True se a união foi realizada, False se já estavam no mesmo conjunto.
-        """
-        u_root = self.find(u)
-        v_root = self.find(v)
-        if u_root == v_root:
-            return False
-        if self.rank[u_root] < self.rank[v_root]:
-            self.parent[u_root] = v_root
-        else:
-            self.parent[v_root] = u_root
-            if self.rank[u_root] == self.rank[v_root]:
-                self.rank[u_root] += 1  # União por rank
-        return True
+# Nomes reexportados de `mst`, carregados (com o NumPy) apenas no primeiro uso
+_MST_NAMES = ("UnionFind", "kruskal", "build_mst_adjacency_list")
+
+
+def __getattr__(name: str):
+    if name in _MST_NAMES:
+        from . import mst
+        return getattr(mst, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # --- Classe Graph ---
 class Graph:
@@ -68,7 +32,7 @@ class Graph:
         """
         self._vertices = []
         self._edges = []
-        self._adjacency_list = {}
+        self._adjacency_list = None
     
     def get_vertices(self) -> list:
         """
@@ -92,103 +56,64 @@ class Graph:
         """
         Retorna a lista de adjacência do grafo.
         
+        A lista é montada sob demanda a partir das arestas; os algoritmos de
+        coloração devem preferir `CSRGraph.from_graph`, que é mais compacto.
+
         Returns:
             Dicionário onde as chaves são vértices e os valores são listas de tuplas (vizinho, peso).
         """
+        if self._adjacency_list is None:
+            self._adjacency_list = {v: [] for v in self._vertices}
+            for u, v, w in self._edges:
+                self._adjacency_list[u].append((v, w))
+                self._adjacency_list[v].append((u, w))
         return self._adjacency_list
     
-    def generate_graph(self, num_vertices: int, density: float):
+    def generate_graph(self, num_vertices: int, density: float, seed=None):
         """
         Gera um grafo aleatório conexo com base na densidade de arestas.
 
+        Usa o gerador em fluxo de `random_graph_edges`: uma árvore geradora
+        aleatória garante a conexidade e as arestas extras são sorteadas por
+        saltos geométricos, em tempo O(n + m).
+
         Args:
             num_vertices: Número de vértices.
             density: Probabilidade de adicionar arestas extras além da árvore mínima.
+            seed: Semente ou instância de `random.Random`, para execuções reproduzíveis.
         """
         self._vertices = list(range(num_vertices))
-        self._edges = []
-        self._adjacency_list = {i: [] for i in range(num_vertices)}
-        
-        # Cria uma árvore geradora aleatória para garantir conexidade (n - 1 arestas)
-        vertices = list(range(num_vertices))
-        random.shuffle(vertices)
-        for i in range(1, num_vertices):
-            u = vertices[i]
-            v = vertices[random.randint(0, i - 1)]
-            w = random.randint(1, 15)
-            self._edges.append((u, v, w))
-            self._adjacency_list[u].append((v, w))
-            self._adjacency_list[v].append((u, w))
-
-        # Tenta adicionar arestas extras com base na densidade
-        possible_edges = [(i, j) for i in range(num_vertices) for j in range(i + 1, num_vertices)]
-        used_edges = {(min(u, v), max(u, v)) for u, v, _ in self._edges}
-        
-        for u, v in possible_edges:
-            if (u, v) not in used_edges and random.random() < density:
-                w = random.randint(1, 15)
-                self._edges.append((u, v, w))
-                self._adjacency_list[u].append((v, w))
-                self._adjacency_list[v].append((u, w))
+        self._edges = list(random_graph_edges(num_vertices, density, seed))
+        self._adjacency_list = None
 
 
 # --- Funções Auxiliares ---
-def kruskal(graph: Graph) -> list:
-    """
-    Aplica o algoritmo de Kruskal para encontrar a Árvore Geradora Mínima (MST) do grafo.
-    
-    Args:
-        graph: Instância da classe Graph representando o grafo.
-    Returns:
-        Lista de arestas da MST, cada uma como uma tupla (u, v, w).
-    """
-    num_vertices = len(graph.get_vertices())
-    edges = sorted(graph.get_edges(), key=lambda x: x[2])  # Ordena as arestas pelo peso
-    
-    uf = UnionFind(num_vertices)
-    mst = []
-    for u, v, w in edges:
-        print(f"Verificando aresta {u} - {v} : {w}")
-        if uf.union(u, v):
-            mst.append((u, v, w))
-    return mst
-
-def build_mst_adjacency_list(mst: list, num_vertices: int) -> dict:
-    """
-    Constrói a lista de adjacência para a MST a partir da lista de arestas da MST.
-    
-    Args:
-        mst: Lista de arestas da MST.
-        num_vertices: Número de vértices no grafo.
-    Returns:
-        Dicionário representando a lista de adjacência da MST.
-    """
-    adj_list = {i: [] for i in range(num_vertices)}
-    for u, v, _ in mst:
-        adj_list[u].append(v)
-        adj_list[v].append(u)
-    return adj_list
-
-
 def greedy_coloring(adjacency_list: dict, colors: list) -> list:
     """
     Realiza a coloração gulosa dos vértices com base na lista de adjacência.
     
     Args:
-        adjacency_list: Lista de adjacência do grafo.
+        adjacency_list: Lista de adjacência do grafo (dicionário ou CSRGraph).
         colors: Lista de cores disponíveis.
     Returns:
         Lista onde cada elemento é a cor atribuída ao vértice correspondente.
     """
     num_vertices = len(adjacency_list)
     vertex_colors = [None] * num_vertices
+    stats = metrics.current()
     for vertex in range(num_vertices):
-        used_colors = {vertex_colors[neighbor] for neighbor in adjacency_list[vertex] 
+        neighbors = adjacency_list[vertex]
+        used_colors = {vertex_colors[neighbor] for neighbor in neighbors
                        if vertex_colors[neighbor] is not None}
-        for color in colors:
+        tried = 0
+        for tried, color in enumerate(colors, 1):
             if color not in used_colors:
                 vertex_colors[vertex] = color
                 break
+        if stats is not None:
+            stats.expand(vertex + 1)
+            stats.is_safe_calls += len(neighbors)
+            stats.colors_tried += tried
     return vertex_colors
 
 
@@ -197,82 +122,267 @@ def greedy_coloring_by_degree(adjacency_list: dict, colors: list) -> list:
     vertex_degrees = [(v, len(adjacency_list[v])) for v in range(num_vertices)]
     sorted_vertices = [v for v, _ in sorted(vertex_degrees, key=lambda x: x[1], reverse=True)]
     vertex_colors = [None] * num_vertices
-    for vertex in sorted_vertices:
-        used_colors = {vertex_colors[neighbor] for neighbor in adjacency_list[vertex] 
+    stats = metrics.current()
+    for depth, vertex in enumerate(sorted_vertices, 1):
+        neighbors = adjacency_list[vertex]
+        used_colors = {vertex_colors[neighbor] for neighbor in neighbors
                        if vertex_colors[neighbor] is not None}
-        for color in colors:
+        tried = 0
+        for tried, color in enumerate(colors, 1):
             if color not in used_colors:
                 vertex_colors[vertex] = color
                 break
+        if stats is not None:
+            stats.expand(depth)
+            stats.is_safe_calls += len(neighbors)
+            stats.colors_tried += tried
     return vertex_colors
 
-def executar_guloso():
-    """Executa experimentos do algoritmo guloso"""
+def dsatur_coloring(adjacency_list) -> tuple:
+    """
+    Coloração DSatur: colore primeiro o vértice de maior grau de saturação
+    (número de cores distintas entre os vizinhos), desempatando pelo grau.
+
+    A escolha do próximo vértice usa um heap com remoção preguiçosa: cada
+    mudança de saturação insere uma nova entrada e entradas desatualizadas
+    são descartadas ao sair do heap. Cada passo custa O(log n) e o total é
+    O((n + m) log n), sem varrer os vértices não coloridos.
+
+    Args:
+        adjacency_list: Lista de adjacência do grafo (dicionário ou CSRGraph).
+    Returns:
+        Tupla (cores, num_cores), onde `cores[v]` é a cor inteira (0, 1, ...) do vértice `v`.
+    """
+    num_vertices = len(adjacency_list)
+    vertex_colors = [-1] * num_vertices
+    neighbor_colors = [set() for _ in range(num_vertices)]
+    degrees = [len(adjacency_list[v]) for v in range(num_vertices)]
+    heap = [(0, -degrees[v], v) for v in range(num_vertices)]
+    heapq.heapify(heap)
+    num_colors = 0
+    depth = 0
+    stats = metrics.current()
+
+    while heap:
+        neg_saturation, _, vertex = heapq.heappop(heap)
+        # Entrada desatualizada: vértice já colorido ou saturação mudou
+        if vertex_colors[vertex] != -1 or -neg_saturation != len(neighbor_colors[vertex]):
+            continue
+
+        used_colors = neighbor_colors[vertex]
+        color = 0
+        while color in used_colors:
+            color += 1
+        vertex_colors[vertex] = color
+        if color == num_colors:
+            num_colors += 1
+        neighbor_colors[vertex] = None  # Não é mais necessário
+
+        for neighbor in adjacency_list[vertex]:
+            if vertex_colors[neighbor] == -1 and color not in neighbor_colors[neighbor]:
+                neighbor_colors[neighbor].add(color)
+                heapq.heappush(heap, (-len(neighbor_colors[neighbor]), -degrees[neighbor], neighbor))
+        if stats is not None:
+            depth += 1
+            stats.expand(depth)
+            stats.is_safe_calls += degrees[vertex]
+            stats.colors_tried += color + 1
+
+    return vertex_colors, num_colors
+
+
+def smallest_last_order(adjacency_list) -> tuple:
+    """
+    Ordem de remoção do menor último (degenerescência) em O(n + m).
+
+    Usa baldes de grau (Batagelj–Zaversnik): vértices ficam num array
+    ordenado por grau corrente e, ao remover o de menor grau, cada vizinho de
+    grau maior troca de posição com o primeiro do seu balde e desce um grau.
+
+    Args:
+        adjacency_list: Lista de adjacência do grafo (dicionário ou CSRGraph).
+    Returns:
+        Tupla (ordem de remoção, degenerescência). Colorir na ordem inversa
+        usa no máximo degenerescência + 1 cores.
+    """
+    num_vertices = len(adjacency_list)
+    degree = [len(adjacency_list[v]) for v in range(num_vertices)]
+    max_degree = max(degree, default=0)
+    bucket_start = [0] * (max_degree + 1)
+    for d in degree:
+        bucket_start[d] += 1
+    start = 0
+    for d in range(max_degree + 1):
+        start, bucket_start[d] = start + bucket_start[d], start
+    position = [0] * num_vertices
+    order = [0] * num_vertices
+    for v in range(num_vertices):
+        position[v] = bucket_start[degree[v]]
+        order[position[v]] = v
+        bucket_start[degree[v]] += 1
+    for d in range(max_degree, 0, -1):
+        bucket_start[d] = bucket_start[d - 1]
+    bucket_start[0] = 0
+
+    degeneracy = 0
+    for i in range(num_vertices):
+        v = order[i]
+        dv = degree[v]
+        if dv > degeneracy:
+            degeneracy = dv
+        for u in adjacency_list[v]:
+            du = degree[u]
+            if du > dv:
+                # Troca `u` com o primeiro vértice do seu balde e desce um grau
+                first = bucket_start[du]
+                w = order[first]
+                if u != w:
+                    pu = position[u]
+                    order[pu] = w
+                    order[first] = u
+                    position[w] = pu
+                    position[u] = first
+                bucket_start[du] = first + 1
+                degree[u] = du - 1
+    return order, degeneracy
+
+
+class GreedyResult(NamedTuple):
+    """Resultado de um coloridor guloso com cores inteiras."""
+    colors: list
+    num_colors: int
+    degeneracy: int
+
+
+def smallest_last_coloring(adjacency_list) -> GreedyResult:
+    """
+    Coloração gulosa na ordem do menor último, com paleta inteira ilimitada.
+
+    A menor cor livre de cada vértice é achada com um único array de
+    carimbos reutilizado (`stamp[c] == v` marca a cor `c` como usada por um
+    vizinho de `v`), sem criar conjuntos por vértice. O total é O(n + m) e o
+    número de cores nunca passa de degenerescência + 1; use `nomes_cores`
+    para converter as cores em nomes só na saída.
+
+    Args:
+        adjacency_list: Lista de adjacência do grafo (dicionário ou CSRGraph).
+    Returns:
+        GreedyResult (cores, num_cores, degenerescência); é uma tupla, então
+        `cores, k = resultado[:2]` também funciona.
+    """
+    order, degeneracy = smallest_last_order(adjacency_list)
+    num_vertices = len(adjacency_list)
+    vertex_colors = [-1] * num_vertices
+    stamp = [-1] * (degeneracy + 2)
+    num_colors = 0
+    stats = metrics.current()
+    for depth, vertex in enumerate(reversed(order), 1):
+        neighbors = adjacency_list[vertex]
+        for neighbor in neighbors:
+            color = vertex_colors[neighbor]
+            if color >= 0:
+                stamp[color] = vertex
+        color = 0
+        while stamp[color] == vertex:
+            color += 1
+        vertex_colors[vertex] = color
+        if color == num_colors:
+            num_colors += 1
+        if stats is not None:
+            stats.expand(depth)
+            stats.is_safe_calls += len(neighbors)
+            stats.colors_tried += color + 1
+
+    return GreedyResult(vertex_colors, num_colors, degeneracy)
+
+
+def nomes_cores(cores: list, paleta: list = None) -> list:
+    """
+    Converte cores inteiras em nomes, sem limite de cores.
+
+    As primeiras cores usam os nomes de `paleta` (padrão: `colors`); as
+    demais recebem tons hexadecimais espaçados pela razão áurea.
+
+    Args:
+        cores: Cores inteiras por vértice (-1 ou None = sem cor).
+        paleta: Nomes das primeiras cores.
+    Returns:
+        Lista com o nome de cada cor (None para vértices sem cor).
+    """
+    paleta = colors if paleta is None else paleta
+    nomes = {}
+
+    def nome(cor):
+        if cor not in nomes:
+            if cor < len(paleta):
+                nomes[cor] = paleta[cor]
+            else:
+                r, g, b = colorsys.hsv_to_rgb((cor * 0.618033988749895) % 1.0, 0.65, 0.9)
+                nomes[cor] = f"#{int(r * 255):02x}{int(g * 255):02x}{int(b * 255):02x}"
+        return nomes[cor]
+
+    return [None if cor is None or cor < 0 else nome(cor) for cor in cores]
+
+
+def _executar_experimentos(titulo: str, colorir, seed: int = 0) -> list:
+    """
+    Executa um experimento de coloração para cada tamanho de grafo.
+
+    O grafo é gerado (com semente `seed + vértices`, igual para todos os
+    algoritmos) antes da janela de medição, que cobre apenas a coloração.
+
+    Args:
+        titulo: Nome do algoritmo exibido no cabeçalho da tabela.
+        colorir: Função que recebe o grafo (CSRGraph) e o colore.
+        seed: Semente base dos grafos gerados.
+    Returns:
+        Lista de tuplas (vértices, tempo em ms, pico de memória em bytes).
+    """
     tamanhos_grafos = [10, 15, 20, 25, 50]
     resultados = []
     
-    print("\n🚀 Iniciando experimentos de coloração de grafos (Guloso)...")
+    print(f"\n🚀 Iniciando experimentos de coloração de grafos ({titulo})...")
     print("| Vértices | Tempo (ms) | Memória (KB) |")
     print("|----------|------------|--------------|")
     
     for num_vertices in tamanhos_grafos:
-        inicio_tempo = time.perf_counter()
-        tracemalloc.start()
-        
-        graph = Graph()
-        graph.generate_graph(num_vertices, 0.4)
+        with metrics.phase("generation"):
+            graph = Graph()
+            graph.generate_graph(num_vertices, 0.4, seed=seed + num_vertices)
+
+        # CORREÇÃO: Usar o grafo original (não a MST), em formato compacto
+        with metrics.phase("conversion"):
+            csr = CSRGraph.from_graph(graph)
         
-        # CORREÇÃO: Usar o grafo original (não a MST)
-        adj_list = graph.get_adjacency_list()
-        # Remover pesos das arestas
-        adj_list_unweighted = {
-            v: [neighbor for neighbor, _ in neighbors] 
-            for v, neighbors in adj_list.items()
-        }
-        vertex_colors = greedy_coloring(adj_list_unweighted, colors)
+        tracemalloc.start()
+        inicio_tempo = time.perf_counter()
+        with metrics.phase("solve"):
+            colorir(csr)
+        tempo = (time.perf_counter() - inicio_tempo) * 1000
         
         memoria = tracemalloc.get_traced_memory()[1]
         tracemalloc.stop()
-        tempo = (time.perf_counter() - inicio_tempo) * 1000
         
         resultados.append((num_vertices, tempo, memoria))
         print(f"| {num_vertices:8d} | {tempo:9.2f} | {memoria/1024:11.2f} |")
     
     return resultados
 
-def executar_guloso_por_grau():
+def executar_guloso():
     """Executa experimentos do algoritmo guloso"""
-    tamanhos_grafos = [10, 15, 20, 25, 50]
-    resultados = []
-    
-    print("\n🚀 Iniciando experimentos de coloração de grafos (Guloso)...")
-    print("| Vértices | Tempo (ms) | Memória (KB) |")
-    print("|----------|------------|--------------|")
-    
-    for num_vertices in tamanhos_grafos:
-        inicio_tempo = time.perf_counter()
-        tracemalloc.start()
-        
-        graph = Graph()
-        graph.generate_graph(num_vertices, 0.4)
-        
-        # CORREÇÃO: Usar o grafo original (não a MST)
-        adj_list = graph.get_adjacency_list()
-        # Remover pesos das arestas
-        adj_list_unweighted = {
-            v: [neighbor for neighbor, _ in neighbors] 
-            for v, neighbors in adj_list.items()
-        }
-        vertex_colors = greedy_coloring_by_degree(adj_list_unweighted, colors)
-        
-        memoria = tracemalloc.get_traced_memory()[1]
-        tracemalloc.stop()
-        tempo = (time.perf_counter() - inicio_tempo) * 1000
-        
-        resultados.append((num_vertices, tempo, memoria))
-        print(f"| {num_vertices:8d} | {tempo:9.2f} | {memoria/1024:11.2f} |")
-    
-    return resultados
+    return _executar_experimentos("Guloso", lambda csr: greedy_coloring(csr, colors))
+
+def executar_guloso_por_grau():
+    """Executa experimentos do algoritmo guloso por grau"""
+    return _executar_experimentos("Guloso por Grau", lambda csr: greedy_coloring_by_degree(csr, colors))
+
+def executar_dsatur():
+    """Executa experimentos do algoritmo DSatur"""
+    return _executar_experimentos("DSatur", dsatur_coloring)
+
+def executar_menor_ultimo():
+    """Executa experimentos do guloso na ordem do menor último"""
+    return _executar_experimentos("Menor Último", smallest_last_coloring)
 
 
 if __name__ == "__main__":
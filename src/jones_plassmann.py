@@ -0,0 +1,118 @@
+import numpy as np
+from .csr import CSRGraph
+from . import metrics
+
+
+def csr_arrays(graph) -> tuple:
+    """
+    Expõe os arrays CSR de um grafo como arrays NumPy, sem cópia.
+
+    Args:
+        graph: Lista de adjacência (dicionário ou CSRGraph).
+    Returns:
+        Tupla (offsets, neighbors, degrees) de arrays NumPy.
+    """
+    graph = CSRGraph.from_adjacency(graph)
+    offsets = np.frombuffer(graph.offsets, dtype=np.int64)
+    neighbors = np.frombuffer(graph.neighbors, dtype=np.int32)
+    return offsets, neighbors, np.diff(offsets)
+
+
+def _gather_edges(vertices: np.ndarray, offsets: np.ndarray, degrees: np.ndarray) -> tuple:
+    """
+    Posições, no array de vizinhos, de todas as arestas de `vertices`.
+
+    Returns:
+        Tupla (donos, posições): o vértice de origem e a posição de cada aresta.
+    """
+    lengths = degrees[vertices]
+    total = int(lengths.sum())
+    owners = np.repeat(vertices, lengths)
+    shifts = np.repeat(offsets[vertices] - (np.cumsum(lengths) - lengths), lengths)
+    return owners, shifts + np.arange(total)
+
+
+def _smallest_free_colors(owners: np.ndarray, neighbor_colors: np.ndarray, vertices: np.ndarray,
+                          num_vertices: int) -> np.ndarray:
+    """
+    Menor cor não usada pelos vizinhos, para cada vértice de `vertices`.
+
+    Os pares (vértice, cor do vizinho) são ordenados e deduplicados; em cada
+    grupo, a primeira posição cuja cor difere do posto é a lacuna procurada.
+    """
+    result = np.zeros(num_vertices, dtype=np.int64)
+    colored = neighbor_colors >= 0
+    if not colored.any():
+        return result[vertices]
+    stride = int(neighbor_colors.max()) + 2
+    keys = np.sort(owners[colored].astype(np.int64) * stride + neighbor_colors[colored])
+    keys = keys[np.r_[True, keys[1:] != keys[:-1]]]
+    owner, color = keys // stride, keys % stride
+
+    group_start = np.flatnonzero(np.r_[True, owner[1:] != owner[:-1]])
+    group_size = np.diff(np.r_[group_start, len(keys)])
+    rank = np.arange(len(keys)) - np.repeat(group_start, group_size)
+
+    # Sem lacuna: a cor livre é o tamanho do grupo
+    result[owner[group_start]] = group_size
+    gaps = color != rank
+    gap_owner, gap_rank = owner[gaps], rank[gaps]
+    first = np.ones(len(gap_owner), dtype=bool)
+    first[1:] = gap_owner[1:] != gap_owner[:-1]
+    result[gap_owner[first]] = gap_rank[first]
+    return result[vertices]
+
+
+def jones_plassmann_coloring(graph, seed=None) -> tuple:
+    """
+    Coloração gulosa em lotes (Jones–Plassmann) vetorizada com NumPy.
+
+    Cada vértice recebe a prioridade `grau + U(0, 1)` (maior grau primeiro,
+    desempate aleatório). A cada rodada, todos os vértices não coloridos cuja
+    prioridade supera a de todos os vizinhos não coloridos formam um conjunto
+    independente e são coloridos juntos com a menor cor livre. O laço em
+    Python executa uma iteração por rodada, não por vértice.
+
+    Args:
+        graph: Lista de adjacência (dicionário ou CSRGraph).
+        seed: Semente do desempate aleatório.
+    Returns:
+        Tupla (cores, num_cores), com cores inteiras por vértice.
+    """
+    offsets, neighbors, degrees = csr_arrays(graph)
+    num_vertices = len(degrees)
+    priority = degrees + np.random.default_rng(seed).random(num_vertices)
+    vertex_colors = np.full(num_vertices, -1, dtype=np.int64)
+
+    # Cada aresta é orientada uma única vez, da menor para a maior prioridade;
+    # enquanto o destino estiver sem cor, a origem não pode ser colorida
+    edge_src = np.repeat(np.arange(num_vertices, dtype=np.int32), degrees)
+    forward = priority[edge_src] < priority[neighbors]
+    edge_src, edge_dst = edge_src[forward], neighbors[forward]
+    uncolored = np.ones(num_vertices, dtype=bool)
+    stats = metrics.current()
+    rounds = 0
+
+    while uncolored.any():
+        rounds += 1
+        # Máximos locais: nenhuma aresta ativa saindo do vértice
+        selected = uncolored.copy()
+        selected[edge_src] = False
+        vertices = np.flatnonzero(selected)
+
+        owners, positions = _gather_edges(vertices, offsets, degrees)
+        vertex_colors[vertices] = _smallest_free_colors(
+            owners, vertex_colors[neighbors[positions]], vertices, num_vertices)
+
+        uncolored[vertices] = False
+        active = uncolored[edge_dst]
+        edge_src, edge_dst = edge_src[active], edge_dst[active]
+
+    if stats is not None:
+        # Profundidade = número de rodadas (o caminho crítico do lote)
+        stats.nodes += num_vertices
+        stats.colors_tried += num_vertices
+        stats.is_safe_calls += len(neighbors)
+        stats.max_depth = max(stats.max_depth, rounds)
+    num_colors = int(vertex_colors.max()) + 1 if num_vertices else 0
+    return vertex_colors.tolist(), num_colors
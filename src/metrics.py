@@ -0,0 +1,124 @@
+import time
+from contextlib import contextmanager, nullcontext
+
+# Coletor ativo; None significa instrumentação desligada
+_active = None
+_NO_PHASE = nullcontext()
+
+
+class SolverMetrics:
+    """
+    Contadores de busca e cronômetros de fase de uma execução.
+
+    Os coloridores leem o coletor ativo uma única vez (`current()`) e só
+    incrementam contadores quando ele existe; com a instrumentação desligada o
+    custo é um teste `is not None` por nó. A cada `interval` nós expandidos,
+    `callback(snapshot)` recebe uma cópia dos valores, para envio a um sistema
+    de métricas externo.
+    """
+
+    __slots__ = ("nodes", "backtracks", "is_safe_calls", "colors_tried", "max_depth",
+                 "phases", "callback", "interval", "_next_report")
+
+    def __init__(self, callback=None, interval: int = 10_000):
+        """
+        Args:
+            callback: Função chamada com `snapshot()` durante a busca e ao fim de cada fase.
+            interval: Número de nós expandidos entre chamadas do callback.
+        """
+        self.callback = callback
+        self.interval = interval
+        self.reset()
+
+    def reset(self):
+        """Zera contadores e cronômetros."""
+        self.nodes = 0
+        self.backtracks = 0
+        self.is_safe_calls = 0
+        self.colors_tried = 0
+        self.max_depth = 0
+        self.phases = {}
+        self._next_report = self.interval
+
+    def expand(self, depth: int):
+        """Registra a expansão de um nó na profundidade `depth`."""
+        self.nodes += 1
+        if depth > self.max_depth:
+            self.max_depth = depth
+        if self.callback is not None and self.nodes >= self._next_report:
+            self._next_report += self.interval
+            self.callback(self.snapshot())
+
+    @contextmanager
+    def phase(self, name: str):
+        """Acumula o tempo gasto no bloco sob o nome da fase."""
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+            if self.callback is not None:
+                self.callback(self.snapshot())
+
+    def snapshot(self) -> dict:
+        """Cópia dos contadores e dos tempos de fase (em ms)."""
+        result = {
+            "nodes": self.nodes,
+            "backtracks": self.backtracks,
+            "is_safe_calls": self.is_safe_calls,
+            "colors_tried": self.colors_tried,
+            "max_depth": self.max_depth,
+        }
+        for name, seconds in self.phases.items():
+            result[f"{name}_ms"] = seconds * 1000
+        return result
+
+
+def current() -> SolverMetrics:
+    """Coletor ativo, ou None se a instrumentação está desligada."""
+    return _active
+
+
+def enable(callback=None, interval: int = 10_000) -> SolverMetrics:
+    """
+    Liga a instrumentação com um coletor novo.
+
+    Args:
+        callback: Gancho de progresso (ver `SolverMetrics`).
+        interval: Nós expandidos entre chamadas do gancho.
+    Returns:
+        O coletor ativo.
+    """
+    global _active
+    _active = SolverMetrics(callback, interval)
+    return _active
+
+
+def disable():
+    """Desliga a instrumentação."""
+    global _active
+    _active = None
+
+
+@contextmanager
+def instrumented(callback=None, interval: int = 10_000):
+    """
+    Ativa a instrumentação dentro do bloco e restaura o estado anterior ao sair.
+
+    Exemplo:
+        with instrumented() as metrics:
+            backtracking_coloring(grafo, 10)
+        print(metrics.snapshot())
+    """
+    global _active
+    previous = _active
+    metrics = enable(callback, interval)
+    try:
+        yield metrics
+    finally:
+        _active = previous
+
+
+def phase(name: str):
+    """Cronômetro de fase do coletor ativo; não faz nada se estiver desligado."""
+    return _active.phase(name) if _active is not None else _NO_PHASE
@@ -0,0 +1,179 @@
+import numpy as np
+from .csr import CSRGraph
+
+# Acima desta densidade (m / (n(n-1)/2)) o Prim O(n²) supera o Kruskal
+DENSE_THRESHOLD = 0.25
+# Memória máxima da matriz n x n (float64) do Prim: 32 MB, ou seja, até 2048 vértices
+DENSE_MAX_BYTES = 32 << 20
+
+
+# --- Estrutura Union-Find ---
+class UnionFind:
+    """
+    Estrutura Union-Find sobre listas planas de inteiros (indexação mais
+    rápida que a de `array`, o que pesa no laço do Kruskal).
+
+    `find` é iterativo com divisão de caminho (path halving), portanto não
+    há recursão nem risco de estouro de pilha em cadeias longas.
+    """
+
+    def __init__(self, size: int):
+        """
+        Inicializa a estrutura Union-Find com `size` elementos.
+        Args:
+            size: Número de elementos (vértices) no grafo.
+        """
+        self.parent = list(range(size))
+        self.rank = [0] * size
+
+    def find(self, u: int) -> int:
+        """
+        Encontra a raiz do conjunto ao qual `u` pertence.
+        Args:
+            u: Elemento a ser encontrado.
+        Returns:
+            Raiz do conjunto de `u`.
+        """
+        parent = self.parent
+        while parent[u] != u:
+            parent[u] = parent[parent[u]]  # Divisão de caminho
+            u = parent[u]
+        return u
+
+    def union(self, u: int, v: int) -> bool:
+        """
+        Une os conjuntos de `u` e `v`, se eles não estiverem no mesmo conjunto.
+        Args:
+            u: Primeiro elemento.
+            v: Segundo elemento.
+        Returns:
+            True se a união foi realizada, False se já estavam no mesmo conjunto.
+        """
+        u_root = self.find(u)
+        v_root = self.find(v)
+        if u_root == v_root:
+            return False
+        if self.rank[u_root] < self.rank[v_root]:
+            self.parent[u_root] = v_root
+        else:
+            self.parent[v_root] = u_root
+            if self.rank[u_root] == self.rank[v_root]:
+                self.rank[u_root] += 1  # União por rank
+        return True
+
+
+def edge_arrays(graph) -> tuple:
+    """
+    Extrai as arestas do grafo como arrays NumPy (u, v, w), uma vez cada.
+
+    Args:
+        graph: Instância de Graph ou CSRGraph.
+    Returns:
+        Tupla (num_vertices, u, v, w).
+    """
+    if isinstance(graph, CSRGraph):
+        offsets = np.frombuffer(graph.offsets, dtype=np.int64)
+        neighbors = np.frombuffer(graph.neighbors, dtype=np.int32)
+        weights = np.frombuffer(graph.weights, dtype=np.int32)
+        src = np.repeat(np.arange(graph.num_vertices, dtype=np.int32), np.diff(offsets))
+        once = src < neighbors
+        return graph.num_vertices, src[once], neighbors[once], weights[once]
+    edges = np.array(graph.get_edges(), dtype=np.int64).reshape(-1, 3)
+    return len(graph.get_vertices()), edges[:, 0], edges[:, 1], edges[:, 2]
+
+
+def kruskal_arrays(num_vertices: int, u: np.ndarray, v: np.ndarray, w: np.ndarray) -> list:
+    """
+    Kruskal sobre arrays de arestas: ordenação por `argsort` dos pesos e
+    `UnionFind.union` ligado a uma variável local, sem E/S por aresta.
+
+    Args:
+        num_vertices: Número de vértices.
+        u: Primeira extremidade de cada aresta.
+        v: Segunda extremidade de cada aresta.
+        w: Peso de cada aresta.
+    Returns:
+        Lista de arestas da MST, cada uma como uma tupla (u, v, w).
+    """
+    order = np.argsort(w, kind="stable")
+    union = UnionFind(num_vertices).union
+    mst = []
+    remaining = num_vertices - 1
+    for x, y, weight in zip(u[order].tolist(), v[order].tolist(), w[order].tolist()):
+        if not union(x, y):
+            continue
+        mst.append((x, y, weight))
+        remaining -= 1
+        if remaining <= 0:
+            break
+    return mst
+
+
+def prim_dense(num_vertices: int, u: np.ndarray, v: np.ndarray, w: np.ndarray) -> list:
+    """
+    Prim O(n²) sobre a matriz de pesos, indicado para grafos densos.
+
+    Cada iteração escolhe, com operações vetorizadas, o vértice fora da
+    árvore mais barato de alcançar. Em grafos desconexos produz uma floresta.
+
+    Args:
+        num_vertices: Número de vértices.
+        u: Primeira extremidade de cada aresta.
+        v: Segunda extremidade de cada aresta.
+        w: Peso de cada aresta.
+    Returns:
+        Lista de arestas da MST, cada uma como uma tupla (u, v, w).
+    """
+    matrix = np.full((num_vertices, num_vertices), np.inf)
+    np.minimum.at(matrix, (u, v), w)
+    np.minimum.at(matrix, (v, u), w)
+
+    in_tree = np.zeros(num_vertices, dtype=bool)
+    best_cost = np.full(num_vertices, np.inf)
+    best_from = np.full(num_vertices, -1, dtype=np.int64)
+    mst = []
+    for _ in range(num_vertices):
+        candidates = np.where(in_tree, np.inf, best_cost)
+        vertex = int(np.argmin(candidates))
+        if np.isinf(candidates[vertex]):
+            vertex = int(np.argmin(in_tree))  # Início de um novo componente
+        elif best_from[vertex] >= 0:
+            mst.append((int(best_from[vertex]), vertex, int(best_cost[vertex])))
+        in_tree[vertex] = True
+        closer = matrix[vertex] < best_cost
+        best_cost[closer] = matrix[vertex][closer]
+        best_from[closer] = vertex
+    return mst
+
+
+def kruskal(graph) -> list:
+    """
+    Encontra a Árvore Geradora Mínima (MST) do grafo.
+
+    Usa Kruskal vetorizado e troca automaticamente para o Prim O(n²) quando
+    o grafo é denso (como os de densidade 0.4 dos experimentos) e a matriz de
+    pesos cabe em `DENSE_MAX_BYTES`.
+
+    Args:
+        graph: Instância de Graph ou CSRGraph representando o grafo.
+    Returns:
+        Lista de arestas da MST, cada uma como uma tupla (u, v, w).
+    """
+    num_vertices, u, v, w = edge_arrays(graph)
+    max_edges = num_vertices * (num_vertices - 1) / 2
+    if 8 * num_vertices ** 2 <= DENSE_MAX_BYTES and max_edges and len(w) / max_edges >= DENSE_THRESHOLD:
+        return prim_dense(num_vertices, u, v, w)
+    return kruskal_arrays(num_vertices, u, v, w)
+
+
+def build_mst_adjacency_list(mst: list, num_vertices: int) -> CSRGraph:
+    """
+    Constrói a MST diretamente no formato compacto (CSR).
+
+    Args:
+        mst: Lista de arestas da MST.
+        num_vertices: Número de vértices no grafo.
+    Returns:
+        CSRGraph da MST; `grafo[v]` devolve os vizinhos de `v` na árvore.
+    """
+    return CSRGraph.from_edges(num_vertices, mst)
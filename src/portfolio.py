@@ -0,0 +1,108 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from .backtracking import SearchResult, anytime_coloring
+from .csr import CSRGraph
+
+# Estado de cada processo do portfólio, preenchido por `_init_worker`
+_worker = {}
+
+
+def _init_worker(shm_name: str, num_vertices: int, num_entries: int, best_k, best_coloring, stop):
+    """
+    Anexa o processo ao grafo em memória compartilhada e aos sinais do portfólio.
+
+    Args:
+        shm_name: Nome do bloco de memória compartilhada com o grafo CSR.
+        num_vertices: Número de vértices.
+        num_entries: Tamanho do array de vizinhos.
+        best_k: `Value` com o melhor número de cores conhecido.
+        best_coloring: `Array` com a melhor coloração conhecida.
+        stop: `Event` que cancela os processos restantes.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    _worker["shm"] = shm  # Mantém o bloco aberto enquanto o processo viver
+    _worker["graph"] = CSRGraph.from_buffer(shm.buf, num_vertices, num_entries)
+    _worker["best_k"] = best_k
+    _worker["best_coloring"] = best_coloring
+    _worker["stop"] = stop
+
+
+def _publish(k: int, coloring: list):
+    """Divulga uma coloração se ela melhora o melhor resultado compartilhado."""
+    best_k = _worker["best_k"]
+    with best_k.get_lock():
+        if k < best_k.value:
+            _worker["best_coloring"][:] = coloring
+            best_k.value = k
+
+
+def _portfolio_worker(seed, node_budget: int, time_limit: float) -> SearchResult:
+    """Executa uma configuração do portfólio sobre o grafo compartilhado."""
+    stop = _worker["stop"]
+    best_k = _worker["best_k"]
+    if stop.is_set():
+        return None
+    result = anytime_coloring(
+        _worker["graph"], node_budget=node_budget, time_limit=time_limit, seed=seed,
+        should_stop=stop.is_set, on_solution=_publish, external_bound=lambda: best_k.value,
+    )
+    if result.lower_bound >= best_k.value:
+        stop.set()  # Prova de otimalidade: cancela os demais
+    return result
+
+
+def portfolio_coloring(adjacency_list, workers: int = None, node_budget: int = None,
+                       time_limit: float = None) -> SearchResult:
+    """
+    Coloração exata em portfólio: várias buscas com ordens diferentes em paralelo.
+
+    O grafo é copiado uma única vez para memória compartilhada e cada processo
+    o lê sem cópia. A primeira configuração (sem semente) usa o desempate por
+    grau; as demais usam ordens aleatórias com sementes distintas. Cada melhoria
+    é divulgada a todos por um `Value` compartilhado, que limita as buscas
+    restantes; a primeira prova de otimalidade cancela os outros processos.
+
+    Args:
+        adjacency_list: Lista de adjacência do grafo (dicionário ou CSRGraph).
+        workers: Número de processos (padrão: número de CPUs).
+        node_budget: Orçamento de nós de cada processo.
+        time_limit: Prazo de cada processo, em segundos.
+    Returns:
+        SearchResult com a melhor coloração do portfólio; `nodes` é a soma dos nós.
+    """
+    graph = CSRGraph.from_adjacency(adjacency_list)
+    num_vertices = graph.num_vertices
+    workers = workers or multiprocessing.cpu_count()
+    context = multiprocessing.get_context()
+
+    shm = shared_memory.SharedMemory(create=True, size=max(graph.nbytes, 1))
+    try:
+        graph.write_into(shm.buf)
+        best_k = context.Value("i", num_vertices + 1)
+        best_coloring = context.Array("i", num_vertices, lock=False)
+        stop = context.Event()
+        initargs = (shm.name, num_vertices, len(graph.neighbors), best_k, best_coloring, stop)
+
+        lower_bound = 0
+        nodes = 0
+        with ProcessPoolExecutor(workers, mp_context=context, initializer=_init_worker,
+                                 initargs=initargs) as executor:
+            seeds = [None] + list(range(1, workers))
+            futures = [executor.submit(_portfolio_worker, seed, node_budget, time_limit) for seed in seeds]
+            for future in as_completed(futures):
+                result = future.result()
+                if result is None:
+                    continue
+                nodes += result.nodes
+                lower_bound = max(lower_bound, result.lower_bound)
+                if lower_bound >= best_k.value:
+                    stop.set()
+            stop.set()
+
+        num_colors = best_k.value
+        coloring = list(best_coloring)
+    finally:
+        shm.close()
+        shm.unlink()
+    return SearchResult(num_colors, coloring, num_colors <= lower_bound, nodes, lower_bound)
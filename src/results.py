@@ -1,154 +1,291 @@
-import matplotlib.pyplot as plt
-import seaborn as sns
+import hashlib
 import os
-import networkx as nx
 import random
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 from .backtracking import backtracking_coloring
+from .csr import CSRGraph
 from .guloso import greedy_coloring, greedy_coloring_by_degree, colors
 
-# Configuração de estilo para gráficos modernos
-sns.set_theme(style="whitegrid", palette="pastel")
-plt.rcParams.update({
-    'font.size': 12,
-    'axes.titlesize': 16,
-    'axes.labelsize': 14,
-    'xtick.labelsize': 12,
-    'ytick.labelsize': 12,
-    'legend.fontsize': 12,
-    'figure.figsize': (12, 8),
-    'figure.dpi': 120
-})
+# A partir deste número de vértices o grafo é desenhado no modo "grande":
+# layout espectral em NumPy, arestas rasterizadas e sem rótulos
+LIMITE_GRAFO_GRANDE = 500
 
-def plotar_comparativo_tempo(vertices, tempo_backtracking, tempo_guloso, caminho):
-    """Gráfico comparativo de tempo de execução"""
+_estilo_configurado = False
+# Layouts já calculados, indexados pelo conteúdo do grafo
+_cache_layouts = {}
+
+def _pyplot():
+    """Importa o matplotlib e aplica o estilo dos gráficos no primeiro uso"""
+    global _estilo_configurado
+    import matplotlib.pyplot as plt
+    if not _estilo_configurado:
+        import seaborn as sns
+
+        # Configuração de estilo para gráficos modernos
+        sns.set_theme(style="whitegrid", palette="pastel")
+        plt.rcParams.update({
+            'font.size': 12,
+            'axes.titlesize': 16,
+            'axes.labelsize': 14,
+            'xtick.labelsize': 12,
+            'ytick.labelsize': 12,
+            'legend.fontsize': 12,
+            'figure.figsize': (12, 8),
+            'figure.dpi': 120
+        })
+        _estilo_configurado = True
+    return plt
+
+def _iniciar_renderizador():
+    """Inicializa os processos de renderização sem interface gráfica"""
+    import matplotlib
+    matplotlib.use("Agg")
+
+def arestas_do_grafo(G) -> tuple:
+    """
+    Extrai as arestas de um grafo networkx, CSRGraph ou lista de arestas (u, v, w).
+
+    Returns:
+        Tupla (num_vertices, u, v) com as arestas como arrays NumPy.
+    """
+    if isinstance(G, CSRGraph):
+        offsets = np.frombuffer(G.offsets, dtype=np.int64)
+        vizinhos = np.frombuffer(G.neighbors, dtype=np.int32)
+        origem = np.repeat(np.arange(G.num_vertices, dtype=np.int32), np.diff(offsets))
+        uma_vez = origem < vizinhos
+        return G.num_vertices, origem[uma_vez], vizinhos[uma_vez]
+    arestas = np.array([(a, b) for a, b, *_ in G.edges()], dtype=np.int64).reshape(-1, 2)
+    return G.number_of_nodes(), arestas[:, 0], arestas[:, 1]
+
+def layout_espectral(num_vertices, u, v, iteracoes=300, seed=42):
+    """
+    Layout espectral em O(arestas) por iteração, para grafos grandes.
+
+    Usa iteração em bloco sobre a matriz de adjacência normalizada
+    (I + D^-1/2 A D^-1/2) / 2; os dois autovetores seguintes ao trivial dão
+    as coordenadas. Não depende do SciPy.
+    """
+    grau = np.bincount(u, minlength=num_vertices) + np.bincount(v, minlength=num_vertices)
+    raiz_grau = np.sqrt(np.maximum(grau, 1)).astype(float)
+    rng = np.random.default_rng(seed)
+    bloco = np.column_stack([raiz_grau, rng.standard_normal((num_vertices, 2))])
+    bloco, _ = np.linalg.qr(bloco)
+    for _ in range(iteracoes):
+        escalado = bloco / raiz_grau[:, None]
+        produto = np.empty_like(bloco)
+        for coluna in range(3):
+            x = escalado[:, coluna]
+            produto[:, coluna] = (np.bincount(u, weights=x[v], minlength=num_vertices)
+                                  + np.bincount(v, weights=x[u], minlength=num_vertices))
+        bloco, _ = np.linalg.qr((bloco + produto / raiz_grau[:, None]) / 2)
+    pos = bloco[:, 1:] / raiz_grau[:, None]
+    pos -= pos.mean(axis=0)
+    escala = np.abs(pos).max()
+    return pos / escala if escala > 0 else pos
+
+def calcular_layout(num_vertices, u, v):
+    """
+    Calcula (uma única vez por grafo) as posições dos vértices.
+
+    Grafos pequenos usam o `spring_layout` do networkx com semente fixa;
+    grafos com `LIMITE_GRAFO_GRANDE` vértices ou mais usam `layout_espectral`.
+
+    Returns:
+        Array (num_vertices, 2) com as coordenadas.
+    """
+    resumo = hashlib.blake2b(np.int64(num_vertices).tobytes(), digest_size=16)
+    resumo.update(np.ascontiguousarray(u, dtype=np.int64).tobytes())
+    resumo.update(np.ascontiguousarray(v, dtype=np.int64).tobytes())
+    chave = resumo.digest()
+    if chave not in _cache_layouts:
+        if num_vertices >= LIMITE_GRAFO_GRANDE:
+            pos = layout_espectral(num_vertices, u, v)
+        else:
+            import networkx as nx
+            G = nx.Graph()
+            G.add_nodes_from(range(num_vertices))
+            G.add_edges_from(zip(u.tolist(), v.tolist()))
+            posicoes = nx.spring_layout(G, seed=42)
+            pos = np.array([posicoes[vertice] for vertice in range(num_vertices)]).reshape(-1, 2)
+        _cache_layouts[chave] = pos
+    return _cache_layouts[chave]
+
+def desenhar_grafo(ax, pos, u, v, cores, rotulos_arestas=None):
+    """
+    Desenha o grafo com uma única coleção de linhas e um único scatter.
+
+    No modo grande as arestas e os vértices são rasterizados e os rótulos
+    omitidos, de forma que o custo não cresce com artistas por aresta.
+    """
+    from matplotlib.collections import LineCollection
+
+    grande = len(pos) >= LIMITE_GRAFO_GRANDE
+    segmentos = np.stack([pos[u], pos[v]], axis=1)
+    ax.add_collection(LineCollection(segmentos, colors="black", alpha=0.2 if grande else 0.5,
+                                     linewidths=0.3 if grande else 1.0, rasterized=grande, zorder=1))
+    ax.scatter(pos[:, 0], pos[:, 1], c=list(cores), s=4 if grande else 500,
+               linewidths=0, rasterized=grande, zorder=2)
+    if not grande:
+        for vertice, (x, y) in enumerate(pos):
+            ax.text(x, y, str(vertice), ha="center", va="center", fontsize=12, zorder=3)
+        if rotulos_arestas is not None:
+            for a, b, rotulo in zip(u.tolist(), v.tolist(), rotulos_arestas):
+                meio = (pos[a] + pos[b]) / 2
+                ax.text(meio[0], meio[1], str(rotulo), ha="center", va="center", fontsize=9, zorder=3,
+                        bbox={"boxstyle": "round", "fc": "white", "ec": "none", "alpha": 0.8})
+    ax.autoscale_view()
+    ax.axis('off')
+
+def _figura_grafo(pos, u, v, cores, titulo, caminho):
+    """Renderiza e grava a figura de um grafo colorido"""
+    plt = _pyplot()
+    fig, ax = plt.subplots(figsize=(10, 8))
+    desenhar_grafo(ax, pos, u, v, cores)
+    ax.set_title(titulo, fontsize=16, pad=20)
+    fig.savefig(caminho, bbox_inches='tight', dpi=120)
+    plt.close(fig)
+
+def _figura_tempo(vertices, series, caminho):
+    """Gráfico de linhas do tempo de execução; `series` é [(rótulo, tempos, marcador)]"""
+    plt = _pyplot()
     plt.figure(figsize=(12, 8))
-    
-    plt.plot(vertices, tempo_backtracking, 'o-', label='Backtracking Puro', linewidth=3, markersize=10)
-    plt.plot(vertices, tempo_guloso, 's-', label='Algoritmo Guloso', linewidth=3, markersize=10)
-    
+    for rotulo, tempos, marcador in series:
+        plt.plot(vertices, tempos, marcador, label=rotulo, linewidth=3, markersize=10)
     plt.title('Comparação de Tempo de Execução', fontsize=20, pad=20)
     plt.xlabel('Número de Vértices', fontsize=16, labelpad=15)
     plt.ylabel('Tempo (ms)', fontsize=16, labelpad=15)
     plt.legend(fontsize=14)
     plt.grid(True, alpha=0.3)
-    
     plt.savefig(caminho, bbox_inches='tight', dpi=120)
     plt.close()
 
-def plotar_comparativo_memoria(vertices, mem_backtracking, mem_guloso, caminho):
-    """Gráfico comparativo de uso de memória"""
+def _figura_memoria(vertices, series, caminho):
+    """Gráfico de barras agrupadas do uso de memória; `series` é [(rótulo, memórias)]"""
+    plt = _pyplot()
     plt.figure(figsize=(12, 8))
-    
-    width = 0.35
+    width = 0.7 / len(series)
     x = range(len(vertices))
-    
-    plt.bar([i - width/2 for i in x], mem_backtracking, width, label='Backtracking Puro', alpha=0.8)
-    plt.bar([i + width/2 for i in x], mem_guloso, width, label='Algoritmo Guloso', alpha=0.8)
-    
+    for indice, (rotulo, memorias) in enumerate(series):
+        deslocamento = (indice - (len(series) - 1) / 2) * width
+        plt.bar([i + deslocamento for i in x], memorias, width, label=rotulo, alpha=0.8)
     plt.title('Comparação de Uso de Memória', fontsize=20, pad=20)
     plt.xlabel('Número de Vértices', fontsize=16, labelpad=15)
     plt.ylabel('Memória (KB)', fontsize=16, labelpad=15)
     plt.xticks(x, vertices)
     plt.legend(fontsize=14)
-    
     plt.savefig(caminho, bbox_inches='tight', dpi=120)
     plt.close()
 
+def renderizar_figuras(tarefas, workers=None):
+    """
+    Renderiza figuras independentes em paralelo.
+
+    Args:
+        tarefas: Lista de tuplas (função, argumentos) com funções de nível de módulo.
+        workers: Número de processos (padrão: número de CPUs; 1 = no próprio processo).
+    """
+    workers = min(workers or os.cpu_count() or 1, len(tarefas))
+    if workers <= 1:
+        for funcao, argumentos in tarefas:
+            funcao(*argumentos)
+        return
+    with ProcessPoolExecutor(max_workers=workers, initializer=_iniciar_renderizador) as pool:
+        for futuro in [pool.submit(funcao, *argumentos) for funcao, argumentos in tarefas]:
+            futuro.result()
+
+def plotar_comparativo_tempo(vertices, tempo_backtracking, tempo_guloso, caminho):
+    """Gráfico comparativo de tempo de execução"""
+    _figura_tempo(vertices, [('Backtracking Puro', tempo_backtracking, 'o-'),
+                             ('Algoritmo Guloso', tempo_guloso, 's-')], caminho)
+
+def plotar_comparativo_memoria(vertices, mem_backtracking, mem_guloso, caminho):
+    """Gráfico comparativo de uso de memória"""
+    _figura_memoria(vertices, [('Backtracking Puro', mem_backtracking),
+                               ('Algoritmo Guloso', mem_guloso)], caminho)
+
 def plotar_exemplo_grafo(G, colors, titulo, caminho):
-    """Plota um exemplo de grafo colorido"""
-    plt.figure(figsize=(10, 8))
-    pos = nx.spring_layout(G, seed=42)
-    
-    nx.draw_networkx_nodes(G, pos, node_color=colors, node_size=500)
-    nx.draw_networkx_edges(G, pos, alpha=0.5)
-    nx.draw_networkx_labels(G, pos)
-    
-    plt.title(titulo, fontsize=16, pad=20)
-    plt.axis('off')
-    plt.savefig(caminho, bbox_inches='tight', dpi=120)
-    plt.close()
+    """Plota um exemplo de grafo colorido (o layout é calculado uma vez por grafo)"""
+    num_vertices, u, v = arestas_do_grafo(G)
+    _figura_grafo(calcular_layout(num_vertices, u, v), u, v, colors, titulo, caminho)
 
 def gerar_grafo_exemplo(num_vertices=8, densidade=0.4):
     """Gera um grafo de exemplo para visualização"""
+    import networkx as nx
     G = nx.Graph()
     G.add_nodes_from(range(num_vertices))
-    
+
     for i in range(num_vertices):
         for j in range(i + 1, num_vertices):
             if random.random() < densidade:
                 G.add_edge(i, j)
-    
+
     return G
 
-def salvar_resultados(resultados_backtracking, resultados_guloso1, resultados_guloso2):
-    """Salva e plota os resultados comparativos"""
+def salvar_resultados(resultados_backtracking, resultados_guloso1, resultados_guloso2, workers=None):
+    """
+    Salva e plota os resultados comparativos.
+
+    As colorações e o layout do grafo de exemplo são calculados uma única vez
+    neste processo; as cinco figuras, independentes, são renderizadas em
+    paralelo por `renderizar_figuras`.
+    """
     pasta_resultados = 'results'
     os.makedirs(pasta_resultados, exist_ok=True)
-    
+
     print("\n📊 Gerando gráficos comparativos...")
-    
+
     # Gerar exemplos visuais
     print("Gerando exemplos visuais dos algoritmos...")
     G = gerar_grafo_exemplo()
-    
-    # Converter grafo para formato adequado
-    adj_list = {n: list(G.neighbors(n)) for n in G.nodes()}
-    
+
+    # Converter grafo para o formato compacto (CSR)
+    adj_list = CSRGraph.from_edges(G.number_of_nodes(), ((u, v, 1) for u, v in G.edges()))
+    num_vertices, u, v = arestas_do_grafo(G)
+    pos = calcular_layout(num_vertices, u, v)
+    tarefas = []
+
     # Colorir com backtracking
     cores_bt = backtracking_coloring(adj_list, len(colors))
     if cores_bt:
-        plotar_exemplo_grafo(G, cores_bt, 
-                           'Exemplo de Coloração - Backtracking',
-                           os.path.join(pasta_resultados, 'exemplo_backtracking.png'))
-    
+        tarefas.append((_figura_grafo, (pos, u, v, cores_bt,
+                                        'Exemplo de Coloração - Backtracking',
+                                        os.path.join(pasta_resultados, 'exemplo_backtracking.png'))))
+
     # Colorir com algoritmo guloso
     cores_guloso = greedy_coloring(adj_list, colors)
-    plotar_exemplo_grafo(G, cores_guloso, 
-                        'Exemplo de Coloração - Gulosoem em Ordem',
-                        os.path.join(pasta_resultados, 'exemplo_guloso.png'))
-    
+    tarefas.append((_figura_grafo, (pos, u, v, cores_guloso,
+                                    'Exemplo de Coloração - Gulosoem em Ordem',
+                                    os.path.join(pasta_resultados, 'exemplo_guloso.png'))))
+
     # Colorir com algoritmo guloso por grau
     cores_guloso_grau = greedy_coloring_by_degree(adj_list, colors)
-    plotar_exemplo_grafo(G, cores_guloso_grau, 
-                        'Exemplo de Coloração - Guloso por Grau',
-                        os.path.join(pasta_resultados, 'exemplo_guloso_grau.png'))    
+    tarefas.append((_figura_grafo, (pos, u, v, cores_guloso_grau,
+                                    'Exemplo de Coloração - Guloso por Grau',
+                                    os.path.join(pasta_resultados, 'exemplo_guloso_grau.png'))))
 
     # Gerar gráficos de desempenho
     vertices = [r[0] for r in resultados_backtracking]
     tempo_back = [r[1] for r in resultados_backtracking]
     mem_back = [r[2]/1024 for r in resultados_backtracking]
-    
+
     tempo_guloso = [r[1] for r in resultados_guloso1]
     mem_guloso = [r[2]/1024 for r in resultados_guloso1]
-    
+
     tempo_guloso_grau = [r[1] for r in resultados_guloso2]
     mem_guloso_grau = [r[2]/1024 for r in resultados_guloso2]
-    
-    print("Salvando gráficos de desempenho...")
+
     # Gráfico de tempo
-    plt.figure(figsize=(12, 8))
-    plt.plot(vertices, tempo_back, 'o-', label='Backtracking Puro', linewidth=3, markersize=10)
-    plt.plot(vertices, tempo_guloso, 's-', label='Algoritmo Guloso', linewidth=3, markersize=10)
-    plt.plot(vertices, tempo_guloso_grau, 'd-', label='Guloso por Grau', linewidth=3, markersize=10)
-    plt.title('Comparação de Tempo de Execução', fontsize=20, pad=20)
-    plt.xlabel('Número de Vértices', fontsize=16, labelpad=15)
-    plt.ylabel('Tempo (ms)', fontsize=16, labelpad=15)
-    plt.legend(fontsize=14)
-    plt.grid(True, alpha=0.3)
-    plt.savefig(os.path.join(pasta_resultados, 'comparativo_tempo.png'), bbox_inches='tight', dpi=120)
-    plt.close()
-    
+    tarefas.append((_figura_tempo, (vertices, [('Backtracking Puro', tempo_back, 'o-'),
+                                               ('Algoritmo Guloso', tempo_guloso, 's-'),
+                                               ('Guloso por Grau', tempo_guloso_grau, 'd-')],
+                                    os.path.join(pasta_resultados, 'comparativo_tempo.png'))))
+
     # Gráfico de memória
-    plt.figure(figsize=(12, 8))
-    width = 0.25
-    x = range(len(vertices))
-    plt.bar([i - width for i in x], mem_back, width, label='Backtracking Puro', alpha=0.8)
-    plt.bar(x, mem_guloso, width, label='Guloso em Ordem', alpha=0.8)
-    plt.bar([i + width for i in x], mem_guloso_grau, width, label='Guloso por Grau', alpha=0.8)
-    plt.title('Comparação de Uso de Memória', fontsize=20, pad=20)
-    plt.xlabel('Número de Vértices', fontsize=16, labelpad=15)
-    plt.ylabel('Memória (KB)', fontsize=16, labelpad=15)
-    plt.xticks(x, vertices)
-    plt.legend(fontsize=14)
-    plt.savefig(os.path.join(pasta_resultados, 'comparativo_memoria.png'), bbox_inches='tight', dpi=120)
-    plt.close()
+    tarefas.append((_figura_memoria, (vertices, [('Backtracking Puro', mem_back),
+                                                 ('Guloso em Ordem', mem_guloso),
+                                                 ('Guloso por Grau', mem_guloso_grau)],
+                                      os.path.join(pasta_resultados, 'comparativo_memoria.png'))))
+
+    print("Salvando gráficos de desempenho...")
+    renderizar_figuras(tarefas, workers)
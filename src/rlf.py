@@ -0,0 +1,119 @@
+import numpy as np
+from .jones_plassmann import csr_arrays
+from . import metrics
+
+# Entradas CSR convertidas em bits de cada vez (limita os temporários)
+EDGE_BLOCK = 1 << 20
+
+
+def adjacency_bitsets(offsets: np.ndarray, neighbors: np.ndarray, num_vertices: int) -> np.ndarray:
+    """
+    Matriz de adjacência em bits: linha `v` tem o bit `w` ligado se {v, w} é aresta.
+
+    O vértice `w` é o bit `w % 64` da palavra `w // 64` (uint64); a matriz
+    ocupa n² / 8 bytes.
+
+    Args:
+        offsets: Deslocamentos CSR (ver `csr_arrays`).
+        neighbors: Vizinhos CSR.
+        num_vertices: Número de vértices.
+    Returns:
+        Array uint64 de forma (n, ceil(n / 64)).
+    """
+    words = (num_vertices + 63) >> 6
+    rows = np.zeros((num_vertices, words), dtype=np.uint64)
+    flat = rows.reshape(-1)
+    first = 0
+    while first < num_vertices:
+        last = int(np.searchsorted(offsets, offsets[first] + EDGE_BLOCK, side="right")) - 1
+        last = min(max(last, first + 1), num_vertices)
+        targets = neighbors[offsets[first]:offsets[last]].astype(np.int64)
+        owners = np.repeat(np.arange(first, last, dtype=np.int64), np.diff(offsets[first:last + 1]))
+        np.bitwise_or.at(flat, owners * words + (targets >> 6),
+                         np.left_shift(np.uint64(1), (targets & 63).astype(np.uint64)))
+        first = last
+    return rows
+
+
+def _members(bitset: np.ndarray, num_vertices: int) -> np.ndarray:
+    """Índices dos bits ligados de um conjunto em bits."""
+    return np.flatnonzero(np.unpackbits(bitset.view(np.uint8), bitorder="little")[:num_vertices])
+
+
+def rlf_coloring(graph) -> tuple:
+    """
+    Coloração Recursive Largest First (Leighton), uma classe de cor por vez.
+
+    Cada classe é um conjunto independente maximal construído sobre os
+    vértices ainda sem cor. Começa pelo vértice de maior grau entre eles e,
+    enquanto houver candidatos (sem cor e não adjacentes à classe), acrescenta
+    o candidato com mais vizinhos em W, os vértices sem cor adjacentes à
+    classe; o empate fica com o de menos vizinhos entre os candidatos.
+
+    Candidatos, W e vértices sem cor são conjuntos de bits uint64,
+    atualizados por AND/OR com a linha do vértice escolhido. As contagens
+    da seleção saem de um `bitwise_count` sobre as linhas dos candidatos
+    (as do desempate, só sobre os empatados), 64 vértices por palavra, em
+    vez de percorrer vizinhos. O grau entre os vértices sem cor é
+    decrementado por classe, somando os bits das linhas da classe
+    recém-fechada.
+
+    Args:
+        graph: Lista de adjacência (dicionário ou CSRGraph).
+    Returns:
+        Tupla (lista de cores inteiras, número de cores).
+    """
+    offsets, neighbors, degrees = csr_arrays(graph)
+    num_vertices = len(degrees)
+    rows = adjacency_bitsets(offsets, neighbors, num_vertices)
+    colors = np.full(num_vertices, -1, dtype=np.int64)
+    uncolored_degree = degrees.astype(np.int64)
+    uncolored = np.packbits(np.ones(num_vertices, dtype=bool), bitorder="little")
+    uncolored = np.concatenate((uncolored, np.zeros(8 * rows.shape[1] - len(uncolored), dtype=np.uint8)))
+    uncolored = uncolored.view(np.uint64)
+    stats = metrics.current()
+
+    color = 0
+    remaining = num_vertices
+    while remaining:
+        members = _members(uncolored, num_vertices)
+        vertex = members[np.argmax(uncolored_degree[members])]
+        candidates = uncolored.copy()
+        adjacent = np.zeros_like(uncolored)
+        color_class = []
+        while True:
+            color_class.append(vertex)
+            colors[vertex] = color
+            candidates &= ~rows[vertex]
+            candidates[vertex >> 6] &= ~np.uint64(1 << (int(vertex) & 63))
+            adjacent |= rows[vertex] & uncolored
+            members = _members(candidates, num_vertices)
+            if not len(members):
+                break
+            candidate_rows = rows[members]
+            into_adjacent = np.bitwise_count(np.bitwise_and(candidate_rows, adjacent, out=candidate_rows))
+            into_adjacent = into_adjacent.sum(axis=1, dtype=np.int64)
+            tied = members[into_adjacent == into_adjacent.max()]
+            if len(tied) > 1:
+                # Desempate só entre os empatados: menos vizinhos entre os candidatos
+                into_candidates = np.bitwise_count(rows[tied] & candidates).sum(axis=1, dtype=np.int64)
+                vertex = tied[np.argmin(into_candidates)]
+            else:
+                vertex = tied[0]
+            if stats is not None:
+                stats.is_safe_calls += len(members)
+
+        # Fecha a classe: sai do conjunto sem cor e dos graus dos vizinhos
+        color_class = np.asarray(color_class)
+        for member in color_class.tolist():
+            uncolored[member >> 6] &= ~np.uint64(1 << (member & 63))
+        lost = np.unpackbits(rows[color_class].view(np.uint8), axis=1, bitorder="little")[:, :num_vertices]
+        uncolored_degree -= lost.sum(axis=0, dtype=np.int64)
+        del lost
+        remaining -= len(color_class)
+        color += 1
+        if stats is not None:
+            stats.nodes += len(color_class)
+            stats.colors_tried += 1
+            stats.max_depth = max(stats.max_depth, color)
+    return colors.tolist(), color
@@ -0,0 +1,474 @@
+import argparse
+import asyncio
+import hashlib
+import os
+import statistics
+import struct
+import time
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from .csr import CSRGraph
+
+# Requisição: assinatura, algoritmo, opções, reservado, id, prazo (ms, 0 = sem
+# prazo), vértices e arestas; seguem as arestas como pares int32 (u, v)
+REQUISICAO = struct.Struct("<4sBBHIIII")
+# Resposta: assinatura, id, status, reservado, número de cores e vértices;
+# com status OK seguem as cores como int32
+RESPOSTA = struct.Struct("<4sIBBHII")
+MAGIC = b"CLR1"
+
+ALGORITMOS_SERVICO = ("guloso", "guloso_grau", "backtracking", "dsatur", "menor_ultimo")
+# Algoritmos de custo exponencial: sem prazo na requisição, recebem `PRAZO_EXPONENCIAL_MS`
+ALGORITMOS_EXPONENCIAIS = ("backtracking",)
+PRAZO_EXPONENCIAL_MS = 10_000
+
+STATUS_OK = 0
+STATUS_PRAZO = 1
+STATUS_SEM_COLORACAO = 2
+STATUS_ERRO = 3
+
+# Maiores grafos aceitos: quadros acima disso são recusados (e a conexão
+# fechada) antes de o corpo ser lido
+MAX_VERTICES = 1 << 22
+MAX_ARESTAS = 1 << 24
+
+# Requisições com até este número de arestas são agrupadas em lotes
+LOTE_MAX_ARESTAS = 4096
+LOTE_MAX_REQUISICOES = 64
+# Espera máxima para completar um lote (segundos)
+LOTE_JANELA = 0.002
+
+
+def codificar_requisicao(id_requisicao: int, algoritmo: str, num_vertices: int, arestas, prazo_ms: int = 0) -> bytes:
+    """
+    Monta o quadro binário de uma requisição.
+
+    Args:
+        id_requisicao: Identificador devolvido na resposta.
+        algoritmo: Um dos nomes de `ALGORITMOS_SERVICO`.
+        num_vertices: Número de vértices.
+        arestas: Pares (u, v) ou triplas (u, v, w); cada aresta uma única vez.
+        prazo_ms: Prazo relativo em milissegundos (0 = sem prazo).
+    Returns:
+        Bytes do quadro.
+    """
+    corpo = array("i")
+    for aresta in arestas:
+        corpo.append(aresta[0])
+        corpo.append(aresta[1])
+    cabecalho = REQUISICAO.pack(MAGIC, ALGORITMOS_SERVICO.index(algoritmo), 0, 0, id_requisicao,
+                                prazo_ms, num_vertices, len(corpo) // 2)
+    return cabecalho + corpo.tobytes()
+
+
+def codificar_grafo(id_requisicao: int, algoritmo: str, grafo: CSRGraph, prazo_ms: int = 0) -> bytes:
+    """Como `codificar_requisicao`, a partir de um CSRGraph."""
+    return codificar_requisicao(id_requisicao, algoritmo, grafo.num_vertices, grafo.get_edges(), prazo_ms)
+
+
+async def ler_resposta(reader) -> tuple:
+    """
+    Lê um quadro de resposta.
+
+    Returns:
+        Tupla (id, status, num_cores, cores), com `cores` como lista de inteiros
+        (vazia quando o status não é OK).
+    """
+    magic, id_requisicao, status, _, _, num_cores, num_vertices = RESPOSTA.unpack(
+        await reader.readexactly(RESPOSTA.size))
+    if magic != MAGIC:
+        raise ValueError("Resposta com assinatura inválida")
+    cores = array("i")
+    if status == STATUS_OK:
+        cores.frombytes(await reader.readexactly(4 * num_vertices))
+    return id_requisicao, status, num_cores, cores.tolist()
+
+
+def _indices(cores: list) -> list:
+    """Converte nomes da lista `colors` em índices."""
+    from .guloso import colors
+    indice = {nome: i for i, nome in enumerate(colors)}
+    return [indice[cor] for cor in cores]
+
+
+class _PrazoExcedido(Exception):
+    pass
+
+
+def _resolver(algoritmo: int, num_vertices: int, corpo: bytes, limite: float = None) -> tuple:
+    """
+    Executado no processo de trabalho: monta o CSR e colore.
+
+    Com `limite` (instante absoluto em `time.time()`), a busca roda com o
+    gancho de progresso de `metrics`, que a interrompe quando o prazo vence;
+    assim uma solução exponencial não prende o processo além do prazo.
+
+    Returns:
+        Tupla (status, num_cores, cores como bytes int32).
+    """
+    if limite is not None:
+        if time.time() > limite:
+            return STATUS_PRAZO, 0, b""
+        from . import metrics
+
+        def verificar_prazo(_):
+            if time.time() > limite:
+                raise _PrazoExcedido
+
+        try:
+            with metrics.instrumented(callback=verificar_prazo, interval=1024):
+                return _resolver(algoritmo, num_vertices, corpo)
+        except _PrazoExcedido:
+            return STATUS_PRAZO, 0, b""
+
+    import numpy as np
+    from .backtracking import backtracking_coloring
+    from .guloso import colors, dsatur_coloring, greedy_coloring, greedy_coloring_by_degree, \
+        smallest_last_coloring
+
+    pares = np.frombuffer(corpo, dtype=np.int32).reshape(-1, 2)
+    grafo = CSRGraph.from_edge_arrays(num_vertices, pares[:, 0], pares[:, 1], dedupe=True)
+    nome = ALGORITMOS_SERVICO[algoritmo]
+    # Os gulosos usam paleta inteira ilimitada: sempre colorem todos os
+    # vértices, como DSatur e menor último; só o backtracking, preso às
+    # cores nomeadas, pode responder STATUS_SEM_COLORACAO
+    if nome == "guloso":
+        cores = greedy_coloring(grafo, range(num_vertices))
+    elif nome == "guloso_grau":
+        cores = greedy_coloring_by_degree(grafo, range(num_vertices))
+    elif nome == "backtracking":
+        resultado = backtracking_coloring(grafo, len(colors))
+        if resultado is None:
+            return STATUS_SEM_COLORACAO, 0, b""
+        cores = _indices(resultado)
+    elif nome == "dsatur":
+        cores = dsatur_coloring(grafo)[0]
+    else:
+        cores = smallest_last_coloring(grafo).colors
+    num_cores = len({cor for cor in cores if cor >= 0})
+    return STATUS_OK, num_cores, array("i", cores).tobytes()
+
+
+def _resolver_lote(tarefas: list) -> list:
+    """Resolve várias requisições pequenas em uma única ida ao processo de trabalho."""
+    resultados = []
+    for tarefa in tarefas:
+        try:
+            resultados.append(_resolver(*tarefa))
+        except Exception:
+            resultados.append((STATUS_ERRO, 0, b""))
+    return resultados
+
+
+class ServidorColoracao:
+    """
+    Servidor asyncio de coloração sobre TCP ou socket Unix.
+
+    Cada quadro de requisição traz o grafo como pares de arestas int32. As
+    soluções, que usam CPU, rodam em um pool de processos: requisições
+    pequenas esperam até `LOTE_JANELA` para formar um lote e vão juntas a um
+    processo; as grandes vão sozinhas. Respostas saem fora de ordem,
+    identificadas pelo id.
+
+    Pressão de retorno: cada requisição ocupa uma vaga de `max_pendentes` e a
+    conexão só lê o próximo quadro quando há vaga, de modo que clientes
+    rápidos demais são freados pela própria janela do TCP. Requisições com
+    prazo vencido recebem `STATUS_PRAZO` sem ocupar o pool; os algoritmos de
+    `ALGORITMOS_EXPONENCIAIS` sem prazo recebem `prazo_exponencial_ms`, para
+    que um grafo difícil não prenda um processo indefinidamente. Resultados
+    ficam num cache LRU indexado pelo hash do conteúdo (algoritmo + grafo).
+    Cabeçalhos com mais de `MAX_VERTICES` vértices ou `MAX_ARESTAS` arestas
+    fecham a conexão sem que o corpo seja lido.
+    """
+
+    def __init__(self, workers: int = None, max_pendentes: int = 256, tamanho_cache: int = 4096,
+                 prazo_exponencial_ms: int = PRAZO_EXPONENCIAL_MS):
+        """
+        Args:
+            workers: Processos do pool (padrão: número de CPUs).
+            max_pendentes: Requisições em andamento, no total, antes de parar de ler.
+            tamanho_cache: Número de resultados guardados no cache.
+            prazo_exponencial_ms: Prazo dos algoritmos exponenciais quando a
+                requisição não traz um (0 = sem prazo).
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pendentes = max_pendentes
+        self.tamanho_cache = tamanho_cache
+        self.prazo_exponencial_ms = prazo_exponencial_ms
+        self.cache = OrderedDict()
+        self.estatisticas = {"requisicoes": 0, "cache": 0, "lotes": 0, "prazo": 0}
+        self._pool = None
+        self._vagas = None
+        self._fila_lote = None
+        self._tarefas = set()
+        self._conexoes = set()
+        self._respostas = set()
+
+    async def iniciar(self, host: str = "127.0.0.1", porta: int = 8765, caminho_unix: str = None):
+        """Abre o pool e o socket; devolve o objeto `asyncio.Server`."""
+        self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        # Processos criados antes do socket: com `fork`, um processo criado
+        # depois herdaria as conexões já aceitas, que não fechariam mais
+        await asyncio.get_running_loop().run_in_executor(self._pool, os.getpid)
+        self._vagas = asyncio.Semaphore(self.max_pendentes)
+        self._fila_lote = asyncio.Queue()
+        self._tarefas.add(asyncio.create_task(self._agrupar()))
+        if caminho_unix is not None:
+            return await asyncio.start_unix_server(self._atender, path=caminho_unix)
+        return await asyncio.start_server(self._atender, host, porta)
+
+    async def encerrar(self, espera: float = 1.0):
+        """
+        Aguarda as requisições em andamento (até `espera` segundos), cancela
+        as que restarem, fecha as conexões e o agrupador e fecha o pool.
+
+        Conexões ociosas não são esperadas: sem requisições pendentes, o
+        encerramento é imediato.
+        """
+        if self._respostas:
+            await asyncio.wait(self._respostas, timeout=espera)
+        for tarefa in self._respostas | self._conexoes | self._tarefas:
+            tarefa.cancel()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+    async def _atender(self, reader, writer):
+        """Laço de uma conexão: lê quadros e dispara uma tarefa por requisição."""
+        conexao = asyncio.current_task()
+        self._conexoes.add(conexao)
+        pendentes = set()
+        try:
+            while True:
+                await self._vagas.acquire()
+                try:
+                    cabecalho = await reader.readexactly(REQUISICAO.size)
+                    magic, algoritmo, _, _, id_requisicao, prazo_ms, num_vertices, num_arestas = \
+                        REQUISICAO.unpack(cabecalho)
+                    if magic != MAGIC or algoritmo >= len(ALGORITMOS_SERVICO):
+                        raise ValueError("Requisição inválida")
+                    if num_vertices > MAX_VERTICES or num_arestas > MAX_ARESTAS:
+                        raise ValueError("Requisição grande demais")
+                    corpo = await reader.readexactly(8 * num_arestas)
+                except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+                    self._vagas.release()
+                    break
+                if not prazo_ms and ALGORITMOS_SERVICO[algoritmo] in ALGORITMOS_EXPONENCIAIS:
+                    prazo_ms = self.prazo_exponencial_ms
+                prazo = time.monotonic() + prazo_ms / 1000 if prazo_ms else None
+                tarefa = asyncio.create_task(
+                    self._responder(writer, id_requisicao, algoritmo, num_vertices, corpo, prazo))
+                for andamento in (pendentes, self._respostas):
+                    andamento.add(tarefa)
+                    tarefa.add_done_callback(andamento.discard)
+            if pendentes:
+                await asyncio.gather(*pendentes, return_exceptions=True)
+        except asyncio.CancelledError:
+            pass  # Servidor encerrando: a conexão é apenas fechada
+        finally:
+            self._conexoes.discard(conexao)
+            writer.close()
+
+    async def _responder(self, writer, id_requisicao: int, algoritmo: int, num_vertices: int, corpo: bytes,
+                         prazo: float):
+        try:
+            status, num_cores, cores = await self._obter_resultado(algoritmo, num_vertices, corpo, prazo)
+        except Exception:
+            status, num_cores, cores = STATUS_ERRO, 0, b""
+        finally:
+            self._vagas.release()
+        writer.write(RESPOSTA.pack(MAGIC, id_requisicao, status, 0, 0, num_cores, num_vertices) + cores)
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+
+    async def _obter_resultado(self, algoritmo: int, num_vertices: int, corpo: bytes, prazo: float) -> tuple:
+        self.estatisticas["requisicoes"] += 1
+        chave = hashlib.blake2b(struct.pack("<BI", algoritmo, num_vertices) + corpo, digest_size=16).digest()
+        if chave in self.cache:
+            self.cache.move_to_end(chave)
+            self.estatisticas["cache"] += 1
+            return self.cache[chave]
+
+        restante = prazo - time.monotonic() if prazo is not None else None
+        if restante is not None and restante <= 0:
+            self.estatisticas["prazo"] += 1
+            return STATUS_PRAZO, 0, b""
+
+        loop = asyncio.get_running_loop()
+        limite = time.time() + restante if restante is not None else None
+        if len(corpo) // 8 <= LOTE_MAX_ARESTAS:
+            futuro = loop.create_future()
+            await self._fila_lote.put(((algoritmo, num_vertices, corpo, limite), futuro))
+        else:
+            futuro = asyncio.wrap_future(self._pool.submit(_resolver, algoritmo, num_vertices, corpo, limite))
+        try:
+            resultado = await asyncio.wait_for(asyncio.shield(futuro), restante)
+        except asyncio.TimeoutError:
+            futuro.cancel()  # Ainda na fila: não chega a ocupar o pool
+            self.estatisticas["prazo"] += 1
+            return STATUS_PRAZO, 0, b""
+
+        if resultado[0] == STATUS_PRAZO:
+            self.estatisticas["prazo"] += 1
+        elif resultado[0] != STATUS_ERRO:
+            self.cache[chave] = resultado
+            if len(self.cache) > self.tamanho_cache:
+                self.cache.popitem(last=False)
+        return resultado
+
+    async def _agrupar(self):
+        """Forma lotes de requisições pequenas e envia cada lote a um processo."""
+        loop = asyncio.get_running_loop()
+        while True:
+            lote = [await self._fila_lote.get()]
+            limite = loop.time() + LOTE_JANELA
+            while len(lote) < LOTE_MAX_REQUISICOES:
+                restante = limite - loop.time()
+                if restante <= 0:
+                    break
+                try:
+                    lote.append(await asyncio.wait_for(self._fila_lote.get(), restante))
+                except asyncio.TimeoutError:
+                    break
+            lote = [(tarefa, futuro) for tarefa, futuro in lote if not futuro.done()]
+            if lote:
+                self.estatisticas["lotes"] += 1
+                envio = asyncio.wrap_future(self._pool.submit(_resolver_lote, [tarefa for tarefa, _ in lote]))
+                envio.add_done_callback(lambda envio, lote=lote: _distribuir(envio, lote))
+
+
+def _distribuir(envio, lote: list):
+    """Entrega a cada requisição do lote o seu resultado."""
+    for indice, (_, futuro) in enumerate(lote):
+        if futuro.done():
+            continue
+        if envio.cancelled() or envio.exception() is not None:
+            futuro.set_result((STATUS_ERRO, 0, b""))
+        else:
+            futuro.set_result(envio.result()[indice])
+
+
+async def _abrir(host: str, porta: int, caminho_unix: str):
+    if caminho_unix is not None:
+        return await asyncio.open_unix_connection(caminho_unix)
+    return await asyncio.open_connection(host, porta)
+
+
+async def gerar_carga(requisicoes: int = 2000, concorrencia: int = 32, vertices: int = 50, densidade: float = 0.1,
+                      distintos: int = 100, algoritmo: str = "guloso", prazo_ms: int = 0, host: str = "127.0.0.1",
+                      porta: int = 8765, caminho_unix: str = None, seed: int = 0) -> dict:
+    """
+    Gerador de carga: `concorrencia` conexões enviam `requisicoes` no total.
+
+    Os grafos são sorteados de um conjunto de `distintos` grafos aleatórios,
+    de modo que repetições exercitam o cache do servidor. Cada conexão tem
+    uma requisição por vez em andamento (laço fechado).
+
+    Returns:
+        Linha com latências p50/p99 (ms), vazão (requisições/s) e contagem por status.
+    """
+    from .benchmark import percentil
+    from .generator import generate_csr_graph
+
+    quadros = [codificar_grafo(0, algoritmo, generate_csr_graph(vertices, densidade, seed + i), prazo_ms)
+               for i in range(distintos)]
+    latencias = []
+    status_contagem = {}
+    proxima = iter(range(requisicoes))
+
+    async def cliente():
+        reader, writer = await _abrir(host, porta, caminho_unix)
+        try:
+            for numero in proxima:
+                quadro = bytearray(quadros[numero % distintos])
+                struct.pack_into("<I", quadro, 8, numero)  # Campo id do cabeçalho
+                inicio = time.perf_counter()
+                writer.write(quadro)
+                await writer.drain()
+                _, status, _, _ = await ler_resposta(reader)
+                latencias.append((time.perf_counter() - inicio) * 1000)
+                status_contagem[status] = status_contagem.get(status, 0) + 1
+        finally:
+            writer.close()
+
+    inicio = time.perf_counter()
+    await asyncio.gather(*(cliente() for _ in range(concorrencia)))
+    duracao = time.perf_counter() - inicio
+    return {
+        "algoritmo": algoritmo,
+        "requisicoes": len(latencias),
+        "concorrencia": concorrencia,
+        "latencia_p50_ms": percentil(latencias, 50),
+        "latencia_p99_ms": percentil(latencias, 99),
+        "latencia_media_ms": statistics.fmean(latencias),
+        "requisicoes_por_s": len(latencias) / duracao,
+        "status": status_contagem,
+    }
+
+
+async def _servir(args):
+    servidor = ServidorColoracao(args.workers, args.max_pendentes,
+                                 prazo_exponencial_ms=args.prazo_exponencial_ms)
+    socket_servidor = await servidor.iniciar(args.host, args.porta, args.unix)
+    print(f"Servidor de coloração em {args.unix or f'{args.host}:{args.porta}'}")
+    try:
+        async with socket_servidor:
+            await socket_servidor.serve_forever()
+    finally:
+        await servidor.encerrar()
+
+
+async def _benchmark(args):
+    """Sobe o servidor no próprio processo e mede com o gerador de carga."""
+    servidor = ServidorColoracao(args.workers, args.max_pendentes,
+                                 prazo_exponencial_ms=args.prazo_exponencial_ms)
+    socket_servidor = await servidor.iniciar(args.host, args.porta, args.unix)
+    try:
+        linha = await gerar_carga(args.requisicoes, args.concorrencia, args.vertices, args.densidade,
+                                  args.distintos, args.algoritmo, args.prazo_ms, args.host, args.porta, args.unix)
+    finally:
+        socket_servidor.close()
+        await servidor.encerrar()
+    print(f"{linha['requisicoes']} requisições ({linha['algoritmo']}, concorrência {linha['concorrencia']}): "
+          f"p50 {linha['latencia_p50_ms']:.2f} ms, p99 {linha['latencia_p99_ms']:.2f} ms, "
+          f"{linha['requisicoes_por_s']:.0f} req/s")
+    print(f"Status: {linha['status']}; servidor: {servidor.estatisticas}")
+    return linha
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serviço local de coloração e gerador de carga")
+    parser.add_argument("modo", choices=["servidor", "carga", "benchmark"],
+                        help="servidor; carga contra um servidor já ativo; benchmark = ambos no mesmo processo")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--porta", type=int, default=8765)
+    parser.add_argument("--unix", help="Caminho de socket Unix (no lugar de TCP)")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max-pendentes", type=int, default=256)
+    parser.add_argument("--requisicoes", type=int, default=2000)
+    parser.add_argument("--concorrencia", type=int, default=32)
+    parser.add_argument("--vertices", type=int, default=50)
+    parser.add_argument("--densidade", type=float, default=0.1)
+    parser.add_argument("--distintos", type=int, default=100)
+    parser.add_argument("--algoritmo", choices=ALGORITMOS_SERVICO, default="guloso")
+    parser.add_argument("--prazo-ms", type=int, default=0)
+    parser.add_argument("--prazo-exponencial-ms", type=int, default=PRAZO_EXPONENCIAL_MS,
+                        help="Prazo do servidor para o backtracking sem prazo na requisição (0 = sem prazo)")
+    args = parser.parse_args()
+
+    if args.modo == "servidor":
+        asyncio.run(_servir(args))
+    elif args.modo == "benchmark":
+        asyncio.run(_benchmark(args))
+    else:
+        linha = asyncio.run(gerar_carga(args.requisicoes, args.concorrencia, args.vertices, args.densidade,
+                                        args.distintos, args.algoritmo, args.prazo_ms, args.host, args.porta,
+                                        args.unix))
+        print(f"p50 {linha['latencia_p50_ms']:.2f} ms, p99 {linha['latencia_p99_ms']:.2f} ms, "
+              f"{linha['requisicoes_por_s']:.0f} req/s, status {linha['status']}")
+
+
+if __name__ == "__main__":
+    main()
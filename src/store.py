@@ -0,0 +1,141 @@
+import mmap
+import os
+import re
+import struct
+from .csr import CSRGraph
+from .generator import generate_csr_graph
+
+# Cabeçalho: assinatura, versão, número de vértices e tamanho do array de vizinhos
+HEADER = struct.Struct("<4sIqq")
+MAGIC = b"CSRG"
+VERSION = 1
+EXTENSION = ".csr"
+
+
+class GraphStore:
+    """
+    Cache em disco de grafos CSR, lidos de volta por `mmap` sem cópia.
+
+    Cada grafo é gravado como um arquivo binário plano (cabeçalho seguido dos
+    arrays de deslocamentos, vizinhos e pesos) cujo nome deriva da chave,
+    normalmente `(num_vertices, density, seed)`. Vários processos que abrem o
+    mesmo arquivo compartilham as mesmas páginas do cache do sistema
+    operacional. Quando o tamanho total passa de `max_bytes`, os arquivos
+    usados há mais tempo são removidos (LRU pela data de modificação, que é
+    atualizada a cada leitura).
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 1 << 30):
+        """
+        Args:
+            directory: Pasta onde os grafos são guardados.
+            max_bytes: Tamanho máximo do cache, em bytes.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, key: tuple) -> str:
+        """Caminho do arquivo correspondente à chave."""
+        name = "_".join(re.sub(r"[^0-9A-Za-z.+-]", "-", str(part)) for part in key)
+        return os.path.join(self.directory, f"g_{name}{EXTENSION}")
+
+    def save(self, key: tuple, graph: CSRGraph) -> str:
+        """
+        Grava o grafo sob a chave `key` e aplica a política de remoção.
+
+        A escrita vai para um arquivo temporário renomeado ao final, de modo
+        que leitores concorrentes nunca veem um arquivo incompleto.
+
+        Args:
+            key: Chave do grafo, por exemplo (num_vertices, density, seed).
+            graph: Grafo a ser gravado.
+        Returns:
+            Caminho do arquivo gravado.
+        """
+        path = self.path(key)
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, graph.num_vertices, len(graph.neighbors)))
+            for part in (graph.offsets, graph.neighbors, graph.weights):
+                f.write(memoryview(part).cast("B"))
+        os.replace(temporary, path)
+        self.evict(keep=path)
+        return path
+
+    def load(self, key: tuple) -> CSRGraph:
+        """
+        Abre o grafo da chave `key` por `mmap`, sem copiar os arrays.
+
+        Args:
+            key: Chave do grafo.
+        Returns:
+            CSRGraph cujos arrays são visões do arquivo, ou None se não houver.
+        """
+        path = self.path(key)
+        try:
+            with open(path, "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            return None
+        magic, version, num_vertices, num_entries = HEADER.unpack_from(mapped)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Arquivo de grafo inválido: {path}")
+        os.utime(path)  # Marca como usado recentemente
+        return CSRGraph.from_buffer(memoryview(mapped)[HEADER.size:], num_vertices, num_entries)
+
+    def get_or_generate(self, num_vertices: int, density: float, seed: int) -> CSRGraph:
+        """
+        Devolve o grafo aleatório da chave `(num_vertices, density, seed)`,
+        gerando-o e gravando-o apenas na primeira vez.
+
+        Args:
+            num_vertices: Número de vértices.
+            density: Probabilidade de arestas extras.
+            seed: Semente do gerador.
+        Returns:
+            CSRGraph mapeado do disco.
+        """
+        key = (num_vertices, density, seed)
+        graph = self.load(key)
+        if graph is None:
+            self.save(key, generate_csr_graph(num_vertices, density, seed))
+            graph = self.load(key)
+        return graph
+
+    def entries(self) -> list:
+        """Arquivos do cache como tuplas (última utilização, tamanho, caminho)."""
+        result = []
+        for name in os.listdir(self.directory):
+            if name.endswith(EXTENSION):
+                path = os.path.join(self.directory, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue  # Removido por outro processo
+                result.append((stat.st_mtime, stat.st_size, path))
+        return result
+
+    def size(self) -> int:
+        """Tamanho total do cache, em bytes."""
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self, keep: str = None):
+        """
+        Remove os arquivos menos usados até o cache caber em `max_bytes`.
+
+        Args:
+            keep: Caminho que nunca é removido (o arquivo recém-gravado).
+        """
+        entries = sorted(self.entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)  # Leitores com mmap aberto continuam válidos
+            except FileNotFoundError:
+                pass
+            total -= size
@@ -0,0 +1,301 @@
+import argparse
+import mmap
+import os
+import resource
+import struct
+import tempfile
+import time
+from array import array
+import numpy as np
+from .csr import INDEX_TYPECODE
+from . import metrics
+
+# Cabeçalho do arquivo ordenado: assinatura, versão, número de vértices e de arestas
+HEADER = struct.Struct("<4sIqq")
+MAGIC = b"SEDG"
+VERSION = 1
+EXTENSION = ".sedg"
+
+# Teto de memória padrão (bytes) da ordenação externa e da coloração
+DEFAULT_MEMORY_LIMIT = 256 << 20
+# Memória de trabalho por aresta na ordenação (pico medido: tripla lida e chaves int64)
+SORT_BYTES_PER_EDGE = 48
+# Memória de trabalho por aresta na coloração: página mapeada, máscara e início de grupo
+COLOR_BYTES_PER_EDGE = 24
+# Vértices convertidos para listas Python de cada vez dentro de uma janela
+VERTEX_BATCH = 8192
+# Vizinhanças a partir deste tamanho usam NumPy para achar a menor cor livre
+VECTOR_MIN_DEGREE = 64
+
+
+def _edge_budget(memory_limit: int, resident: int, bytes_per_edge: int) -> int:
+    """Quantas arestas cabem no teto de memória além da parte residente."""
+    if resident >= memory_limit:
+        raise ValueError(f"Teto de memória de {memory_limit} bytes não comporta os "
+                         f"{resident} bytes proporcionais ao número de vértices")
+    return max(1024, (memory_limit - resident) // bytes_per_edge)
+
+
+def _read_triples(path: str, chunk_edges: int):
+    """Lê em blocos um arquivo de `EdgeFileWriter` como arrays (maior, menor), sem laços."""
+    with open(path, "rb") as f:
+        while True:
+            chunk = np.fromfile(f, dtype=np.int32, count=3 * chunk_edges)
+            if not len(chunk):
+                return
+            u, v = chunk[0::3], chunk[1::3]
+            keep = u != v
+            high, low = np.maximum(u, v)[keep], np.minimum(u, v)[keep]
+            del chunk, u, v, keep
+            yield high, low
+
+
+def _bucket_starts(counts: np.ndarray, capacity: int) -> list:
+    """Divide os vértices em faixas consecutivas com até `capacity` arestas cada."""
+    cumulative = np.cumsum(counts)
+    starts = [0]
+    while starts[-1] < len(counts):
+        done = cumulative[starts[-1] - 1] if starts[-1] else 0
+        end = int(np.searchsorted(cumulative, done + capacity, side="right"))
+        starts.append(max(end, starts[-1] + 1))  # Um vértice sozinho pode passar da capacidade
+    return starts
+
+
+def sort_edge_file(path: str, output: str, num_vertices: int = None,
+                   memory_limit: int = DEFAULT_MEMORY_LIMIT, temp_dir: str = None) -> tuple:
+    """
+    Ordena externamente um arquivo de arestas pelo vértice de maior índice.
+
+    Cada aresta {u, v} vira o par (max, min), sem laços nem repetições, e o
+    arquivo de saída fica ordenado por (max, min): os vizinhos anteriores de
+    cada vértice ficam contíguos, na ordem em que o guloso os consulta. A
+    ordenação é por distribuição, sem intercalação: uma passada conta as
+    arestas de cada vértice, outra espalha as arestas em faixas de vértices
+    que cabem no teto de memória, e cada faixa é ordenada em memória e
+    acrescentada à saída.
+
+    Args:
+        path: Arquivo de triplas int32 (u, v, w) de `EdgeFileWriter`.
+        output: Arquivo ordenado de saída.
+        num_vertices: Número de vértices (padrão: maior índice + 1).
+        memory_limit: Teto aproximado de memória de trabalho, em bytes (além
+            do interpretador; inclui o vetor de contagens por vértice).
+        temp_dir: Pasta dos arquivos temporários (padrão: a da saída).
+    Returns:
+        Tupla (número de vértices, número de arestas gravadas).
+    """
+    # O vetor de contagens é a única parte proporcional a n
+    resident = 8 * (num_vertices or 0)
+    chunk_edges = _edge_budget(memory_limit, resident, SORT_BYTES_PER_EDGE)
+
+    counts = np.zeros(num_vertices or 0, dtype=np.int64)
+    for high, _ in _read_triples(path, chunk_edges):
+        chunk_counts = np.bincount(high)
+        if len(chunk_counts) > len(counts):
+            counts = np.concatenate((counts, np.zeros(len(chunk_counts) - len(counts), dtype=np.int64)))
+        counts[:len(chunk_counts)] += chunk_counts
+    num_vertices = len(counts)
+    starts = _bucket_starts(counts, chunk_edges)
+    del counts
+
+    with tempfile.TemporaryDirectory(dir=temp_dir or os.path.dirname(os.path.abspath(output))) as directory:
+        buckets = [os.path.join(directory, f"faixa_{i}.bin") for i in range(len(starts) - 1)]
+        for high, low in _read_triples(path, chunk_edges):
+            keys = high.astype(np.int64)
+            keys *= num_vertices
+            keys += low
+            del high, low
+            # As faixas são intervalos de chaves: ordenar no lugar já agrupa cada faixa
+            keys.sort()
+            cuts = np.searchsorted(keys, np.asarray(starts, dtype=np.int64) * num_vertices)
+            for i in range(len(buckets)):
+                if cuts[i] < cuts[i + 1]:
+                    with open(buckets[i], "ab") as f:
+                        keys[cuts[i]:cuts[i + 1]].tofile(f)
+            del keys
+
+        num_edges = 0
+        with open(output, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, num_vertices, 0))
+            for bucket_path in buckets:
+                if not os.path.exists(bucket_path):
+                    continue
+                keys = np.fromfile(bucket_path, dtype=np.int64)
+                os.remove(bucket_path)
+                keys.sort()
+                keys = keys[np.concatenate(([True], keys[1:] != keys[:-1]))]
+                pairs = np.empty((len(keys), 2), dtype=np.int32)
+                pairs[:, 0] = keys // num_vertices
+                pairs[:, 1] = keys % num_vertices
+                pairs.tofile(f)
+                num_edges += len(keys)
+                del keys, pairs
+            f.seek(0)
+            f.write(HEADER.pack(MAGIC, VERSION, num_vertices, num_edges))
+    return num_vertices, num_edges
+
+
+def read_sorted_header(path: str) -> tuple:
+    """
+    Lê o cabeçalho de um arquivo de `sort_edge_file`.
+
+    Returns:
+        Tupla (número de vértices, número de arestas).
+    """
+    with open(path, "rb") as f:
+        magic, version, num_vertices, num_edges = HEADER.unpack(f.read(HEADER.size))
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"Arquivo de arestas ordenado inválido: {path}")
+    return num_vertices, num_edges
+
+
+def _color_window(colors: array, colors_view: np.ndarray, pairs: np.ndarray, flat) -> int:
+    """
+    Colore os vértices completos de uma janela de pares (max, min).
+
+    Returns:
+        Número de pares consumidos (o último vértice fica para a próxima
+        janela quando pode ter continuado além dela).
+    """
+    sources = pairs[:, 0]
+    starts = np.flatnonzero(np.concatenate(([True], sources[1:] != sources[:-1])))
+    for first in range(0, len(starts), VERTEX_BATCH):
+        batch = starts[first:first + VERTEX_BATCH + 1]
+        bounds = batch.tolist()
+        if len(batch) <= VERTEX_BATCH:
+            bounds.append(len(sources))
+        vertices = sources[batch[:VERTEX_BATCH]].tolist()
+        for i, vertex in enumerate(vertices):
+            begin, end = bounds[i], bounds[i + 1]
+            if end - begin < VECTOR_MIN_DEGREE:
+                # `flat` intercala (max, min): os vizinhos são as posições ímpares
+                used = {colors[w] for w in flat[2 * begin + 1:2 * end:2]}
+                color = 0
+                while color in used:
+                    color += 1
+            else:
+                neighbor_colors = colors_view[pairs[begin:end, 1]]
+                used = np.zeros(end - begin + 1, dtype=bool)
+                used[neighbor_colors[neighbor_colors <= end - begin]] = True
+                color = int(used.argmin())
+            colors[vertex] = color
+    return len(sources)
+
+
+def streaming_greedy_coloring(path: str, memory_limit: int = DEFAULT_MEMORY_LIMIT) -> tuple:
+    """
+    Coloração gulosa fora da memória, em uma passada sobre o arquivo ordenado.
+
+    Os vértices são coloridos na ordem 0 .. n - 1, como em `greedy_coloring`
+    com paleta inteira, e cada um recebe a menor cor ausente entre os
+    vizinhos anteriores, que já estão coloridos. Só o vetor de cores (int32
+    por vértice) fica residente; as arestas são lidas por `mmap` em janelas
+    que cabem no teto de memória e desmapeadas em seguida, de modo que o
+    pico de RSS é proporcional a n, não a m. Uma janela só cresce além do
+    teto para conter a vizinhança de um único vértice (no máximo n - 1 pares).
+
+    Args:
+        path: Arquivo gerado por `sort_edge_file`.
+        memory_limit: Teto aproximado de memória de trabalho, em bytes
+            (inclui o vetor de cores).
+    Returns:
+        Tupla (vetor de cores inteiras como `array('i')`, número de cores).
+    """
+    num_vertices, num_edges = read_sorted_header(path)
+    colors = array(INDEX_TYPECODE, bytes(4 * num_vertices))
+    colors_view = np.frombuffer(colors, dtype=np.int32)
+    window_edges = _edge_budget(memory_limit, 4 * num_vertices, COLOR_BYTES_PER_EDGE)
+    granularity = mmap.ALLOCATIONGRANULARITY
+
+    with open(path, "rb") as f:
+        position = 0
+        while position < num_edges:
+            count = min(window_edges, num_edges - position)
+            offset = HEADER.size + 8 * position
+            aligned = offset - offset % granularity
+            mapped = mmap.mmap(f.fileno(), offset - aligned + 8 * count, access=mmap.ACCESS_READ, offset=aligned)
+            try:
+                pairs = np.frombuffer(mapped, dtype=np.int32, count=2 * count,
+                                      offset=offset - aligned).reshape(-1, 2)
+                last = position + count == num_edges
+                if not last:
+                    # O último vértice da janela pode continuar na próxima
+                    cut = int(np.searchsorted(pairs[:, 0], pairs[-1, 0]))
+                    pairs = pairs[:cut]
+                if len(pairs):
+                    flat = memoryview(mapped)[offset - aligned:offset - aligned + 8 * len(pairs)].cast("i")
+                    position += _color_window(colors, colors_view, pairs, flat)
+                    flat.release()
+                else:
+                    window_edges *= 2  # Vizinhança maior que a janela inteira
+                del pairs
+            finally:
+                mapped.close()
+
+    stats = metrics.current()
+    if stats is not None:
+        stats.nodes += num_vertices
+        stats.max_depth = max(stats.max_depth, num_vertices)
+        stats.colors_tried += num_vertices
+        stats.is_safe_calls += num_edges
+    return colors, (int(colors_view.max()) + 1 if num_vertices else 0)
+
+
+def _generate_file(path: str, num_vertices: int, density: float, seed: int):
+    """Processo filho: grava um grafo aleatório em `path` (fora do pico de RSS medido)."""
+    from .generator import EdgeFileWriter, generate_into
+    with EdgeFileWriter(path) as writer:
+        generate_into(writer, num_vertices, density, seed)
+
+
+def main():
+    import multiprocessing
+
+    parser = argparse.ArgumentParser(description="Coloração gulosa fora da memória sobre um arquivo de arestas")
+    parser.add_argument("--vertices", type=int, default=100_000)
+    parser.add_argument("--densidade", type=float, default=0.001)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--arquivo", default=None, help="Arquivo de triplas int32 (padrão: gera um grafo aleatório)")
+    parser.add_argument("--memoria-mb", type=float, default=DEFAULT_MEMORY_LIMIT / (1 << 20),
+                        help="Teto de memória da ordenação e da coloração")
+    parser.add_argument("--pasta", default=tempfile.gettempdir())
+    parser.add_argument("--verificar", action="store_true",
+                        help="Compara com `greedy_coloring` em memória (só para grafos pequenos)")
+    args = parser.parse_args()
+    limite = int(args.memoria_mb * (1 << 20))
+
+    arquivo = args.arquivo
+    if arquivo is None:
+        arquivo = os.path.join(args.pasta, f"arestas_{args.vertices}_{args.densidade}_{args.seed}.bin")
+        inicio = time.perf_counter()
+        processo = multiprocessing.Process(target=_generate_file,
+                                           args=(arquivo, args.vertices, args.densidade, args.seed))
+        processo.start()
+        processo.join()
+        print(f"Geração: {os.path.getsize(arquivo) // 12} arestas em {time.perf_counter() - inicio:.2f} s")
+
+    ordenado = os.path.splitext(arquivo)[0] + EXTENSION
+    inicio = time.perf_counter()
+    num_vertices, num_edges = sort_edge_file(arquivo, ordenado, args.vertices if args.arquivo is None else None,
+                                             limite, args.pasta)
+    print(f"Ordenação externa: {num_edges} arestas em {time.perf_counter() - inicio:.2f} s")
+
+    inicio = time.perf_counter()
+    cores, num_cores = streaming_greedy_coloring(ordenado, limite)
+    print(f"Coloração: {num_cores} cores para {num_vertices} vértices em {time.perf_counter() - inicio:.2f} s")
+    print(f"Pico de RSS: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f} MB "
+          f"(teto {args.memoria_mb:.1f} MB, arquivo ordenado {os.path.getsize(ordenado) / (1 << 20):.1f} MB)")
+
+    if args.verificar:
+        from .csr import CSRBuilder
+        from .guloso import greedy_coloring
+        from .generator import read_edge_file
+        builder = CSRBuilder(num_vertices)
+        for u, v, w in read_edge_file(arquivo):
+            builder.add_edge(u, v, w)
+        esperado = greedy_coloring(builder.build(), list(range(num_vertices)))
+        print("Verificação:", "ok" if esperado == cores.tolist() else "DIVERGENTE")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+import numpy as np
+
+# Dois primos < 2^31: produtos cabem em int64 e uma contagem positiva só some
+# se for múltipla dos dois ao mesmo tempo
+PRIMES = np.array([[2147483629], [2147483587]], dtype=np.int64)
+
+
+def neighbor_masks(adjacency_list) -> list:
+    """Máscara de bits da vizinhança de cada vértice (inteiros Python)."""
+    masks = []
+    for v in range(len(adjacency_list)):
+        mask = 0
+        for neighbor in adjacency_list[v]:
+            mask |= 1 << neighbor
+        masks.append(mask)
+    return masks
+
+
+def independent_set_counts(masks: list) -> np.ndarray:
+    """
+    Número de conjuntos independentes (incluindo o vazio) contidos em cada subconjunto.
+
+    Com `v` o maior vértice de S, i(S) = i(S - v) + i(S - N[v]): os
+    conjuntos sem `v` e os que contêm `v` (e nenhum vizinho dele). Os
+    subconjuntos cujo maior vértice é `v` formam o bloco [2^v, 2^(v+1)) do
+    array, e as duas parcelas estão no bloco anterior, então cada vértice
+    custa uma única operação vetorizada sobre 2^v posições.
+
+    Args:
+        masks: Máscaras de vizinhança (ver `neighbor_masks`).
+    Returns:
+        Array int64 de 2^n posições indexado pela máscara do subconjunto.
+    """
+    num_vertices = len(masks)
+    counts = np.empty(1 << num_vertices, dtype=np.int64)
+    counts[0] = 1
+    for v, mask in enumerate(masks):
+        size = 1 << v
+        lower = np.arange(size, dtype=np.int64)
+        counts[size:2 * size] = counts[:size] + counts[lower & ~mask]
+    return counts
+
+
+def _moebius(values: np.ndarray, num_vertices: int) -> np.ndarray:
+    """
+    Transformada de Möbius sobre subconjuntos, no lugar e módulo `PRIMES`.
+
+    Depois dela, `values[:, T]` = soma de (-1)^|T - S| values[:, S] para S ⊆ T.
+    Com entradas < 2^31, cada bit no máximo dobra o módulo dos valores; até
+    n = 32 eles cabem em int64 e a redução módulo os primos fica para o fim.
+    """
+    for bit in range(num_vertices):
+        blocks = values.reshape(len(PRIMES), -1, 2, 1 << bit)
+        blocks[:, :, 1, :] -= blocks[:, :, 0, :]
+    np.remainder(values, PRIMES, out=values)
+    return values
+
+
+def chromatic_number(counts: np.ndarray, num_vertices: int, lower: int = 1) -> int:
+    """
+    Menor k com uma cobertura dos vértices por k conjuntos independentes.
+
+    O número de k-uplas de conjuntos independentes que cobrem V é, por
+    inclusão–exclusão, a soma de (-1)^(n - |S|) i(S)^k sobre todos os S. As
+    potências são mantidas módulo os dois primos de `PRIMES` e atualizadas
+    a cada k com uma multiplicação vetorizada.
+
+    Args:
+        counts: Saída de `independent_set_counts`.
+        num_vertices: Número de vértices.
+        lower: Limite inferior conhecido (por exemplo, o tamanho de uma clique).
+    Returns:
+        O número cromático.
+    """
+    if not num_vertices:
+        return 0
+    # Subconjuntos de sinal positivo primeiro: as somas viram fatias contíguas
+    negative = np.bitwise_count(np.arange(len(counts), dtype=np.int64)) & 1 != num_vertices & 1
+    order = np.argsort(negative, kind="stable")
+    split = len(counts) - int(negative.sum())
+    del negative
+    base = counts[order][None, :] % PRIMES
+    del order
+    powers = np.ones_like(base)
+    k = 0
+    while True:
+        k += 1
+        np.multiply(powers, base, out=powers)
+        np.remainder(powers, PRIMES, out=powers)
+        if k < lower:
+            continue
+        total = (powers[:, :split].sum(axis=1) - powers[:, split:].sum(axis=1)) % PRIMES[:, 0]
+        if total.any():
+            return k
+
+
+def subset_dp_coloring(adjacency_list, lower: int = 1) -> tuple:
+    """
+    Número cromático e coloração ótima por inclusão–exclusão sobre subconjuntos.
+
+    Todo o trabalho é feito em arrays NumPy indexados pela máscara do
+    subconjunto, então o custo depende só de n, não da estrutura do grafo:
+    O(2^n) para contar os conjuntos independentes, O(2^n) por valor de k
+    testado e O(n 2^n) na recuperação da coloração.
+
+    Para recuperar as classes, com k cores restantes e R os vértices ainda
+    sem cor, a transformada de Möbius de i^(k-1) diz, para todo T ⊆ R, se T
+    admite (k-1)-coloração. A classe do primeiro vértice de R é um conjunto
+    independente I que o contém, o maior possível, com R - I
+    (k-1)-colorível; o passo se repete no subgrafo induzido por R - I,
+    que tem arrays exponencialmente menores.
+
+    Args:
+        adjacency_list: Lista de adjacência (dicionário, lista ou CSRGraph).
+        lower: Limite inferior conhecido do número cromático.
+    Returns:
+        Tupla (número cromático, lista de cores inteiras).
+    """
+    masks = neighbor_masks(adjacency_list)
+    num_vertices = len(masks)
+    counts = independent_set_counts(masks)
+    k = chromatic_number(counts, num_vertices, lower)
+
+    coloring = [-1] * num_vertices
+    remaining = list(range(num_vertices))
+    for color in range(k):
+        if color == k - 1:
+            # Última cor: o que sobra é independente
+            for v in remaining:
+                coloring[v] = color
+            break
+        index = {v: i for i, v in enumerate(remaining)}
+        local = [sum(1 << index[w] for w in range(num_vertices) if masks[v] >> w & 1 and w in index)
+                 for v in remaining]
+        size = len(local)
+        counts = independent_set_counts(local)
+        subsets = np.arange(len(counts), dtype=np.int64)
+        popcount = np.bitwise_count(subsets).astype(np.int64)
+        independent = counts == np.left_shift(1, popcount)
+
+        covers = np.ones((len(PRIMES), len(counts)), dtype=np.int64)
+        base = counts[None, :] % PRIMES
+        for _ in range(k - color - 1):
+            np.multiply(covers, base, out=covers)
+            np.remainder(covers, PRIMES, out=covers)
+        colorable = _moebius(covers, size).any(axis=0)
+
+        full = len(counts) - 1
+        valid = independent & (subsets & 1 == 1) & colorable[full ^ subsets]
+        chosen = int(np.argmax(np.where(valid, popcount, -1)))
+        for i, v in enumerate(list(remaining)):
+            if chosen >> i & 1:
+                coloring[v] = color
+        remaining = [v for i, v in enumerate(remaining) if not chosen >> i & 1]
+    return k, coloring
@@ -0,0 +1,147 @@
+import time
+import numpy as np
+from .jones_plassmann import csr_arrays
+from . import metrics
+
+
+def normalize_coloring(coloring) -> list:
+    """
+    Converte a saída de qualquer coloridor em cores inteiras 0 .. k - 1.
+
+    Aceita listas de nomes (`greedy_coloring`), listas de inteiros e tuplas
+    (cores, num_cores); as cores são renumeradas na ordem de primeira aparição.
+    """
+    if isinstance(coloring, tuple):
+        coloring = coloring[0]
+    index = {}
+    return [index.setdefault(color, len(index)) for color in coloring]
+
+
+def _conflict_matrix(src: np.ndarray, neighbors: np.ndarray, colors: np.ndarray, num_vertices: int,
+                     k: int) -> np.ndarray:
+    """Matriz n x k: quantos vizinhos de cada vértice usam cada cor."""
+    counts = np.bincount(src.astype(np.int64) * k + colors[neighbors], minlength=num_vertices * k)
+    return counts.reshape(num_vertices, k).astype(np.int32)
+
+
+def tabucol(graph, k: int, initial=None, max_iterations: int = 100_000, deadline: float = None,
+            seed=None) -> list:
+    """
+    Procura uma k-coloração sem conflitos por busca tabu (Tabucol).
+
+    A matriz de conflitos `conflicts[v, c]` (vizinhos de `v` com a cor `c`)
+    é mantida incrementalmente: mover `v` de `a` para `b` atualiza só as
+    linhas dos vizinhos de `v`, em O(grau). A cada iteração escolhe-se, entre
+    os vértices em conflito, o movimento não tabu de menor variação no número
+    de conflitos (com critério de aspiração), e a cor antiga fica proibida ao
+    vértice por `0.6 * (vértices em conflito) + U{0, ..., 9}` iterações.
+
+    Args:
+        graph: Lista de adjacência (dicionário ou CSRGraph).
+        k: Número de cores.
+        initial: Coloração inicial com cores inteiras (valores >= k são sorteados).
+        max_iterations: Orçamento de iterações.
+        deadline: Instante limite (`time.perf_counter()`), ou None.
+        seed: Semente dos desempates e da coloração inicial.
+    Returns:
+        Lista de cores inteiras (0 .. k - 1), ou None se o orçamento acabou.
+    """
+    return _tabucol_arrays(csr_arrays(graph), k, initial, max_iterations, deadline,
+                           np.random.default_rng(seed))
+
+
+def _tabucol_arrays(arrays: tuple, k: int, initial, max_iterations: int, deadline: float,
+                    rng: np.random.Generator) -> list:
+    """`tabucol` sobre os arrays CSR já extraídos por `csr_arrays`."""
+    offsets, neighbors, degrees = arrays
+    num_vertices = len(degrees)
+    if initial is None:
+        colors = rng.integers(0, k, num_vertices)
+    else:
+        colors = np.asarray(initial, dtype=np.int64).copy()
+        out_of_range = colors >= k
+        colors[out_of_range] = rng.integers(0, k, int(out_of_range.sum()))
+    src = np.repeat(np.arange(num_vertices, dtype=np.int32), degrees)
+    conflicts = _conflict_matrix(src, neighbors, colors, num_vertices, k)
+    vertex_ids = np.arange(num_vertices)
+    in_conflict = conflicts[vertex_ids, colors] > 0
+    total = int(conflicts[vertex_ids, colors].sum()) // 2
+    best_total = total
+    tabu_until = np.zeros((num_vertices, k), dtype=np.int64)
+    stats = metrics.current()
+
+    iteration = 0
+    while total and iteration < max_iterations:
+        if deadline is not None and not iteration & 63 and time.perf_counter() > deadline:
+            break
+        iteration += 1
+        candidates = np.flatnonzero(in_conflict)
+        current = colors[candidates]
+        rows = conflicts[candidates]
+        delta = rows - rows[np.arange(len(candidates)), current][:, None]
+        allowed = (tabu_until[candidates] <= iteration) | (total + delta < best_total)
+        allowed[np.arange(len(candidates)), current] = False
+        delta = np.where(allowed, delta, np.iinfo(np.int32).max)
+        best_delta = delta.min()
+        if best_delta == np.iinfo(np.int32).max:
+            continue  # Todos os movimentos são tabu: espera a lista esvaziar
+        choices = np.flatnonzero(delta == best_delta)
+        row, new_color = divmod(int(choices[rng.integers(len(choices))]), k)
+        vertex, old_color = int(candidates[row]), int(current[row])
+
+        # Atualização O(grau) da matriz e dos vértices em conflito; `at`
+        # acumula vizinhos repetidos, que a atribuição indexada contaria uma vez
+        adjacent = neighbors[offsets[vertex]:offsets[vertex + 1]]
+        np.subtract.at(conflicts, (adjacent, old_color), 1)
+        np.add.at(conflicts, (adjacent, new_color), 1)
+        colors[vertex] = new_color
+        in_conflict[adjacent] = conflicts[adjacent, colors[adjacent]] > 0
+        in_conflict[vertex] = conflicts[vertex, new_color] > 0
+        total += int(best_delta)
+        best_total = min(best_total, total)
+        tabu_until[vertex, old_color] = iteration + int(0.6 * len(candidates)) + int(rng.integers(10))
+
+    if stats is not None:
+        stats.nodes += iteration
+        stats.colors_tried += iteration
+    return None if total else colors.tolist()
+
+
+def tabucol_reduce(graph, coloring, max_iterations: int = 100_000, time_limit: float = None,
+                   seed=None) -> tuple:
+    """
+    Reduz o número de cores de uma coloração existente com Tabucol.
+
+    Partindo da coloração dada (de qualquer coloridor), remove a menor classe
+    de cor, redistribui seus vértices e tenta eliminar os conflitos com
+    k - 1 cores; repete enquanto houver sucesso dentro do orçamento.
+
+    Args:
+        graph: Lista de adjacência (dicionário ou CSRGraph).
+        coloring: Coloração válida inicial (lista de nomes ou inteiros, ou tupla).
+        max_iterations: Orçamento de iterações de cada tentativa com k - 1 cores.
+        time_limit: Tempo total máximo, em segundos (None = sem limite).
+        seed: Semente da busca.
+    Returns:
+        Tupla (cores, num_cores) da melhor coloração válida encontrada.
+    """
+    deadline = time.perf_counter() + time_limit if time_limit is not None else None
+    arrays = csr_arrays(graph)
+    best = normalize_coloring(coloring)
+    k = max(best) + 1 if best else 0
+    rng = np.random.default_rng(seed)
+    while k > 1:
+        if deadline is not None and time.perf_counter() > deadline:
+            break
+        # Remove a menor classe: seus vértices viram cores fora do intervalo
+        # e recebem cores aleatórias em `tabucol`
+        sizes = np.bincount(best, minlength=k)
+        removed = int(np.argmin(sizes))
+        initial = np.asarray(best, dtype=np.int64)
+        initial[initial == removed] = k
+        initial[initial == k - 1] = removed
+        candidate = _tabucol_arrays(arrays, k - 1, initial, max_iterations, deadline, rng)
+        if candidate is None:
+            break
+        best, k = candidate, k - 1
+    return best, k
@@ -0,0 +1,218 @@
+import argparse
+import itertools
+import json
+import multiprocessing
+import os
+import statistics
+import time
+import tracemalloc
+from .benchmark import ALGORITMOS, contar_cores
+from .generator import generate_csr_graph
+
+# Intervalo de verificação dos processos em andamento (segundos)
+INTERVALO_VERIFICACAO = 0.05
+
+
+def gerar_celulas(tamanhos: list, densidades: list, seeds: list, algoritmos: list) -> list:
+    """
+    Produto cartesiano dos parâmetros da varredura.
+
+    Returns:
+        Lista de células {algoritmo, vertices, densidade, seed}.
+    """
+    return [
+        {"algoritmo": algoritmo, "vertices": n, "densidade": densidade, "seed": seed}
+        for algoritmo, n, densidade, seed in itertools.product(algoritmos, tamanhos, densidades, seeds)
+    ]
+
+
+def chave_celula(celula: dict) -> tuple:
+    """Identificador de uma célula no arquivo de resultados."""
+    return (celula["algoritmo"], int(celula["vertices"]), float(celula["densidade"]), int(celula["seed"]))
+
+
+def _executar_celula(celula: dict, conexao):
+    """
+    Processo filho: gera o grafo, mede o coloridor e envia a linha de resultado.
+
+    O grafo usa a semente `seed + vértices`, como nos drivers `executar_*`, e
+    só a coloração fica dentro da janela de medição.
+    """
+    try:
+        grafo = generate_csr_graph(celula["vertices"], celula["densidade"], celula["seed"] + celula["vertices"])
+        colorir = ALGORITMOS[celula["algoritmo"]]
+        tracemalloc.start()
+        inicio = time.perf_counter()
+        resultado = colorir(grafo)
+        tempo = (time.perf_counter() - inicio) * 1000
+        memoria = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        conexao.send(dict(celula, status="ok", arestas=grafo.num_edges, tempo_ms=tempo,
+                          memoria_pico_bytes=memoria, cores=contar_cores(resultado)))
+    except Exception as erro:
+        conexao.send(dict(celula, status="erro", erro=repr(erro)))
+    finally:
+        conexao.close()
+
+
+def carregar_checkpoint(caminho: str) -> list:
+    """
+    Lê as linhas já gravadas de uma varredura.
+
+    Uma última linha incompleta (processo interrompido no meio da escrita) é
+    ignorada.
+
+    Returns:
+        Lista de linhas (dicionários).
+    """
+    if not os.path.exists(caminho):
+        return []
+    linhas = []
+    with open(caminho, encoding="utf-8") as f:
+        for texto in f:
+            try:
+                linhas.append(json.loads(texto))
+            except json.JSONDecodeError:
+                continue
+    return linhas
+
+
+def _gravar(arquivo, linha: dict):
+    """Acrescenta uma linha ao checkpoint e força a gravação em disco."""
+    arquivo.write(json.dumps(linha, ensure_ascii=False) + "\n")
+    arquivo.flush()
+    os.fsync(arquivo.fileno())
+
+
+def executar_varredura(celulas: list, caminho: str, workers: int = None, timeout: float = 60.0,
+                       repetir_falhas: bool = False) -> list:
+    """
+    Executa as células em paralelo, com limite de tempo por célula e retomada.
+
+    Cada célula roda em um processo próprio; quando passa de `timeout`
+    segundos, o processo é encerrado e a célula é registrada com status
+    `timeout`. Toda célula concluída é acrescentada imediatamente ao arquivo
+    JSONL `caminho`, de modo que uma varredura interrompida recomeça apenas
+    com as células que faltam.
+
+    Args:
+        celulas: Células de `gerar_celulas`.
+        caminho: Arquivo JSONL de resultados (checkpoint).
+        workers: Processos simultâneos (padrão: número de CPUs).
+        timeout: Tempo máximo por célula, em segundos (None = sem limite).
+        repetir_falhas: Se executa de novo células gravadas com timeout ou erro.
+    Returns:
+        Todas as linhas do arquivo ao final (anteriores e novas).
+    """
+    workers = workers or os.cpu_count() or 1
+    anteriores = carregar_checkpoint(caminho)
+    feitas = {chave_celula(linha) for linha in anteriores
+              if not repetir_falhas or linha.get("status") == "ok"}
+    pendentes = [celula for celula in celulas if chave_celula(celula) not in feitas]
+    if pendentes:
+        print(f"Varredura: {len(pendentes)} células pendentes ({len(celulas) - len(pendentes)} já gravadas)")
+
+    os.makedirs(os.path.dirname(caminho) or ".", exist_ok=True)
+    em_andamento = {}
+    with open(caminho, "a", encoding="utf-8") as arquivo:
+        try:
+            while pendentes or em_andamento:
+                while pendentes and len(em_andamento) < workers:
+                    celula = pendentes.pop(0)
+                    receptor, emissor = multiprocessing.Pipe(duplex=False)
+                    processo = multiprocessing.Process(target=_executar_celula, args=(celula, emissor), daemon=True)
+                    processo.start()
+                    emissor.close()
+                    em_andamento[processo] = (celula, receptor, time.monotonic())
+
+                time.sleep(INTERVALO_VERIFICACAO)
+                for processo, (celula, receptor, inicio) in list(em_andamento.items()):
+                    linha = None
+                    if receptor.poll():
+                        try:
+                            linha = receptor.recv()
+                        except EOFError:
+                            linha = dict(celula, status="erro", erro="processo encerrado sem resultado")
+                    elif not processo.is_alive():
+                        linha = dict(celula, status="erro", erro=f"código de saída {processo.exitcode}")
+                    elif timeout is not None and time.monotonic() - inicio > timeout:
+                        processo.terminate()
+                        linha = dict(celula, status="timeout", tempo_limite_s=timeout)
+                    if linha is None:
+                        continue
+                    processo.join()
+                    receptor.close()
+                    del em_andamento[processo]
+                    _gravar(arquivo, linha)
+                    print(f"| {linha['algoritmo']:14s} | {linha['vertices']:8d} | {linha['densidade']:5.2f} | "
+                          f"{linha['seed']:4d} | {linha['status']:7s} | {linha.get('tempo_ms', float('nan')):10.3f} |")
+        finally:
+            for processo in em_andamento:
+                processo.terminate()
+                processo.join()
+    return carregar_checkpoint(caminho)
+
+
+def agregar_resultados(linhas: list, densidade: float = None) -> dict:
+    """
+    Agrega as linhas da varredura no formato de `salvar_resultados`.
+
+    Para cada algoritmo e tamanho, usa a mediana entre as sementes das
+    células concluídas; células com timeout ou erro ficam de fora.
+
+    Args:
+        linhas: Linhas de `executar_varredura` ou `carregar_checkpoint`.
+        densidade: Filtra uma densidade (padrão: todas).
+    Returns:
+        Dicionário {algoritmo: [(vértices, tempo mediano em ms, pico de memória em bytes)]}.
+    """
+    grupos = {}
+    for linha in linhas:
+        if linha.get("status") != "ok":
+            continue
+        if densidade is not None and float(linha["densidade"]) != densidade:
+            continue
+        grupos.setdefault((linha["algoritmo"], linha["vertices"]), []).append(linha)
+
+    resultados = {}
+    for (algoritmo, vertices), grupo in sorted(grupos.items()):
+        resultados.setdefault(algoritmo, []).append((
+            vertices,
+            statistics.median(linha["tempo_ms"] for linha in grupo),
+            statistics.median(linha["memoria_pico_bytes"] for linha in grupo),
+        ))
+    return resultados
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Varredura paralela e retomável dos algoritmos de coloração")
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=[10, 15, 20, 25, 50])
+    parser.add_argument("--densidades", type=float, nargs="+", default=[0.4])
+    parser.add_argument("--seeds", type=int, nargs="+", default=[0])
+    parser.add_argument("--algoritmos", nargs="+", default=list(ALGORITMOS), choices=list(ALGORITMOS))
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--timeout", type=float, default=60.0, help="Segundos por célula")
+    parser.add_argument("--saida", default=os.path.join("results", "varredura.jsonl"))
+    parser.add_argument("--repetir-falhas", action="store_true",
+                        help="Executa de novo as células gravadas com timeout ou erro")
+    parser.add_argument("--relatorio", action="store_true",
+                        help="Gera os gráficos de `salvar_resultados` (exige as três séries padrão)")
+    args = parser.parse_args()
+
+    print("| Algoritmo      | Vértices | Dens. | Seed | Status  |    Tempo ms |")
+    print("|----------------|----------|-------|------|---------|-------------|")
+    celulas = gerar_celulas(args.tamanhos, args.densidades, args.seeds, args.algoritmos)
+    linhas = executar_varredura(celulas, args.saida, args.workers, args.timeout, args.repetir_falhas)
+    print(f"\n📄 Resultados gravados em {args.saida}")
+
+    if args.relatorio:
+        from .results import salvar_resultados
+        resultados = agregar_resultados(linhas, args.densidades[0])
+        series = [resultados.get(nome, []) for nome in ("backtracking", "guloso", "guloso_grau")]
+        # Os gráficos comparam as séries ponto a ponto: só entram tamanhos concluídos nas três
+        comuns = set.intersection(*({linha[0] for linha in serie} for serie in series))
+        salvar_resultados(*([linha for linha in serie if linha[0] in comuns] for serie in series))
+
+
+if __name__ == "__main__":
+    main()
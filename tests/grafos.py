@@ -0,0 +1,87 @@
+"""Grafos de teste e verificações por força bruta compartilhados pelos testes."""
+import itertools
+
+
+def grafo_aleatorio(num_vertices: int, densidade: float, rng, partes: int = None) -> list:
+    """Grafo aleatório; com `partes`, só liga vértices de classes (v % partes) diferentes."""
+    grafo = [[] for _ in range(num_vertices)]
+    for v, w in itertools.combinations(range(num_vertices), 2):
+        if (partes is None or v % partes != w % partes) and rng.random() < densidade:
+            grafo[v].append(w)
+            grafo[w].append(v)
+    return grafo
+
+
+def caminho(num_vertices: int, inicio: int = 0) -> list:
+    """Lista de adjacência de um caminho com vértices inicio .. inicio + n - 1."""
+    return [[w for w in (inicio + v - 1, inicio + v + 1) if inicio <= w < inicio + num_vertices]
+            for v in range(num_vertices)]
+
+
+def ciclo(num_vertices: int) -> list:
+    return [[(v + 1) % num_vertices, (v - 1) % num_vertices] for v in range(num_vertices)]
+
+
+def roda(num_raios: int) -> list:
+    """Ciclo de `num_raios` vértices mais um centro ligado a todos."""
+    return [vizinhos + [num_raios] for vizinhos in ciclo(num_raios)] + [list(range(num_raios))]
+
+
+def toro(lado: int) -> list:
+    """Grade toroidal lado x lado: 4-regular, bipartida só com lado par."""
+    return [[(i + di) % lado * lado + (j + dj) % lado for di, dj in ((1, 0), (-1, 0), (0, 1), (0, -1))]
+            for i in range(lado) for j in range(lado)]
+
+
+def mycielski(ordem: int) -> list:
+    """Grafo de Mycielski M_ordem: sem triângulos e com número cromático `ordem` (M4 = Grötzsch)."""
+    grafo = [[1], [0]]
+    for _ in range(ordem - 2):
+        n = len(grafo)
+        novo = [list(vizinhos) for vizinhos in grafo] + [[] for _ in range(n + 1)]
+        for v in range(n):
+            for w in grafo[v]:
+                novo[n + v].append(w)
+                novo[w].append(n + v)
+            novo[n + v].append(2 * n)
+            novo[2 * n].append(n + v)
+        grafo = novo
+    return grafo
+
+
+def uniao_disjunta(a: list, b: list) -> list:
+    return [list(vizinhos) for vizinhos in a] + [[w + len(a) for w in vizinhos] for vizinhos in b]
+
+
+def arestas(grafo) -> list:
+    """Arestas (v, w) com v < w de uma lista de adjacência."""
+    return [(v, w) for v in range(len(grafo)) for w in grafo[v] if v < w]
+
+
+def valida(grafo, cores) -> bool:
+    """Coloração completa e própria: todo vértice tem cor e vizinhos diferem."""
+    return (all(cores[v] is not None and cores[v] != -1 for v in range(len(grafo)))
+            and all(cores[v] != cores[w] for v in range(len(grafo)) for w in grafo[v]))
+
+
+def numero_cromatico(grafo) -> int:
+    """Menor k para o qual `k_coloracao` encontra uma coloração."""
+    return next((k for k in range(1, len(grafo) + 1) if k_coloracao(grafo, k) is not None), 0)
+
+
+def k_coloracao(grafo, k: int) -> list:
+    """Busca exaustiva por uma k-coloração (cores 0 .. k - 1), ou None."""
+    cores = [None] * len(grafo)
+
+    def atribui(v):
+        if v == len(grafo):
+            return True
+        for cor in range(k):
+            if all(cores[w] != cor for w in grafo[v]):
+                cores[v] = cor
+                if atribui(v + 1):
+                    return True
+        cores[v] = None
+        return False
+
+    return list(cores) if atribui(0) else None
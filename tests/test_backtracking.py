@@ -0,0 +1,114 @@
+import random
+import time
+
+import pytest
+
+from src import metrics
+from src.backtracking import anytime_coloring, backtracking_coloring, bitset_backtracking_coloring, exact_coloring
+
+from grafos import caminho, grafo_aleatorio, mycielski, numero_cromatico, uniao_disjunta, valida
+
+
+def test_busca_bitset_sem_limite_de_recursao():
+    grafo = caminho(1500)
+    cores = bitset_backtracking_coloring(grafo, 2)
+    assert cores is not None
+    assert valida(grafo, cores)
+
+
+def test_exact_coloring_grafo_grande():
+    # Caminho de 1500 vértices mais um C5 disjunto: número cromático 3
+    grafo = caminho(1500) + [[1500 + (i + 1) % 5, 1500 + (i - 1) % 5] for i in range(5)]
+    k, cores = exact_coloring(grafo)
+    assert k == 3
+    assert valida(grafo, cores)
+
+
+@pytest.mark.parametrize("nogood_max_bytes", [16 << 20, 0])
+def test_buscas_contra_forca_bruta(nogood_max_bytes):
+    rng = random.Random(3)
+    for _ in range(150):
+        grafo = grafo_aleatorio(rng.randint(1, 7), rng.random(), rng)
+        chi = numero_cromatico(grafo)
+        cores = bitset_backtracking_coloring(grafo, chi, nogood_max_bytes=nogood_max_bytes)
+        assert cores is not None and valida(grafo, cores)
+        if chi > 1:
+            assert bitset_backtracking_coloring(grafo, chi - 1, nogood_max_bytes=nogood_max_bytes) is None
+        resultado = anytime_coloring(grafo, nogood_max_bytes=nogood_max_bytes)
+        assert resultado.num_colors == chi and resultado.optimal
+        assert valida(grafo, resultado.coloring)
+
+
+def test_nogoods_podam_subproblema_repetido():
+    # Parte 3-colorível com muitas colorações, vista primeiro pelo menor domínio,
+    # e um Grötzsch (χ = 4) disjunto: sem nogoods, cada coloração da primeira
+    # parte refaz a prova de que o Grötzsch não admite 3 cores
+    grafo = uniao_disjunta(grafo_aleatorio(12, 0.25, random.Random(2), partes=3), mycielski(4))
+    nos = []
+    for nogood_max_bytes in (16 << 20, 0):
+        with metrics.instrumented() as stats:
+            assert bitset_backtracking_coloring(grafo, 3, nogood_max_bytes=nogood_max_bytes) is None
+        nos.append(stats.nodes)
+    assert nos[0] * 100 < nos[1]
+    resultado = anytime_coloring(grafo)
+    assert resultado.num_colors == 4 and resultado.optimal
+
+
+def test_backtracking_ordem_fixa_contra_forca_bruta():
+    rng = random.Random(8)
+    for _ in range(100):
+        grafo = grafo_aleatorio(rng.randint(1, 7), rng.random(), rng)
+        chi = numero_cromatico(grafo)
+        for k in (chi - 1, chi):
+            resultado = backtracking_coloring(grafo, k, nogood_max_bytes=0)
+            if k < chi:
+                assert resultado is None
+            else:
+                assert resultado is not None and valida(grafo, resultado)
+                assert len(set(resultado)) <= k
+
+
+def test_backtracking_ordem_fixa_busca_uma_vez():
+    # K4 com 3 cores e quebra de simetria: cada vértice só tem uma cor a
+    # tentar, então a busca expande exatamente os vértices 0, 1, 2 e 3
+    grafo = [[w for w in range(4) if w != v] for v in range(4)]
+    with metrics.instrumented() as stats:
+        assert backtracking_coloring(grafo, 3, nogood_max_bytes=0) is None
+    assert stats.nodes == 4
+
+
+def test_anytime_orcamento_de_nos():
+    # Grötzsch generalizado M5: número cromático 5, mas a clique só prova 2
+    grafo = mycielski(5)
+    resultado = anytime_coloring(grafo, node_budget=20)
+    assert resultado.nodes == 21 and not resultado.optimal
+    assert resultado.lower_bound == 2 and resultado.num_colors >= 5
+    assert valida(grafo, resultado.coloring) and max(resultado.coloring) < resultado.num_colors
+
+
+def test_anytime_prazo():
+    grafo = mycielski(6)
+    inicio = time.perf_counter()
+    resultado = anytime_coloring(grafo, time_limit=0.05)
+    assert time.perf_counter() - inicio < 2
+    assert not resultado.optimal and resultado.lower_bound < resultado.num_colors
+    assert valida(grafo, resultado.coloring)
+
+
+def test_anytime_otimo_quando_a_busca_termina():
+    solucoes = []
+    resultado = anytime_coloring(mycielski(5), on_solution=lambda k, cores: solucoes.append(k))
+    assert resultado.optimal and resultado.num_colors == resultado.lower_bound == 5
+    assert solucoes == sorted(set(solucoes), reverse=True) and solucoes[-1] == 5
+    # DSatur já alcança a clique: ótimo sem expandir nós
+    resultado = anytime_coloring(caminho(10))
+    assert resultado.optimal and resultado.nodes == 0 and resultado.num_colors == 2
+
+
+def test_anytime_ganchos_antes_da_busca():
+    grafo = mycielski(5)
+    parado = anytime_coloring(grafo, should_stop=lambda: True)
+    limitado = anytime_coloring(grafo, external_bound=lambda: 2)
+    for resultado in (parado, limitado):
+        assert resultado.nodes == 0 and not resultado.optimal
+        assert valida(grafo, resultado.coloring)
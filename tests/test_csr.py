@@ -0,0 +1,82 @@
+import random
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+from src.csr import CSRBuilder, CSRGraph
+
+from grafos import arestas, grafo_aleatorio
+
+
+def vizinhos(grafo) -> list:
+    return [sorted(grafo[v]) for v in range(len(grafo))]
+
+
+def arrays(grafo: CSRGraph) -> tuple:
+    return list(grafo.offsets), list(grafo.neighbors), list(grafo.weights)
+
+
+@pytest.mark.parametrize("semente", range(5))
+def test_construtores_equivalentes(semente):
+    rng = random.Random(semente)
+    lista = grafo_aleatorio(40, 0.2, rng)
+    triplas = [(v, w, rng.randint(1, 15)) for v, w in arestas(lista)]
+    pelo_construtor = CSRGraph.from_edges(len(lista), triplas)
+    builder = CSRBuilder(len(lista))
+    builder.extend([u for u, _, _ in triplas], [v for _, v, _ in triplas], [w for _, _, w in triplas])
+    u, v, w = (np.array(coluna) for coluna in zip(*triplas))
+    for grafo in (pelo_construtor, builder.build(), CSRGraph.from_edge_arrays(len(lista), u, v, w)):
+        assert len(grafo) == grafo.num_vertices == len(lista)
+        assert grafo.num_edges == len(triplas)
+        assert vizinhos(grafo) == vizinhos(lista)
+        assert [grafo.degree(v) for v in grafo] == [len(vs) for vs in lista]
+        assert sorted(grafo.get_edges()) == sorted(triplas)
+        # Pesos alinhados com os vizinhos, nas duas extremidades
+        pesos = {(min(a, b), max(a, b)): c for a, b, c in triplas}
+        assert all(list(grafo.get_weights(a)) == [pesos[min(a, b), max(a, b)] for b in grafo[a]] for a in grafo)
+    assert vizinhos(CSRGraph.from_adjacency(lista)) == vizinhos(lista)
+    assert CSRGraph.from_adjacency(pelo_construtor) is pelo_construtor
+
+
+def test_from_edge_arrays_dedupe():
+    u = np.array([0, 1, 2, 2, 3, 0])
+    v = np.array([1, 0, 2, 3, 2, 3])
+    grafo = CSRGraph.from_edge_arrays(4, u, v, dedupe=True)
+    assert sorted((a, b) for a, b, _ in grafo.get_edges()) == [(0, 1), (0, 3), (2, 3)]
+    assert CSRGraph.from_edge_arrays(4, u, v).num_edges == 6
+
+
+def test_builder_esvazia_apos_build():
+    builder = CSRBuilder(3)
+    builder.add_edge(0, 1)
+    assert builder.build().num_edges == 1
+    assert builder.build().num_edges == 0
+
+
+@pytest.mark.parametrize("semente", range(3))
+def test_write_into_e_from_buffer(semente):
+    rng = random.Random(semente)
+    lista = grafo_aleatorio(50, 0.15, rng)
+    original = CSRGraph.from_edges(len(lista), [(v, w, rng.randint(1, 15)) for v, w in arestas(lista)])
+    buffer = bytearray(original.nbytes)
+    original.write_into(buffer)
+    copia = CSRGraph.from_buffer(buffer, original.num_vertices, len(original.neighbors))
+    assert arrays(copia) == arrays(original)
+    assert copia.nbytes == original.nbytes
+    # Visões sem cópia: alterar o buffer aparece no grafo
+    copia.weights[0] = 99
+    assert CSRGraph.from_buffer(buffer, original.num_vertices, len(original.neighbors)).weights[0] == 99
+
+
+def test_from_buffer_em_memoria_compartilhada():
+    original = CSRGraph.from_adjacency(grafo_aleatorio(30, 0.3, random.Random(0)))
+    memoria = shared_memory.SharedMemory(create=True, size=original.nbytes)
+    try:
+        original.write_into(memoria.buf)
+        copia = CSRGraph.from_buffer(memoria.buf, original.num_vertices, len(original.neighbors))
+        assert vizinhos(copia) == vizinhos(original)
+        del copia
+    finally:
+        memoria.close()
+        memoria.unlink()
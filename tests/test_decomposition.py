@@ -0,0 +1,114 @@
+import random
+
+import pytest
+
+from src.decomposition import (LARGE_BLOCK_VERTICES, _induced, _merge_blocks, biconnected_components,
+                               decomposed_exact_coloring, extend_coloring, k_colorable, reduce_graph)
+
+from grafos import caminho, k_coloracao, numero_cromatico, toro, uniao_disjunta, valida
+
+
+def blocos_articulados(rng, num_blocos: int) -> list:
+    """
+    Blocos aleatórios de 2 a 4 vértices colados por vértices de articulação,
+    mais um vértice dominado (vizinho de parte de N(v) para algum v).
+    """
+    grafo = [[]]
+
+    def liga(v, w):
+        if w not in grafo[v]:
+            grafo[v].append(w)
+            grafo[w].append(v)
+
+    for _ in range(num_blocos):
+        articulacao = rng.randrange(len(grafo))
+        novos = list(range(len(grafo), len(grafo) + rng.randint(1, 3)))
+        grafo.extend([] for _ in novos)
+        bloco = [articulacao] + novos
+        for v, w in zip(bloco, bloco[1:] + bloco[:1]):
+            if v != w:
+                liga(v, w)
+        for i, v in enumerate(bloco):
+            for w in bloco[i + 1:]:
+                if rng.random() < 0.6:
+                    liga(v, w)
+    dono = rng.randrange(len(grafo))
+    vizinhos = rng.sample(grafo[dono], rng.randint(1, len(grafo[dono])))
+    grafo.append([])
+    for w in vizinhos:
+        liga(len(grafo) - 1, w)
+    return grafo
+
+
+GRAFOS = [blocos_articulados(random.Random(semente), 4) for semente in range(30)]
+
+
+@pytest.mark.parametrize("grafo", GRAFOS)
+@pytest.mark.parametrize("k", [2, 3, 4])
+def test_reduce_graph_e_extend_coloring_contra_forca_bruta(grafo, k):
+    adjacencia, nucleo, removidos = reduce_graph(grafo, k)
+    assert sorted(nucleo + [v for v, _ in removidos]) == list(range(len(grafo)))
+    for v, dominante in removidos:
+        if dominante is not None:
+            assert v not in grafo[dominante]
+    nucleo_local = _induced(adjacencia, nucleo)
+    assert all(len(vizinhos) >= k for vizinhos in nucleo_local)
+    cores_nucleo = k_coloracao(nucleo_local, k)
+    assert (cores_nucleo is not None) == (k_coloracao(grafo, k) is not None)
+    if cores_nucleo is None:
+        return
+    cores = [-1] * len(grafo)
+    for v, cor in zip(nucleo, cores_nucleo):
+        cores[v] = cor
+    extend_coloring(cores, grafo, removidos)
+    assert valida(grafo, cores) and max(cores) < k
+
+
+@pytest.mark.parametrize("semente", range(20))
+def test_merge_blocks_com_cores_permutadas(semente):
+    rng = random.Random(semente)
+    # O vértice dominado pode fundir blocos; o caminho final garante articulações
+    grafo = uniao_disjunta(GRAFOS[semente], caminho(3))
+    grafo[0].append(len(GRAFOS[semente]))
+    grafo[len(GRAFOS[semente])].append(0)
+    blocos = biconnected_components(grafo)
+    assert len(blocos) > 1
+    locais = []
+    for bloco in blocos:
+        local = _induced(grafo, bloco)
+        num_cores = numero_cromatico(local)
+        cores = k_coloracao(local, num_cores)
+        permutacao = list(range(num_cores))
+        rng.shuffle(permutacao)
+        locais.append([permutacao[c] for c in cores])
+    cores = _merge_blocks([-1] * len(grafo), blocos, locais)
+    assert valida(grafo, cores)
+    assert len(set(cores)) == max(len(set(local)) for local in locais)
+
+
+@pytest.mark.parametrize("grafo", GRAFOS)
+def test_decomposed_exact_coloring_contra_forca_bruta(grafo):
+    num_cores, cores = decomposed_exact_coloring(grafo, workers=1)
+    assert num_cores == numero_cromatico(grafo)
+    assert valida(grafo, cores) and max(cores) < num_cores
+
+
+@pytest.mark.parametrize("grafo", GRAFOS[:10])
+def test_k_colorable_contra_forca_bruta(grafo):
+    for k in (2, 3):
+        cores = k_colorable(grafo, k, workers=1)
+        assert (cores is not None) == (k_coloracao(grafo, k) is not None)
+        if cores is not None:
+            assert valida(grafo, cores) and max(cores) < k
+
+
+@pytest.mark.parametrize("lado, k, colorivel", [(24, 2, True), (25, 2, False), (25, 3, True)])
+def test_k_colorable_bloco_grande(lado, k, colorivel):
+    grafo = toro(lado)
+    assert len(grafo) >= LARGE_BLOCK_VERTICES
+    cores = k_colorable(grafo, k, workers=1)
+    if not colorivel:
+        assert cores is None
+        return
+    assert cores is not None and max(cores) < k
+    assert valida(grafo, cores)
@@ -0,0 +1,19 @@
+import pytest
+
+from src.dimacs import read_dimacs
+
+
+def test_read_dimacs(tmp_path):
+    path = tmp_path / "triangulo.col"
+    path.write_text("c triângulo\np edge 3 3\ne 1 2\ne 2 3\ne 3 1\n")
+    graph = read_dimacs(str(path))
+    assert graph.num_vertices == 3
+    assert graph.num_edges == 3
+
+
+@pytest.mark.parametrize("aresta, vertice", [("e 1 5", "5"), ("e 0 2", "0")])
+def test_read_dimacs_vertice_fora_do_cabecalho(tmp_path, aresta, vertice):
+    path = tmp_path / "invalido.col"
+    path.write_text(f"p edge 3 1\n{aresta}\n")
+    with pytest.raises(ValueError, match=rf"invalido\.col: vértice {vertice} fora"):
+        read_dimacs(str(path))
@@ -0,0 +1,99 @@
+import random
+
+import pytest
+
+from grafos import caminho, grafo_aleatorio, valida
+from src.dinamico import DynamicColoring
+
+
+class AdjacenciaContada(list):
+    """Lista de adjacência que conta quantas vezes um vértice foi visitado."""
+
+    def __init__(self, conjuntos):
+        super().__init__(conjuntos)
+        self.visitas = 0
+
+    def __getitem__(self, indice):
+        self.visitas += 1
+        return super().__getitem__(indice)
+
+
+def consistente(dinamico: DynamicColoring) -> bool:
+    """Coloração própria com contagens de vizinhos e tamanhos de classe em dia."""
+    grafo = [sorted(vizinhos) for vizinhos in dinamico.adjacency]
+    contagens = [{} for _ in grafo]
+    for v, vizinhos in enumerate(grafo):
+        for w in vizinhos:
+            cor = dinamico.colors[w]
+            contagens[v][cor] = contagens[v].get(cor, 0) + 1
+    classes = {}
+    for cor in dinamico.colors:
+        classes[cor] = classes.get(cor, 0) + 1
+    return (valida(grafo, dinamico.colors) and dinamico.is_valid()
+            and contagens == dinamico.neighbor_color_counts and classes == dinamico.class_sizes)
+
+
+@pytest.mark.parametrize("semente", range(5))
+def test_valida_apos_insercoes_remocoes_e_compactacao(semente):
+    rng = random.Random(semente)
+    n = 30
+    dinamico = DynamicColoring(grafo_aleatorio(n, 0.1, rng))
+    assert consistente(dinamico)
+    for _ in range(200):
+        u, v = rng.sample(range(n), 2)
+        if v in dinamico.adjacency[u] and rng.random() < 0.4:
+            dinamico.remove_edge(u, v)
+        else:
+            dinamico.add_edge(u, v)
+        assert consistente(dinamico)
+    antes = dinamico.num_colors
+    assert dinamico.compact() == antes - dinamico.num_colors
+    assert consistente(dinamico)
+
+
+def test_add_edge_troca_de_kempe_evita_cor_nova():
+    # x (2) vê u (0) e w (1); z (2) vê p (0) e q (1). Ligar x a z deixa x sem
+    # cor livre, mas u não tem vizinho de cor 1: trocar u para 1 libera a cor 0.
+    x, u, w, z, p, q = range(6)
+    grafo = [[u, w], [x], [x], [p, q], [z], [z]]
+    dinamico = DynamicColoring(grafo, coloring=[2, 0, 1, 2, 0, 1])
+    dinamico.add_edge(x, z)
+    assert consistente(dinamico)
+    assert dinamico.num_colors == 3
+    assert dinamico.colors[x] == 0 and dinamico.colors[u] == 1
+
+
+def test_add_edge_abre_cor_nova_quando_necessario():
+    # Triângulo 0-1-2 e o vértice 3 ligado a 1 e 2 com a cor de 0: a aresta
+    # (0, 3) fecha um K4 e nenhuma troca de Kempe evita a quarta cor.
+    grafo = [[1, 2], [0, 2, 3], [0, 1, 3], [1, 2]]
+    dinamico = DynamicColoring(grafo, coloring=[0, 1, 2, 0])
+    dinamico.add_edge(0, 3)
+    assert consistente(dinamico)
+    assert dinamico.num_colors == 4
+
+
+def test_remove_edge_e_compact_reduzem_cores():
+    grafo = [[w for w in range(4) if w != v] for v in range(4)]
+    dinamico = DynamicColoring(grafo)
+    assert dinamico.num_colors == 4
+    dinamico.remove_edge(0, 1)
+    assert consistente(dinamico)
+    assert dinamico.num_colors == 3
+    # Caminho colorido com quatro cores: a compactação volta a duas
+    dinamico = DynamicColoring(caminho(4), coloring=[0, 1, 2, 3])
+    assert dinamico.compact() == 2
+    assert consistente(dinamico)
+    assert dinamico.num_colors == 2
+
+
+def test_cadeia_de_kempe_limitada():
+    # Caminho longo com cores alternadas: as cadeias {0, 1} cobrem o caminho
+    # inteiro, então o reparo desiste delas depois de `max_chain` vértices.
+    n = 20000
+    dinamico = DynamicColoring(caminho(n), coloring=[v % 2 for v in range(n)])
+    dinamico.adjacency = AdjacenciaContada(dinamico.adjacency)
+    dinamico.add_edge(0, 2)
+    assert dinamico.adjacency.visitas < 1000
+    assert dinamico.num_colors == 3
+    assert consistente(dinamico)
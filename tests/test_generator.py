@@ -0,0 +1,67 @@
+import random
+
+import pytest
+
+from src.generator import (MAX_WEIGHT, EdgeFileWriter, generate_csr_graph, random_graph_edges,
+                           read_edge_file, resolve_rng)
+
+
+def conexo(num_vertices: int, triplas: list) -> bool:
+    vizinhos = [[] for _ in range(num_vertices)]
+    for u, v, _ in triplas:
+        vizinhos[u].append(v)
+        vizinhos[v].append(u)
+    vistos = {0}
+    fila = [0]
+    for v in fila:
+        for w in vizinhos[v]:
+            if w not in vistos:
+                vistos.add(w)
+                fila.append(w)
+    return len(vistos) == num_vertices
+
+
+@pytest.mark.parametrize("n, densidade", [(1, 0.5), (2, 0.0), (50, 0.0), (50, 0.05), (200, 0.3),
+                                          (60, 0.9), (30, 1.0)])
+def test_conexo_sem_repeticoes_nem_lacos(n, densidade):
+    triplas = list(random_graph_edges(n, densidade, seed=n))
+    pares = [(min(u, v), max(u, v)) for u, v, _ in triplas]
+    assert all(u != v and 0 <= u < n and 0 <= v < n for u, v in pares)
+    assert len(set(pares)) == len(pares)
+    assert all(1 <= w <= MAX_WEIGHT for _, _, w in triplas)
+    assert conexo(n, triplas)
+    if densidade == 0:
+        assert len(triplas) == n - 1
+    if densidade == 1:
+        assert len(triplas) == n * (n - 1) // 2
+
+
+def test_reprodutivel_pela_semente():
+    assert list(random_graph_edges(100, 0.1, seed=7)) == list(random_graph_edges(100, 0.1, seed=7))
+    assert list(random_graph_edges(100, 0.1, seed=7)) != list(random_graph_edges(100, 0.1, seed=8))
+    rng = random.Random(7)
+    assert resolve_rng(rng) is rng
+    assert list(random_graph_edges(100, 0.1, rng)) == list(random_graph_edges(100, 0.1, seed=7))
+    a, b = generate_csr_graph(100, 0.1, seed=7), generate_csr_graph(100, 0.1, seed=7)
+    assert list(a.neighbors) == list(b.neighbors) and list(a.weights) == list(b.weights)
+
+
+@pytest.mark.parametrize("densidade", [0.01, 0.1, 0.5])
+def test_numero_de_arestas_proximo_do_esperado(densidade):
+    # Os saltos geométricos escolhem cada par com probabilidade `densidade`
+    n = 400
+    pares = n * (n - 1) // 2
+    extras = len(list(random_graph_edges(n, densidade, seed=1))) - (n - 1)
+    esperado = densidade * (pares - (n - 1))
+    desvio = (pares * densidade * (1 - densidade)) ** 0.5
+    assert abs(extras - esperado) < 5 * desvio
+
+
+def test_arquivo_de_arestas_ida_e_volta(tmp_path):
+    triplas = list(random_graph_edges(300, 0.05, seed=3))
+    caminho = str(tmp_path / "arestas.bin")
+    with EdgeFileWriter(caminho, buffer_edges=100) as writer:
+        for u, v, w in triplas:
+            writer.add_edge(u, v, w)
+    assert writer.num_edges == len(triplas)
+    assert list(read_edge_file(caminho, chunk_edges=77)) == triplas
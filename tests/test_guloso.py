@@ -0,0 +1,26 @@
+import pytest
+
+from src import metrics
+from src.guloso import (colors, dsatur_coloring, greedy_coloring, greedy_coloring_by_degree,
+                        smallest_last_coloring)
+
+# Triângulo 0-1-2 com o vértice 3 pendurado em 2
+GRAFO = [[1, 2], [0, 2], [0, 1, 3], [2]]
+
+
+@pytest.mark.parametrize("colorir, cores_testadas", [
+    # Ordem natural: o vértice 3 só vê a cor 2 e fica com a primeira
+    (lambda grafo: greedy_coloring(grafo, colors), 1 + 2 + 3 + 1),
+    # Os demais colorem 3 depois de 2 (cor 0) e testam duas cores nele
+    (lambda grafo: greedy_coloring_by_degree(grafo, colors), 1 + 2 + 3 + 2),
+    (dsatur_coloring, 1 + 2 + 3 + 2),
+    (smallest_last_coloring, 1 + 2 + 3 + 2),
+])
+def test_contadores_medidos_no_laco(colorir, cores_testadas):
+    with metrics.instrumented() as stats:
+        colorir(GRAFO)
+    assert stats.nodes == 4
+    assert stats.max_depth == 4
+    assert stats.backtracks == 0
+    assert stats.is_safe_calls == sum(len(vizinhos) for vizinhos in GRAFO)
+    assert stats.colors_tried == cores_testadas
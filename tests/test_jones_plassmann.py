@@ -0,0 +1,36 @@
+import random
+
+import numpy as np
+import pytest
+
+from src.csr import CSRGraph
+from src.jones_plassmann import jones_plassmann_coloring
+
+from grafos import grafo_aleatorio, valida
+
+
+def guloso_por_prioridade(grafo, semente) -> list:
+    """Guloso sequencial na ordem decrescente de `grau + U(0, 1)`."""
+    prioridade = [len(vizinhos) for vizinhos in grafo] + np.random.default_rng(semente).random(len(grafo))
+    cores = [-1] * len(grafo)
+    for v in sorted(range(len(grafo)), key=lambda v: -prioridade[v]):
+        usadas = {cores[w] for w in grafo[v]}
+        cores[v] = next(c for c in range(len(grafo)) if c not in usadas)
+    return cores
+
+
+@pytest.mark.parametrize("semente", range(10))
+@pytest.mark.parametrize("densidade", [0.05, 0.3, 0.8])
+def test_valida_e_igual_ao_guloso_na_ordem_de_prioridade(semente, densidade):
+    grafo = grafo_aleatorio(80, densidade, random.Random(semente))
+    cores, num_cores = jones_plassmann_coloring(grafo, seed=semente)
+    assert valida(grafo, cores)
+    assert num_cores == max(cores) + 1 <= max(map(len, grafo)) + 1
+    # Os lotes de máximos locais reproduzem o guloso na ordem de prioridade
+    assert cores == guloso_por_prioridade(grafo, semente)
+    assert jones_plassmann_coloring(CSRGraph.from_adjacency(grafo), seed=semente) == (cores, num_cores)
+
+
+def test_grafo_vazio_e_sem_arestas():
+    assert jones_plassmann_coloring([]) == ([], 0)
+    assert jones_plassmann_coloring([[], [], []], seed=0) == ([0, 0, 0], 1)
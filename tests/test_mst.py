@@ -0,0 +1,85 @@
+import random
+
+import numpy as np
+import pytest
+
+from src.csr import CSRGraph
+from src.generator import generate_csr_graph
+from src.mst import UnionFind, build_mst_adjacency_list, edge_arrays, kruskal, kruskal_arrays, prim_dense
+
+
+def peso_minimo(num_vertices: int, triplas: list) -> tuple:
+    """Prim ingênuo O(n³) como referência: (peso total, número de componentes)."""
+    custo = {}
+    for u, v, w in triplas:
+        for a, b in ((u, v), (v, u)):
+            custo[a, b] = min(custo.get((a, b), w), w)
+    fora = set(range(num_vertices))
+    total = componentes = 0
+    while fora:
+        dentro = {fora.pop()}
+        componentes += 1
+        while True:
+            candidatas = [(c, b) for (a, b), c in custo.items() if a in dentro and b in fora]
+            if not candidatas:
+                break
+            c, b = min(candidatas)
+            total += c
+            dentro.add(b)
+            fora.discard(b)
+    return total, componentes
+
+
+def floresta_geradora(num_vertices: int, arvore: list, triplas: list) -> bool:
+    """Arestas do grafo, sem ciclos e com n - componentes arestas."""
+    existentes = {(min(u, v), max(u, v), w) for u, v, w in triplas}
+    uniao = UnionFind(num_vertices)
+    return (all((min(u, v), max(u, v), w) in existentes for u, v, w in arvore)
+            and all(uniao.union(u, v) for u, v, _ in arvore))
+
+
+@pytest.mark.parametrize("semente", range(4))
+@pytest.mark.parametrize("n, densidade", [(30, 0.05), (40, 0.5), (60, 1.0)])
+def test_peso_igual_a_referencia(n, densidade, semente):
+    grafo = generate_csr_graph(n, densidade, seed=semente)
+    triplas = list(grafo.get_edges())
+    esperado, componentes = peso_minimo(n, triplas)
+    arrays = edge_arrays(grafo)
+    for arvore in (kruskal(grafo), kruskal_arrays(*arrays), prim_dense(*arrays)):
+        assert sum(w for _, _, w in arvore) == esperado
+        assert len(arvore) == n - componentes
+        assert floresta_geradora(n, arvore, triplas)
+
+
+@pytest.mark.parametrize("semente", range(3))
+def test_floresta_em_grafo_desconexo(semente):
+    rng = random.Random(semente)
+    n = 40
+    # Arestas só dentro de cada metade: duas componentes (ou mais)
+    triplas = [(u, v, rng.randint(1, 9)) for u in range(n) for v in range(u + 1, n)
+               if (u < n // 2) == (v < n // 2) and rng.random() < 0.3]
+    grafo = CSRGraph.from_edges(n, triplas)
+    esperado, componentes = peso_minimo(n, triplas)
+    assert componentes >= 2
+    arrays = edge_arrays(grafo)
+    for arvore in (kruskal_arrays(*arrays), prim_dense(*arrays)):
+        assert sum(w for _, _, w in arvore) == esperado and len(arvore) == n - componentes
+        assert floresta_geradora(n, arvore, triplas)
+
+
+def test_contra_networkx():
+    nx = pytest.importorskip("networkx")
+    grafo = generate_csr_graph(300, 0.1, seed=11)
+    referencia = nx.Graph()
+    referencia.add_weighted_edges_from(grafo.get_edges())
+    esperado = nx.minimum_spanning_tree(referencia).size(weight="weight")
+    assert sum(w for _, _, w in kruskal(grafo)) == esperado
+
+
+def test_adjacencia_da_arvore():
+    grafo = generate_csr_graph(25, 0.3, seed=2)
+    arvore = kruskal(grafo)
+    adjacencia = build_mst_adjacency_list(arvore, 25)
+    assert adjacencia.num_edges == 24
+    assert sorted(adjacencia.get_edges()) == sorted((min(u, v), max(u, v), w) for u, v, w in arvore)
+    assert np.all(np.diff(np.frombuffer(adjacencia.offsets, dtype=np.int64)) >= 1)
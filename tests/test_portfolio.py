@@ -0,0 +1,30 @@
+import random
+
+from src.portfolio import portfolio_coloring
+
+from grafos import grafo_aleatorio, mycielski, numero_cromatico, valida
+
+
+def test_portfolio_contra_forca_bruta():
+    rng = random.Random(5)
+    for _ in range(4):
+        grafo = grafo_aleatorio(rng.randint(6, 9), rng.uniform(0.3, 0.7), rng)
+        resultado = portfolio_coloring(grafo, workers=2)
+        assert resultado.optimal
+        assert resultado.num_colors == resultado.lower_bound == numero_cromatico(grafo)
+        assert valida(grafo, resultado.coloring) and max(resultado.coloring) < resultado.num_colors
+
+
+def test_portfolio_prova_otimalidade_alem_da_clique():
+    # M5: clique 2, número cromático 5; a prova exige esgotar a busca
+    resultado = portfolio_coloring(mycielski(5), workers=2)
+    assert resultado.optimal and resultado.num_colors == resultado.lower_bound == 5
+    assert resultado.nodes > 0 and valida(mycielski(5), resultado.coloring)
+
+
+def test_portfolio_com_orcamento_devolve_a_melhor_coloracao():
+    grafo = mycielski(6)
+    resultado = portfolio_coloring(grafo, workers=2, node_budget=50)
+    assert not resultado.optimal and resultado.lower_bound < resultado.num_colors
+    assert 0 < resultado.nodes <= 2 * 51
+    assert valida(grafo, resultado.coloring) and max(resultado.coloring) < resultado.num_colors
@@ -0,0 +1,39 @@
+import random
+
+import numpy as np
+import pytest
+
+from src.guloso import greedy_coloring_by_degree
+from src.jones_plassmann import csr_arrays
+from src.rlf import adjacency_bitsets, rlf_coloring
+
+from grafos import grafo_aleatorio, valida
+
+
+@pytest.mark.parametrize("n", [63, 64, 65, 130, 200])
+def test_adjacency_bitsets(n):
+    grafo = grafo_aleatorio(n, 0.1, random.Random(n))
+    offsets, neighbors, _ = csr_arrays(grafo)
+    linhas = adjacency_bitsets(offsets, neighbors, n)
+    assert linhas.shape == (n, (n + 63) // 64)
+    bits = np.unpackbits(linhas.view(np.uint8), axis=1, bitorder="little")[:, :n]
+    assert [np.flatnonzero(linha).tolist() for linha in bits] == [sorted(vizinhos) for vizinhos in grafo]
+
+
+@pytest.mark.parametrize("semente", range(3))
+@pytest.mark.parametrize("n, densidade", [(10, 0.5), (65, 0.4), (130, 0.1), (200, 0.4)])
+def test_rlf_valida_com_classes_maximais(n, densidade, semente):
+    grafo = grafo_aleatorio(n, densidade, random.Random(semente))
+    cores, num_cores = rlf_coloring(grafo)
+    assert valida(grafo, cores)
+    assert num_cores == max(cores) + 1
+    # Cada classe é um conjunto independente maximal entre os vértices que
+    # sobraram: todo vértice tem vizinho em cada classe anterior à sua
+    for v in range(n):
+        assert {cores[w] for w in grafo[v] if cores[w] < cores[v]} == set(range(cores[v]))
+
+
+def test_rlf_nao_perde_para_o_guloso_por_grau_em_grafo_denso():
+    grafo = grafo_aleatorio(300, 0.4, random.Random(1))
+    guloso = greedy_coloring_by_degree(grafo, range(len(grafo)))
+    assert rlf_coloring(grafo)[1] <= max(guloso) + 1
@@ -0,0 +1,99 @@
+import asyncio
+import itertools
+import random
+import time
+from array import array
+
+from src.servico import (ALGORITMOS_SERVICO, MAGIC, MAX_ARESTAS, REQUISICAO, STATUS_OK, STATUS_PRAZO,
+                         STATUS_SEM_COLORACAO, ServidorColoracao, _resolver, codificar_requisicao,
+                         ler_resposta)
+
+from grafos import arestas, grafo_aleatorio
+
+
+def corpo_completo(num_vertices: int) -> bytes:
+    return array("i", [x for aresta in itertools.combinations(range(num_vertices), 2) for x in aresta]).tobytes()
+
+
+def test_gulosos_sem_limite_de_cores():
+    # K12 precisa de 12 cores, mais que as 10 nomeadas
+    corpo = corpo_completo(12)
+    for nome in ("guloso", "guloso_grau", "dsatur", "menor_ultimo"):
+        status, num_cores, cores = _resolver(ALGORITMOS_SERVICO.index(nome), 12, corpo)
+        assert status == STATUS_OK
+        assert num_cores == 12
+        assert sorted(array("i", cores)) == list(range(12))
+    status, _, _ = _resolver(ALGORITMOS_SERVICO.index("backtracking"), 12, corpo)
+    assert status == STATUS_SEM_COLORACAO
+
+
+def test_quadro_grande_demais_fecha_conexao():
+    async def cenario():
+        servidor = ServidorColoracao(workers=1)
+        socket_servidor = await servidor.iniciar(porta=0)
+        porta = socket_servidor.sockets[0].getsockname()[1]
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", porta)
+            writer.write(codificar_requisicao(1, "dsatur", 3, [(0, 1), (1, 2)]))
+            resposta = await ler_resposta(reader)
+            # Cabeçalho anunciando arestas demais, sem corpo: a conexão é fechada
+            writer.write(REQUISICAO.pack(MAGIC, 0, 0, 0, 2, 0, 3, MAX_ARESTAS + 1))
+            fim = await asyncio.wait_for(reader.read(), 5)
+            writer.close()
+        finally:
+            socket_servidor.close()
+            await servidor.encerrar()
+        return resposta, fim
+
+    resposta, fim = asyncio.run(cenario())
+    assert resposta[:3] == (1, STATUS_OK, 2)
+    assert fim == b""
+
+
+def test_encerrar_nao_espera_conexao_ociosa():
+    async def cenario():
+        servidor = ServidorColoracao(workers=1)
+        socket_servidor = await servidor.iniciar(porta=0)
+        porta = socket_servidor.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", porta)
+        writer.write(codificar_requisicao(1, "guloso", 2, [(0, 1)]))
+        resposta = await ler_resposta(reader)
+        # A conexão continua aberta, sem requisições em andamento
+        socket_servidor.close()
+        inicio = time.perf_counter()
+        await servidor.encerrar(espera=5)
+        duracao = time.perf_counter() - inicio
+        fim = await asyncio.wait_for(reader.read(), 5)
+        writer.close()
+        return resposta, duracao, fim
+
+    resposta, duracao, fim = asyncio.run(cenario())
+    assert resposta[:3] == (1, STATUS_OK, 2)
+    assert duracao < 1
+    assert fim == b""
+
+
+def test_backtracking_recebe_prazo_do_servidor_e_encerrar_espera_a_resposta():
+    # Com 10 cores nomeadas, o backtracking não termina neste grafo em tempo útil
+    grafo = grafo_aleatorio(60, 0.5, random.Random(0))
+
+    async def cenario():
+        servidor = ServidorColoracao(workers=1, prazo_exponencial_ms=300)
+        socket_servidor = await servidor.iniciar(porta=0)
+        porta = socket_servidor.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", porta)
+        writer.write(codificar_requisicao(7, "backtracking", len(grafo), arestas(grafo)))
+        await writer.drain()
+        await asyncio.sleep(0.05)
+        socket_servidor.close()
+        inicio = time.perf_counter()
+        await servidor.encerrar(espera=30)
+        duracao = time.perf_counter() - inicio
+        resposta = await asyncio.wait_for(ler_resposta(reader), 5)
+        writer.close()
+        return resposta, duracao, servidor.estatisticas
+
+    resposta, duracao, estatisticas = asyncio.run(cenario())
+    assert resposta[:2] == (7, STATUS_PRAZO)
+    assert estatisticas["prazo"] == 1
+    assert duracao < 5
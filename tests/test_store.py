@@ -0,0 +1,58 @@
+import os
+
+import pytest
+
+from src.csr import CSRGraph
+from src.generator import generate_csr_graph
+from src.store import HEADER, GraphStore
+
+
+def arrays(grafo: CSRGraph) -> tuple:
+    return list(grafo.offsets), list(grafo.neighbors), list(grafo.weights)
+
+
+def test_save_load_ida_e_volta(tmp_path):
+    store = GraphStore(str(tmp_path))
+    grafo = generate_csr_graph(50, 0.2, seed=3)
+    caminho = store.save((50, 0.2, 3), grafo)
+    assert os.path.getsize(caminho) == HEADER.size + grafo.nbytes
+    lido = store.load((50, 0.2, 3))
+    assert arrays(lido) == arrays(grafo)
+    assert [list(lido[v]) for v in range(len(lido))] == [list(grafo[v]) for v in range(len(grafo))]
+    assert store.load((50, 0.2, 4)) is None
+
+
+def test_get_or_generate_grava_uma_vez(tmp_path):
+    store = GraphStore(str(tmp_path))
+    primeiro = store.get_or_generate(40, 0.1, 7)
+    assert arrays(primeiro) == arrays(generate_csr_graph(40, 0.1, seed=7))
+    caminho = store.path((40, 0.1, 7))
+    os.utime(caminho, (0, 0))
+    assert arrays(store.get_or_generate(40, 0.1, 7)) == arrays(primeiro)
+    # Lido do cache: só a data de uso muda
+    assert len(store.entries()) == 1 and os.path.getmtime(caminho) > 0
+
+
+def test_arquivo_invalido(tmp_path):
+    store = GraphStore(str(tmp_path))
+    with open(store.path(("x",)), "wb") as f:
+        f.write(b"\0" * 64)
+    with pytest.raises(ValueError):
+        store.load(("x",))
+
+
+def test_remove_os_menos_usados(tmp_path):
+    grafo = generate_csr_graph(30, 0.2, seed=1)
+    tamanho = HEADER.size + grafo.nbytes
+    store = GraphStore(str(tmp_path), max_bytes=2 * tamanho)
+    a, b = store.save(("a",), grafo), store.save(("b",), grafo)
+    os.utime(a, (100, 100))
+    os.utime(b, (200, 200))
+    store.load(("a",))  # `a` passa a ser o mais recente
+    c = store.save(("c",), grafo)
+    assert sorted(path for _, _, path in store.entries()) == sorted([a, c])
+    assert store.size() == 2 * tamanho
+    # O arquivo recém-gravado nunca é removido, mesmo maior que o limite
+    store.max_bytes = 0
+    d = store.save(("d",), grafo)
+    assert [path for _, _, path in store.entries()] == [d]
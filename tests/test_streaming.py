@@ -0,0 +1,69 @@
+import random
+
+import numpy as np
+import pytest
+
+from src.csr import CSRBuilder
+from src.generator import EdgeFileWriter, generate_into
+from src.guloso import greedy_coloring
+from src.streaming import (COLOR_BYTES_PER_EDGE, HEADER, SORT_BYTES_PER_EDGE, read_sorted_header,
+                           sort_edge_file, streaming_greedy_coloring)
+
+
+def grava_arestas(path, num_vertices: int, densidade: float, semente: int) -> list:
+    """
+    Grafo aleatório com um vértice ligado a todos, arestas repetidas nos dois
+    sentidos e laços; devolve as triplas gravadas.
+    """
+    rng = random.Random(semente)
+    triplas = list(generate_into(CSRBuilder(num_vertices), num_vertices, densidade, semente).build().get_edges())
+    triplas += [(num_vertices - 1, v, 1) for v in range(num_vertices - 1)]
+    triplas += [(v, u, w) for u, v, w in rng.sample(triplas, len(triplas) // 10)]
+    triplas += [(v, v, 1) for v in rng.sample(range(num_vertices), 5)]
+    rng.shuffle(triplas)
+    with EdgeFileWriter(str(path), buffer_edges=500) as writer:
+        for u, v, w in triplas:
+            writer.add_edge(u, v, w)
+    return triplas
+
+
+@pytest.mark.parametrize("semente", range(3))
+def test_sort_edge_file_ordena_e_deduplica(tmp_path, semente):
+    n = 300
+    triplas = grava_arestas(tmp_path / "arestas.bin", n, 0.05, semente)
+    saida = str(tmp_path / "ordenado.sedg")
+    # Teto mínimo: faixas de 1024 arestas, várias passadas pelos arquivos temporários
+    limite = 8 * n + 1024 * SORT_BYTES_PER_EDGE
+    esperado = sorted({(max(u, v), min(u, v)) for u, v, _ in triplas if u != v})
+    assert sort_edge_file(str(tmp_path / "arestas.bin"), saida, n, limite) == (n, len(esperado))
+    assert read_sorted_header(saida) == (n, len(esperado))
+    pares = np.fromfile(saida, dtype=np.int32, offset=HEADER.size).reshape(-1, 2)
+    assert [tuple(par) for par in pares.tolist()] == esperado
+    # As faixas temporárias são apagadas ao final
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["arestas.bin", "ordenado.sedg"]
+
+
+@pytest.mark.parametrize("semente", range(3))
+@pytest.mark.parametrize("densidade", [0.02, 0.2])
+def test_streaming_igual_ao_guloso(tmp_path, semente, densidade):
+    n = 300
+    triplas = grava_arestas(tmp_path / "arestas.bin", n, densidade, semente)
+    saida = str(tmp_path / "ordenado.sedg")
+    sort_edge_file(str(tmp_path / "arestas.bin"), saida)
+    # Janelas de 1024 arestas: vizinhanças cortadas entre janelas e o vértice
+    # ligado a todos passa pelo caminho vetorizado
+    cores, num_cores = streaming_greedy_coloring(saida, 4 * n + 1024 * COLOR_BYTES_PER_EDGE)
+    builder = CSRBuilder(n)
+    for u, v, w in triplas:
+        if u != v:
+            builder.add_edge(u, v, w)
+    esperado = greedy_coloring(builder.build(), list(range(n)))
+    assert cores.tolist() == esperado
+    assert num_cores == max(esperado) + 1
+
+
+def test_arquivo_ordenado_invalido(tmp_path):
+    caminho = tmp_path / "invalido.sedg"
+    caminho.write_bytes(b"\0" * HEADER.size)
+    with pytest.raises(ValueError):
+        read_sorted_header(str(caminho))
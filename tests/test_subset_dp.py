@@ -0,0 +1,46 @@
+import random
+
+import src.backtracking as backtracking
+import src.subset_dp as subset_dp
+from src.backtracking import exact_coloring
+from src.subset_dp import subset_dp_coloring
+
+from grafos import ciclo, grafo_aleatorio, mycielski, numero_cromatico, roda, valida
+
+
+def test_subset_dp_contra_forca_bruta():
+    rng = random.Random(11)
+    for _ in range(120):
+        grafo = grafo_aleatorio(rng.randint(0, 7), rng.random(), rng)
+        chi = numero_cromatico(grafo)
+        k, cores = subset_dp_coloring(grafo)
+        assert k == chi
+        assert valida(grafo, cores) and max(cores, default=-1) < chi
+        # Com o limite inferior exato a resposta é a mesma
+        assert subset_dp_coloring(grafo, max(chi, 1))[0] == chi
+
+
+def test_exact_coloring_recorre_ao_motor(monkeypatch):
+    # Busca sem orçamento: todo grafo que o DSatur e a clique não resolvem vai ao motor
+    anytime = backtracking.anytime_coloring
+    monkeypatch.setattr(backtracking, "anytime_coloring", lambda grafo, node_budget: anytime(grafo, node_budget=0))
+    chamadas = []
+    motor = subset_dp.subset_dp_coloring
+
+    def contar(grafo, lower):
+        chamadas.append(lower)
+        return motor(grafo, lower)
+
+    monkeypatch.setattr(subset_dp, "subset_dp_coloring", contar)
+    # Número cromático acima da clique: o DSatur sozinho não prova o ótimo
+    for grafo, chi in ((ciclo(5), 3), (ciclo(7), 3), (roda(5), 4), (mycielski(4), 4)):
+        k, cores = exact_coloring(grafo)
+        assert k == chi
+        assert valida(grafo, cores)
+    assert len(chamadas) == 4
+    rng = random.Random(5)
+    for _ in range(80):
+        grafo = grafo_aleatorio(rng.randint(1, 7), rng.random(), rng)
+        k, cores = exact_coloring(grafo)
+        assert k == numero_cromatico(grafo)
+        assert valida(grafo, cores)
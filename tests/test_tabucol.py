@@ -0,0 +1,39 @@
+import random
+
+import pytest
+
+from src.guloso import colors, dsatur_coloring, greedy_coloring
+from src.tabucol import normalize_coloring, tabucol, tabucol_reduce
+
+from grafos import grafo_aleatorio, mycielski, valida
+
+
+@pytest.mark.parametrize("semente", range(8))
+def test_tabucol_reduce_valida_e_nao_piora(semente):
+    grafo = grafo_aleatorio(60, 0.2, random.Random(semente))
+    inicial = greedy_coloring(grafo, colors)
+    cores, num_cores = tabucol_reduce(grafo, inicial, max_iterations=2000, seed=semente)
+    assert valida(grafo, cores)
+    assert num_cores == len(set(cores)) == max(cores) + 1
+    assert num_cores <= len(set(normalize_coloring(inicial)))
+
+
+def test_tabucol_reduce_chega_ao_otimo_em_grafo_bipartido():
+    grafo = grafo_aleatorio(40, 0.3, random.Random(1), partes=2)
+    cores, num_cores = tabucol_reduce(grafo, dsatur_coloring(grafo), max_iterations=2000, seed=0)
+    assert num_cores == 2 and valida(grafo, cores)
+
+
+@pytest.mark.parametrize("semente", range(5))
+def test_tabucol_com_vizinhos_repetidos(semente):
+    # Cada vizinho aparece duas vezes: a matriz de conflitos precisa contar as duas
+    grafo = grafo_aleatorio(30, 0.25, random.Random(semente))
+    k = dsatur_coloring(grafo)[1]
+    repetido = [vizinhos + vizinhos for vizinhos in grafo]
+    cores = tabucol(repetido, k, max_iterations=20_000, seed=semente)
+    assert cores is not None and valida(grafo, cores) and max(cores) < k
+
+
+def test_tabucol_sem_coloracao_devolve_none():
+    # Grötzsch tem número cromático 4
+    assert tabucol(mycielski(4), 3, max_iterations=2000, seed=0) is None